@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent Analysis Cache
+
+Memoizes per-file analysis results on disk, keyed by a hash of the analyzed
+source bytes, so unchanged files and repeated historical blobs are never
+re-parsed. Results are stored as JSON in a single SQLite file under the
+user's cache directory (``$XDG_CACHE_HOME/harmonizer`` or
+``~/.cache/harmonizer``), one subdirectory per analyzed codebase, so analyzing
+a repository neither writes into it nor trusts files shipped with it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Optional, Tuple
+
+CACHE_DIR_NAME = "harmonizer"
+CACHE_FILE_NAME = "analyses.sqlite3"
+
+# Bump when the JSON payload layout changes
+CACHE_FORMAT_VERSION = 2
+
+_analyzer_fingerprint: Optional[str] = None
+
+
+def content_digest(data: bytes) -> str:
+    """Return the cache key for a blob of source bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def analyzer_fingerprint() -> str:
+    """
+    Identify the analyzer code that produced cached results.
+
+    Any edit to the harmonizer package changes a module's size or mtime, which
+    invalidates everything cached by the previous code.
+    """
+    global _analyzer_fingerprint
+    if _analyzer_fingerprint is None:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        h = hashlib.blake2b(str(CACHE_FORMAT_VERSION).encode(), digest_size=16)
+        for name in sorted(os.listdir(package_dir)):
+            if name.endswith(".py"):
+                st = os.stat(os.path.join(package_dir, name))
+                h.update(f"{name}:{st.st_size}:{st.st_mtime_ns};".encode())
+        _analyzer_fingerprint = h.hexdigest()
+    return _analyzer_fingerprint
+
+
+def cache_dir_for(root_dir: str) -> str:
+    """Per-user cache directory for the codebase at root_dir"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = content_digest(os.path.realpath(root_dir).encode("utf-8", "surrogateescape"))
+    return os.path.join(base, CACHE_DIR_NAME, key)
+
+
+def _check_owner(path: str):
+    """Refuse cache files that another user created"""
+    if hasattr(os, "getuid") and os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} is not owned by the current user")
+
+
+class AnalysisCache:
+    """SQLite-backed store of JSON analysis results keyed by (kind, content digest)"""
+
+    def __init__(self, root_dir: str):
+        cache_dir = cache_dir_for(root_dir)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        _check_owner(cache_dir)
+        # Nobody else may add or swap files in the directory
+        os.chmod(cache_dir, 0o700)
+        self.path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        if os.path.exists(self.path):
+            _check_owner(self.path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # WAL with NORMAL sync avoids an fsync per committed result
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses "
+            "(kind TEXT, digest TEXT, payload TEXT, PRIMARY KEY (kind, digest))"
+        )
+        self._invalidate_if_stale()
+
+    def _invalidate_if_stale(self):
+        """Drop all entries written by a different version of the analyzer"""
+        fingerprint = analyzer_fingerprint()
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != fingerprint:
+            with self._conn:
+                self._conn.execute("DELETE FROM analyses")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (fingerprint,),
+                )
+
+    def get(self, kind: str, digest: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (found, value); value is the stored JSON value, and may legitimately
+            be None when found is True
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM analyses WHERE kind = ? AND digest = ?", (kind, digest)
+            ).fetchone()
+        if row is None:
+            return False, None
+        try:
+            return True, json.loads(row[0])
+        except ValueError:
+            return False, None
+
+    def put(self, kind: str, digest: str, value: Any):
+        """
+        Store a JSON-serializable result, replacing any previous entry for the same content.
+
+        Writes accumulate in one open transaction until commit(), so a full run
+        costs a single commit rather than one per analyzed file. The cache is
+        best-effort: if another process holds the database, the write is dropped.
+        """
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO analyses (kind, digest, payload) VALUES (?, ?, ?)",
+                    (kind, digest, payload),
+                )
+            except sqlite3.Error:
+                self._conn.rollback()
+
+    def commit(self):
+        """Persist all results stored since the last commit"""
+        with self._lock:
+            try:
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+
+    def close(self):
+        self.commit()
+        with self._lock:
+            self._conn.close()
@@ -16,9 +16,21 @@ New in v1.1:
 
 import ast
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
 
+@lru_cache(maxsize=64)
+def parse_source(source: str) -> ast.Module:
+    """
+    ast.parse, memoized on the exact source text.
+
+    A file read by more than one component in a run (dependency graph, function
+    analysis) is parsed once. The tree is shared, so callers must not modify it.
+    """
+    return ast.parse(source)
+
+
 class AST_Semantic_Parser(ast.NodeVisitor):
     """
     A "Rosetta Stone" that translates Python AST nodes into
@@ -36,7 +48,7 @@ class AST_Semantic_Parser(ast.NodeVisitor):
         Initializes the parser with the known vocabulary from the DIVE-V2 engine
         to improve mapping accuracy.
         """
-        self.known_vocabulary = vocabulary
+        self.known_vocabulary = frozenset(vocabulary)
 
         self.intent_keyword_map = {
             # WISDOM (Information, Truth, State Checking)
@@ -98,13 +110,23 @@ class AST_Semantic_Parser(ast.NodeVisitor):
 
         self._node_map: Dict[ast.AST, str] = {}
         self._concepts_found: Set[str] = set()
+        # Word -> concept memo; valid while the vocabulary and keyword map are unchanged
+        self._concept_cache: Dict[str, Optional[str]] = {}
 
     def _split_snake_case(self, name: str) -> List[str]:
         """Splits 'get_user_by_id' into ['get', 'user', 'by', 'id']"""
         return name.split("_")
 
     def _map_word_to_concept(self, word: str) -> Optional[str]:
-        """Finds the base concept for a given word."""
+        """Finds the base concept for a given word, memoized per word."""
+        try:
+            return self._concept_cache[word]
+        except KeyError:
+            concept = self._concept_cache[word] = self._lookup_concept(word)
+            return concept
+
+    def _lookup_concept(self, word: str) -> Optional[str]:
+        """Uncached word lookup: exact keyword, known vocabulary, then keyword prefix."""
         word_lower = word.lower()
         if word_lower in self.intent_keyword_map:
             return self.intent_keyword_map[word_lower]
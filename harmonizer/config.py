@@ -23,6 +23,35 @@ try:
 except ImportError:
     yaml = None
 
+from harmonizer.stat_memo import memoize_on_stat
+
+
+_YAML_FILENAMES = (
+    ".harmonizer.yml",
+    ".harmonizer.yaml",
+    "harmonizer.yml",
+    "harmonizer.yaml",
+)
+
+
+@memoize_on_stat(maxsize=1024)
+def _config_file_in(dir_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Config file directly inside a directory, memoized in-process on its stat signature.
+
+    Adding or removing an entry bumps the directory's mtime, so a repeated lookup
+    costs one stat per level instead of five existence probes.
+    """
+    for filename in _YAML_FILENAMES:
+        candidate = os.path.join(dir_path, filename)
+        if os.path.exists(candidate) and yaml:
+            return candidate, "yaml"
+
+    toml_path = os.path.join(dir_path, "pyproject.toml")
+    if os.path.exists(toml_path) and tomli:
+        return toml_path, "toml"
+    return None, None
+
 
 @dataclass
 class HarmonizerConfig:
@@ -54,12 +83,7 @@ class HarmonizerConfig:
 
 
 class ConfigLoader:
-    _YAML_FILENAMES = (
-        ".harmonizer.yml",
-        ".harmonizer.yaml",
-        "harmonizer.yml",
-        "harmonizer.yaml",
-    )
+    _YAML_FILENAMES = _YAML_FILENAMES
 
     @staticmethod
     def load(target_dir: str = ".", search_parents: bool = False) -> HarmonizerConfig:
@@ -135,14 +159,9 @@ class ConfigLoader:
     ) -> Tuple[Optional[str], Optional[str]]:
         current_dir = os.path.abspath(start_dir)
         while True:
-            for filename in ConfigLoader._YAML_FILENAMES:
-                candidate = os.path.join(current_dir, filename)
-                if os.path.exists(candidate) and yaml:
-                    return candidate, "yaml"
-
-            toml_path = os.path.join(current_dir, "pyproject.toml")
-            if os.path.exists(toml_path) and tomli:
-                return toml_path, "toml"
+            config_path, config_type = _config_file_in(current_dir)
+            if config_path:
+                return config_path, config_type
 
             if not search_parents:
                 break
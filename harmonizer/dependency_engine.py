@@ -8,6 +8,8 @@ import os
 from dataclasses import dataclass
 from typing import Dict, List, Set
 
+from .ast_semantic_parser import parse_source
+
 
 @dataclass
 class DependencyNode:
@@ -46,7 +48,7 @@ class DependencyEngine:
             abs_path = os.path.join(self.codebase_path, rel_path)
             try:
                 with open(abs_path, "r", encoding="utf-8") as f:
-                    tree = ast.parse(f.read())
+                    tree = parse_source(f.read())
 
                 for stmt in ast.walk(tree):
                     if isinstance(stmt, (ast.Import, ast.ImportFrom)):
@@ -9,8 +9,9 @@ Enhanced with LJPW Mathematical Baselines for objective, empirically-validated s
 
 import math
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
 # Import LJPW baselines for enhanced analysis
@@ -475,12 +476,26 @@ class SemanticAnalyzer:
     def __init__(self, vocab_manager: VocabularyManager, anchor_point: Coordinates):
         self.vocab = vocab_manager
         self.ANCHOR_POINT = anchor_point
+        # Functions repeat the same handful of concept lists; bounded for long runs
+        self._cluster_cache = lru_cache(maxsize=4096)(self._analyze_cluster_key)
 
     def analyze_concept_cluster(self, concepts: List[str]) -> SemanticResult:
-        """Optimized cluster analysis"""
+        """Optimized cluster analysis with caching"""
         if not concepts:
             return self._empty_result()
 
+        # Each caller gets its own copy, so changing a result cannot corrupt the cache
+        result = self._cluster_cache(tuple(concepts))
+        if result.distances is None:
+            return replace(result)
+        return replace(result, distances=list(result.distances))
+
+    def _analyze_cluster_key(self, concepts: Tuple[str, ...]) -> SemanticResult:
+        """Hashable-key entry point for the cluster cache"""
+        return self._analyze_uncached_cluster(list(concepts))
+
+    def _analyze_uncached_cluster(self, concepts: List[str]) -> SemanticResult:
+        """Cluster analysis for a concept list not yet in the cache"""
         coords_list = []
         total_concepts = 0
 
@@ -534,11 +549,9 @@ class SemanticAnalyzer:
         # Calculate LJPW baseline metrics
         L, J, P, W = centroid.love, centroid.justice, centroid.power, centroid.wisdom
         distance_from_ne = LJPWBaselines.distance_from_natural_equilibrium(L, J, P, W)
-        composite = LJPWBaselines.composite_score(L, J, P, W)
-        harmonic = LJPWBaselines.harmonic_mean(L, J, P, W)
-        geometric = LJPWBaselines.geometric_mean(L, J, P, W)
-        coupling_sum = LJPWBaselines.coupling_aware_sum(L, J, P, W)
-        harmony_idx = LJPWBaselines.harmony_index(L, J, P, W)
+        harmonic, geometric, coupling_sum, harmony_idx, composite = LJPWBaselines.core_metrics(
+            L, J, P, W
+        )
 
         return SemanticResult(
             coordinates=centroid,
@@ -6,22 +6,59 @@ Maps files to LJPW space, finds natural clusters, detects architectural smells,
 generates complexity heatmaps, and provides refactoring recommendations.
 """
 
+import fnmatch
+import heapq
 import os
+import queue
+import re
+import sqlite3
 import subprocess
+import sys
+import threading
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
-from statistics import mean
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
+from statistics import fmean, mean
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
+
+from harmonizer import parallel
+from harmonizer.analysis_cache import AnalysisCache, content_digest
 from harmonizer.config import ConfigLoader
-from harmonizer.ljpw_baselines import DynamicLJPWv4, LJPWBaselines
+from harmonizer.ljpw_baselines import DynamicLJPWv4, LJPWBaselines, ReferencePoints
 from harmonizer.main import PythonCodeHarmonizer
+from harmonizer.stat_memo import memoize_on_stat
+
+# Report line templates. %-formatting is done in C, which beats per-field
+# f-string __format__ dispatch when rendering rows for thousands of files.
+_CLUSTER_FILE_LINE = "     - %-40s (%2d funcs, disharmony: %.2f)"
+_OUTLIER_LINE = "     - %-40s L=%.2f J=%.2f P=%.2f W=%.2f"
+_SMELL_LINES = "  • %s: %s\n    %s\n    → %s"
+_HEATMAP_DIR_LINE = "  %s (%.2f)"
+_HEATMAP_FILE_LINE = "    %-30s %s (%.2f)"
+
+_NATURAL_EQUILIBRIUM = np.array(ReferencePoints.NATURAL_EQUILIBRIUM, dtype=np.float64)
+
+# Newest commits sampled for each file's semantic drift
+_HISTORY_SAMPLE_COMMITS = 10
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class FileAnalysis:
-    """Semantic analysis of a single file"""
+    """
+    Semantic analysis of a single file.
+
+    Frozen: the analysis table and visualization data are memoized against these
+    instances, so a changed result must be a new object (see dataclasses.replace).
+    """
 
     path: str
     coordinates: Tuple[float, float, float, float]  # (L, J, P, W)
@@ -34,7 +71,7 @@ class FileAnalysis:
     semantic_density: float = 0.0  # Action per Line of Code
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ArchitecturalSmell:
     """Detected architectural problem"""
 
@@ -46,7 +83,7 @@ class ArchitecturalSmell:
     recommendation: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RefactoringOpportunity:
     """Suggested refactoring"""
 
@@ -56,9 +93,17 @@ class RefactoringOpportunity:
     impact_score: float  # 0-1 score
     description: str
     suggested_actions: List[str] = field(default_factory=list)
+    # (str.format template, args) pairs rendered into suggested_actions when none are given
+    action_templates: List[Tuple[str, tuple]] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.suggested_actions and self.action_templates:
+            self.suggested_actions = [
+                template.format(*args) for template, args in self.action_templates
+            ]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GitCommitSnapshot:
     """Semantic coordinates at a specific commit"""
 
@@ -69,7 +114,7 @@ class GitCommitSnapshot:
     disharmony: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionGenealogy:
     """Evolution of a function over time"""
 
@@ -81,7 +126,7 @@ class FunctionGenealogy:
     major_changes: List[Tuple[str, str, float]] = field(default_factory=list)  # (hash, date, drift)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SemanticDrift:
     """Measure of semantic drift over time"""
 
@@ -95,7 +140,7 @@ class SemanticDrift:
     stability_score: float = 1.0  # 1.0 = stable, 0.0 = highly volatile
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ArchitectureDoc:
     """Documented architecture vs reality"""
 
@@ -107,7 +152,7 @@ class ArchitectureDoc:
     discrepancies: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ArchitecturalDebt:
     """Estimated architectural debt"""
 
@@ -120,12 +165,584 @@ class ArchitecturalDebt:
     description: str
 
 
+_DIMENSION_NAMES = ("Love", "Justice", "Power", "Wisdom")
+_DIMENSION_INDEX = {name: i for i, name in enumerate(_DIMENSION_NAMES)}
+# Per-dimension display glyphs, indexed like _DIMENSION_NAMES
+_DIMENSION_SYMBOLS = ("♥", "⚖", "⚡", "◆")
+_DIMENSION_ICONS = ("💛", "⚖️", "⚡", "📚")
+_DIMENSION_COLOR_CODES = (
+    "#FFD700",  # Gold
+    "#4169E1",  # Royal Blue
+    "#DC143C",  # Crimson
+    "#32CD32",  # Lime Green
+)
+_DIMENSION_COLORS = dict(zip(_DIMENSION_NAMES, _DIMENSION_COLOR_CODES))
+
+
+def _summarize_coordinates(
+    flat_coords: List[float], all_disharmony: List[float]
+) -> Tuple[Tuple[float, float, float, float], float, float, float, float, str]:
+    """
+    Reduce per-function coordinates and disharmony scores to file-level statistics.
+
+    Averages use statistics.mean, which rounds the exact average once, so values
+    next to a smell threshold do not flip with floating-point summation order.
+
+    Args:
+        flat_coords: L, J, P, W of each function, concatenated
+        all_disharmony: disharmony score of each function
+
+    Returns:
+        (avg_coords, avg_disharmony, max_disharmony, min_disharmony,
+        dimension_spread, dominant_dimension)
+    """
+    # Strided slices pick one dimension out of the flat L, J, P, W sequence
+    avg_l, avg_j, avg_p, avg_w = avg_coords = tuple(mean(flat_coords[i::4]) for i in range(4))
+
+    # Plain comparisons over the four averages beat three NumPy reductions' call
+    # overhead; strict > keeps the first maximum, as max() over L, J, P, W does
+    dominant_idx, highest_dim = 0, avg_l
+    if avg_j > highest_dim:
+        dominant_idx, highest_dim = 1, avg_j
+    if avg_p > highest_dim:
+        dominant_idx, highest_dim = 2, avg_p
+    if avg_w > highest_dim:
+        dominant_idx, highest_dim = 3, avg_w
+    dominant = _DIMENSION_NAMES[dominant_idx]
+    spread = highest_dim - min(avg_coords)
+
+    if all_disharmony:
+        avg_dis = mean(all_disharmony)
+        highest = max(all_disharmony)
+        lowest = min(all_disharmony)
+    else:
+        avg_dis = highest = lowest = 0
+
+    return avg_coords, avg_dis, highest, lowest, spread, dominant
+
+
+@lru_cache(maxsize=4096)
+def _parse_commit_date(commit_date_str: str) -> datetime:
+    """Parse a git %ai date; every file's history revisits the same commits"""
+    return datetime.fromisoformat(commit_date_str.replace(" ", "T"))
+
+
+@memoize_on_stat(maxsize=65536)
+def _file_digest(file_path: str) -> str:
+    """
+    Content digest of a file, memoized in-process on (path, mtime, size).
+
+    Repeated mappers in one process (tests, watch mode) then skip re-reading and
+    re-hashing unchanged files.
+    """
+    with open(file_path, "rb") as f:
+        return content_digest(f.read())
+
+
+# Debt labels indexed by (High Disharmony, God File, Semantic Confusion) bit flags
+_DEBT_TYPES = tuple(
+    " + ".join(
+        label
+        for bit, label in ((4, "High Disharmony"), (2, "God File"), (1, "Semantic Confusion"))
+        if code & bit
+    )
+    for code in range(8)
+)
+# Priority is the number of thresholds the debt score exceeds
+_DEBT_PRIORITY_THRESHOLDS = np.array([0.4, 0.6, 0.8])
+_DEBT_PRIORITIES = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+_DEBT_PRIORITY_INDEX = {name: i for i, name in enumerate(_DEBT_PRIORITIES)}
+
+# Prebuilt report bars; bars are sliced from these instead of built by repetition
+_BAR_WIDTH = 50
+_FULL_BAR = "█" * _BAR_WIDTH
+_EMPTY_BAR = "░" * _BAR_WIDTH
+_COST_BAR = "▓" * _BAR_WIDTH
+
+
+def _bar(filled: int, width: int) -> str:
+    """Same as "█" * filled + "░" * (width - filled)"""
+    if 0 <= filled <= width <= _BAR_WIDTH:
+        empty = width - filled
+        return _FULL_BAR[:filled] + _EMPTY_BAR[:empty]
+    return "█" * filled + "░" * (width - filled)
+
+
+# File cards of the HTML visualization, filled by _html_file_card()
+_HTML_CLUSTER_CARD = (
+    "\n"
+    "                    <div class='file-card {dim_class}'>\n"
+    "                        <strong>{path}</strong><br>\n"
+    "                        <span class='coords'>"
+    "L:{L:.2f} J:{J:.2f} P:{P:.2f} W:{W:.2f}</span><br>\n"
+    "                        <span class='disharmony'>Disharmony: {disharmony:.2f}</span>"
+    " | Functions: {function_count}\n"
+    "                    </div>\n"
+    "                    "
+)
+_HTML_FILE_CARD = (
+    "\n"
+    "            <div class='file-card {dim_class}'>\n"
+    "                <strong>{path}</strong><br>\n"
+    "                <span class='coords'>"
+    "L:{L:.2f} J:{J:.2f} P:{P:.2f} W:{W:.2f}</span><br>\n"
+    "                <span class='disharmony'>Disharmony: {disharmony:.2f}</span>"
+    " | Functions: {function_count} | Dominant: {dominant}\n"
+    "            </div>\n"
+    "            "
+)
+
+
+def _html_file_card(template: str, dim_class: str, file_data: Dict) -> str:
+    return template.format(dim_class=dim_class, **file_data["coordinates"], **file_data)
+
+
+def _read_lowercased_text(path: str) -> str:
+    """
+    Read a text file lowercased, with universal newlines.
+
+    ASCII files (the common case for docs) are lowercased as bytes and decoded
+    in one step; anything else goes through the full Unicode lower().
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if raw.isascii():
+        return raw.lower().decode("ascii")
+    return raw.decode("utf-8").lower()
+
+
+# Documented-purpose phrases, matched once per document. Each is a lookahead so
+# overlapping phrases are all seen, exactly as a per-component search would see them.
+_PURPOSE_TAIL_RE = re.compile(
+    r"(?<=\S)(?=\s+(?:handles|manages|provides|implements|is responsible for)\s+([^.]+))",
+    re.IGNORECASE,
+)
+_BACKTICK_PURPOSE_RE = re.compile(r"(?=`([^`]*)`[:\s]+([^.]+))")
+_PLAIN_COMPONENT_NAME = re.compile(r"[a-z0-9_]+")
+_DOC_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+# Keywords for each dimension, in Love, Justice, Power, Wisdom order
+_DOC_KEYWORDS = (
+    ("connect", "integrate", "communicate", "coordinate", "collaborate", "interface"),
+    ("validate", "verify", "check", "ensure", "enforce", "correct"),
+    ("create", "delete", "modify", "update", "execute", "control", "manage"),
+    ("analyze", "compute", "calculate", "process", "retrieve", "query", "understand"),
+)
+_DOC_KEYWORD_DIMENSION = {kw: dim for dim, kws in enumerate(_DOC_KEYWORDS) for kw in kws}
+# One scan for every keyword; the lookahead also reports keywords that overlap
+# (e.g. "execute" + "ensure" in "executensure"), as separate substring tests do
+_DOC_KEYWORD_RE = re.compile("(?=(%s))" % "|".join(_DOC_KEYWORD_DIMENSION))
+
+
+@lru_cache(maxsize=1024)
+def _component_purpose_patterns(name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Per-component purpose patterns, for names the document index cannot look up"""
+    return (
+        re.compile(
+            rf"{name}\s+(?:handles|manages|provides|implements|is responsible for)\s+([^.]+)",
+            re.IGNORECASE,
+        ),
+        re.compile(rf"`{name}`[:\s]+([^.]+)", re.IGNORECASE),
+    )
+
+
+class _DocPurposeIndex:
+    """
+    Component mentions and purpose phrases of a lowercased document, indexed in one pass.
+
+    find() returns the same text as searching the document for
+    "<name> handles|manages|... <purpose>" and then "`<name>`: <purpose>",
+    without rescanning the document with two fresh patterns per component.
+    """
+
+    __slots__ = ("doc", "tails", "backticked", "words", "vocabulary")
+
+    def __init__(self, doc: str):
+        self.doc = doc
+        # A plain name occurs in the document iff it occurs inside one of its
+        # maximal [a-z0-9_] runs, so mentions() can search the distinct runs
+        # instead of rescanning the whole document for every component
+        self.words = set(_DOC_WORD_RE.findall(doc))
+        self.vocabulary = "\n".join(self.words)
+        # End offset of a would-be component name -> purpose following it
+        self.tails = {m.start(): m.group(1) for m in _PURPOSE_TAIL_RE.finditer(doc)}
+        self.backticked: Dict[str, str] = {}
+        for m in _BACKTICK_PURPOSE_RE.finditer(doc):
+            self.backticked.setdefault(m.group(1), m.group(2))
+
+    def mentions(self, key: str) -> bool:
+        """True if the lowercased component name appears anywhere in the document"""
+        if key in self.words:
+            return True
+        if _PLAIN_COMPONENT_NAME.fullmatch(key):
+            return key in self.vocabulary
+        return key in self.doc
+
+    def find(self, name: str, key: Optional[str] = None) -> Optional[str]:
+        """Raw documented purpose of a component (key: name.lower(), if known), or None"""
+        if key is None:
+            key = name.lower()
+        if not _PLAIN_COMPONENT_NAME.fullmatch(key):
+            for pattern in _component_purpose_patterns(name):
+                match = pattern.search(self.doc)
+                if match:
+                    return match.group(1)
+            return None
+
+        doc, tails = self.doc, self.tails
+        pos = doc.find(key)
+        while pos != -1:
+            purpose = tails.get(pos + len(key))
+            if purpose is not None:
+                return purpose
+            pos = doc.find(key, pos + 1)
+        return self.backticked.get(key)
+
+
+def _make_snapshot(
+    commit_hash: str,
+    commit_date_str: str,
+    author: str,
+    summary: Tuple[Tuple[float, float, float, float], float],
+) -> GitCommitSnapshot:
+    avg_coords, avg_disharmony = summary
+    return GitCommitSnapshot(
+        commit_hash=commit_hash[:8],
+        commit_date=_parse_commit_date(commit_date_str),
+        author=author,
+        coordinates=avg_coords,
+        disharmony=avg_disharmony,
+    )
+
+
+def _compile_ignore_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Fuse glob patterns into one regex, equivalent to any(fnmatch.fnmatch(name, p)).
+
+    Callers must pass names through os.path.normcase, as fnmatch.fnmatch does.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns))
+
+
+def _summarize_function_results(
+    results: Dict,
+) -> Optional[Tuple[Tuple[float, float, float, float], float, float, float, float, str]]:
+    """
+    Gather every function's execution coordinates and score in a single pass.
+
+    Coordinates go into one flat list rather than a tuple per function, so the
+    whole file is reduced by _summarize_coordinates without intermediate lists.
+
+    Returns:
+        _summarize_coordinates() output, or None if no function has coordinates
+    """
+    flat_coords = []
+    all_disharmony = []
+    extend = flat_coords.extend
+    append = all_disharmony.append
+
+    for data in results.values():
+        execution_result = data.get("ice_result", {}).get("ice_components", {}).get("execution")
+        if execution_result:
+            coords = execution_result.coordinates
+            extend((coords.love, coords.justice, coords.power, coords.wisdom))
+        append(data.get("score", 0))
+
+    if not flat_coords:
+        return None
+    return _summarize_coordinates(flat_coords, all_disharmony)
+
+
+def _build_file_analysis(file_path: str, results: Dict) -> Optional[FileAnalysis]:
+    """Condense per-function harmonizer results into a FileAnalysis"""
+    summary = _summarize_function_results(results)
+    if summary is None:
+        return None
+
+    (
+        avg_coords,
+        avg_disharmony,
+        max_disharmony,
+        min_disharmony,
+        dimension_spread,
+        dominant,
+    ) = summary
+    avg_p = avg_coords[2]
+
+    # Calculate Semantic Density (Power / LOC)
+    # Note: We don't have exact LOC here, but we can estimate from function count * avg function size
+    # Or better, assume 'results' contains LOC info if available.
+    # For now, we'll use a proxy: Power Score / Function Count
+    # Ideally, we'd want raw Power keywords count.
+
+    # Let's look at how we can get raw counts.
+    # The 'results' dict contains 'ice_result' -> 'ice_components' -> 'execution' -> 'coordinates'
+    # It doesn't seem to expose raw keyword counts directly.
+    # However, 'avg_p' is the average Power score (0-1).
+    # Semantic Density = Power Intensity.
+
+    semantic_density = avg_p  # Using avg_p as a proxy for density for now
+
+    return FileAnalysis(
+        path=file_path,
+        coordinates=avg_coords,
+        function_count=len(results),
+        avg_disharmony=avg_disharmony,
+        max_disharmony=max_disharmony,
+        min_disharmony=min_disharmony,
+        dominant_dimension=dominant,
+        dimension_spread=dimension_spread,
+        semantic_density=semantic_density,
+    )
+
+
+def _analysis_to_json(analysis: Optional[FileAnalysis]) -> Optional[Dict]:
+    """FileAnalysis fields as a JSON-serializable dict for the analysis cache"""
+    if analysis is None:
+        return None
+    fields = asdict(analysis)
+    del fields["path"]  # Identical content may live at several paths
+    return fields
+
+
+def _analysis_from_json(fields: Dict, file_path: str) -> FileAnalysis:
+    """Rebuild a cached FileAnalysis for file_path; a malformed entry raises TypeError or KeyError"""
+    return FileAnalysis(path=file_path, **{**fields, "coordinates": tuple(fields["coordinates"])})
+
+
+def _history_summary_from_json(
+    summary: Optional[list],
+) -> Optional[Tuple[Tuple[float, float, float, float], float]]:
+    """Restore the tuples of a cached _summarize_history_results() value"""
+    if summary is None:
+        return None
+    coords, disharmony = summary
+    return tuple(coords), disharmony
+
+
+def _analyze_file_worker(file_path: str) -> Tuple[Optional[FileAnalysis], Optional[str]]:
+    """
+    Process-pool entry point for analyzing a single file.
+
+    Errors are returned rather than raised so one bad file does not abort the
+    remaining results of ``Executor.map``.
+
+    Returns:
+        (analysis, error message)
+    """
+    try:
+        results = parallel.worker_harmonizer().analyze_file(file_path)
+        return _build_file_analysis(file_path, results), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _summarize_history_results(
+    results: Dict,
+) -> Optional[Tuple[Tuple[float, float, float, float], float]]:
+    """Average coordinates and disharmony of one historical version of a file"""
+    summary = _summarize_function_results(results)
+    return None if summary is None else summary[:2]
+
+
+def _summarize_source_worker(
+    source: str, rel_file_path: str
+) -> Tuple[Optional[Tuple[Tuple[float, float, float, float], float]], Optional[str]]:
+    """
+    Process-pool entry point for summarizing a historical version of a file.
+
+    Returns:
+        (summary, error message)
+    """
+    try:
+        results = parallel.worker_harmonizer().analyze_source(source, virtual_path=rel_file_path)
+        return _summarize_history_results(results), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _top_k_stable(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest values in descending order, earlier index first on ties.
+
+    Same result as sorted(range(n), key=values.__getitem__, reverse=True)[:k], but
+    O(n): a partition finds the k-th largest value and only candidates at or above
+    it are sorted.
+    """
+    n = len(values)
+    if n > k:
+        kth = np.partition(values, n - k)[n - k]
+        candidates = np.flatnonzero(values >= kth)
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-values[candidates], kind="stable")][:k]
+
+
+class _AnalysisTable:
+    """
+    Column-wise (structure-of-arrays) view of ``file_analyses`` for vectorized passes.
+
+    ``file_analyses`` stays the source of truth; the table is rebuilt whenever
+    it no longer mirrors the dict (e.g. entries injected or replaced directly).
+    """
+
+    __slots__ = (
+        "paths",
+        "analyses",
+        "coordinates",
+        "function_counts",
+        "avg_disharmony",
+        "spread",
+        "density",
+        "dominant",
+    )
+
+    def __init__(self, file_analyses: Dict[str, FileAnalysis]):
+        self.paths = list(file_analyses)
+        self.analyses = list(file_analyses.values())
+        analyses = self.analyses
+        # Full-precision (N, 4) coordinates; smell thresholds and grid cells must
+        # decide exactly as they would on the per-file tuples
+        self.coordinates = np.array([a.coordinates for a in analyses], dtype=np.float64).reshape(
+            -1, 4
+        )
+        self.function_counts = np.array([a.function_count for a in analyses], dtype=np.int64)
+        self.avg_disharmony = np.array([a.avg_disharmony for a in analyses], dtype=np.float64)
+        self.spread = np.array([a.dimension_spread for a in analyses], dtype=np.float64)
+        self.density = np.array([a.semantic_density for a in analyses], dtype=np.float64)
+        # Index into _DIMENSION_NAMES, taken from the full-precision analysis
+        self.dominant = np.array(
+            [_DIMENSION_INDEX[a.dominant_dimension] for a in analyses], dtype=np.int64
+        )
+
+    def dimension_order(self) -> List[int]:
+        """Dominance codes present, in order of each dimension's first file"""
+        codes, first_seen = np.unique(self.dominant, return_index=True)
+        return codes[np.argsort(first_seen)].tolist()
+
+    def dimension_groups(self) -> List[Tuple[int, np.ndarray]]:
+        """
+        (dominance code, ascending row indices) per dimension present, in order of
+        each dimension's first file; one stable sort instead of a scan per dimension.
+        """
+        if not len(self.dominant):
+            return []
+        order = np.argsort(self.dominant, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(self.dominant[order])) + 1)
+        groups.sort(key=itemgetter(0))
+        return [(int(self.dominant[rows[0]]), rows) for rows in groups]
+
+    def dimension_centroids(self) -> np.ndarray:
+        """
+        Mean coordinates of the files dominated by each dimension, one row per code.
+
+        Sums accumulate sequentially per column, as ``coordinates[mask].mean(axis=0)``
+        would; rows of absent dimensions are NaN.
+        """
+        counts = np.bincount(self.dominant, minlength=4)
+        sums = np.stack(
+            [
+                np.bincount(self.dominant, weights=column, minlength=4)
+                for column in self.coordinates.T
+            ],
+            axis=1,
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts[:, None]
+
+    def mirrors(self, file_analyses: Dict[str, FileAnalysis]) -> bool:
+        """True if built from exactly these entries"""
+        return (
+            len(self.analyses) == len(file_analyses)
+            and self.paths == list(file_analyses)
+            and all(a is b for a, b in zip(self.analyses, file_analyses.values()))
+        )
+
+
+class _DebtTable:
+    """Column-wise view of ``architectural_debts``, rebuilt when the list changes"""
+
+    __slots__ = ("debts", "hours", "cost", "priority")
+
+    def __init__(self, debts: List[ArchitecturalDebt]):
+        self.debts = list(debts)
+        self.hours = np.array([d.estimated_hours for d in debts], dtype=np.float64)
+        self.cost = np.array([d.estimated_cost_usd for d in debts], dtype=np.float64)
+        # Index into _DEBT_PRIORITIES, or -1 for priorities outside it
+        self.priority = np.array(
+            [_DEBT_PRIORITY_INDEX.get(d.priority, -1) for d in debts], dtype=np.int64
+        )
+
+    def totals(self, rows: Optional[np.ndarray] = None) -> Tuple[float, float]:
+        """(hours, cost) summed in list order, over all debts or just the given rows"""
+        hours, cost = (
+            (self.hours, self.cost) if rows is None else (self.hours[rows], self.cost[rows])
+        )
+        return sum(hours.tolist()), sum(cost.tolist())
+
+    def mirrors(self, debts: List[ArchitecturalDebt]) -> bool:
+        """True if built from exactly these entries"""
+        return len(self.debts) == len(debts) and all(a is b for a, b in zip(self.debts, debts))
+
+
+class _GitBlobReader:
+    """Reads file contents at given commits through one long-lived ``git cat-file --batch``"""
+
+    def __init__(self, repo_path: str):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read(self, commit_hash: str, rel_path: str) -> Optional[bytes]:
+        """Return the file's bytes at a commit, or None if it did not exist there"""
+        self._proc.stdin.write(f"{commit_hash}:{rel_path}\n".encode())
+        self._proc.stdin.flush()
+
+        # "<sha> <type> <size>\n<content>\n", or "<spec> missing\n"; the spec may hold spaces
+        line = self._proc.stdout.readline()
+        if not line:
+            raise RuntimeError("git cat-file exited unexpectedly")
+        line = line.rstrip(b"\n")
+        if line.endswith((b" missing", b" ambiguous")):
+            return None
+        try:
+            _, object_type, size = line.rsplit(None, 2)
+            size = int(size)
+        except ValueError:
+            raise RuntimeError(f"Unexpected git cat-file reply: {line!r}") from None
+        content = self._proc.stdout.read(size + 1)[:-1]
+        return content if object_type == b"blob" else None
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.stdout.close()
+        self._proc.wait()
+
+    def __enter__(self) -> "_GitBlobReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class LegacyCodeMapper:
     """Advanced codebase semantic analysis"""
 
-    def __init__(self, codebase_path: str, quiet: bool = False):
+    def __init__(self, codebase_path: str, quiet: bool = False, use_cache: bool = False):
         self.codebase_path = codebase_path
-        self.harmonizer = PythonCodeHarmonizer(quiet=quiet)
+        self.harmonizer = PythonCodeHarmonizer(quiet=quiet, keep_nodes=False)
+        # Harmonizers hold parser/engine state, so each thread gets its own instance
+        self._tls = threading.local()
+        self._tls.harmonizer = self.harmonizer
         self.config = ConfigLoader.load(codebase_path)
         self.file_analyses: Dict[str, FileAnalysis] = {}
         self.architectural_smells: List[ArchitecturalSmell] = []
@@ -135,6 +752,21 @@ class LegacyCodeMapper:
         self.architecture_docs: List[ArchitectureDoc] = []
         self.architectural_debts: List[ArchitecturalDebt] = []
         self.quiet = quiet
+        self._table: Optional[_AnalysisTable] = None
+        # (config, exact names, fused glob regex), built on the first file walk
+        self._ignore_cache: Optional[Tuple[object, Set[str], Optional[re.Pattern]]] = None
+        # Paths relative to codebase_path, and (dirname, basename), computed once per file
+        self._rel_paths: Dict[str, str] = {}
+        self._path_parts: Dict[str, Tuple[str, str]] = {}
+        self._component_names: Dict[str, Tuple[str, str]] = {}
+        # Opt-in content-hash keyed results in the per-user cache, opened on first use
+        self.use_cache = use_cache
+        self._cache: Optional[AnalysisCache] = None
+        # Worker processes shared by codebase and history analysis, started on first use
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._debt_table_cache: Optional[_DebtTable] = None
+        # (table it was built from, generate_3d_visualization_data() result)
+        self._viz_data: Optional[Tuple[_AnalysisTable, Dict]] = None
 
     def analyze_codebase(self, show_progress: bool = True) -> Dict:
         """Analyze entire codebase and generate comprehensive report"""
@@ -148,17 +780,16 @@ class LegacyCodeMapper:
             print(f"Found {len(python_files)} Python files\n")
 
         # Analyze each file
-        for i, file_path in enumerate(python_files):
+        for i, (file_path, analysis, error) in enumerate(self._analyze_files(python_files)):
             if show_progress and len(python_files) > 10:
                 print(f"  [{i+1}/{len(python_files)}] Analyzing...", end="\r")
 
-            try:
-                analysis = self._analyze_file(file_path)
-                if analysis:
-                    self.file_analyses[file_path] = analysis
-            except Exception as e:
-                if show_progress:
-                    print(f"Skipped {file_path}: {e}")
+            if analysis:
+                self.file_analyses[file_path] = analysis
+            elif error is not None and show_progress:
+                print(f"Skipped {file_path}: {error}")
+
+        self._commit_cache()
 
         if show_progress:
             print(f"\nAnalyzed {len(self.file_analyses)} files successfully")
@@ -170,129 +801,326 @@ class LegacyCodeMapper:
 
         return self.file_analyses
 
-    def _find_python_files(self) -> List[str]:
-        """Recursively find all Python files in codebase, respecting ignore patterns"""
-        python_files = []
+    def _analyze_files(
+        self, python_files: List[str]
+    ) -> Iterator[Tuple[str, Optional[FileAnalysis], Optional[str]]]:
+        """
+        Analyze files across a process pool, yielding (path, analysis, error) in input order.
 
-        # Load .harmonizerignore if exists
-        ignore_patterns = list(self.config.exclude_patterns)
-        ignore_path = os.path.join(self.codebase_path, ".harmonizerignore")
-        if os.path.exists(ignore_path):
+        Cached results are served directly; only cache misses are sent to the pool,
+        and files with identical content are analyzed once. Small workloads are
+        analyzed serially, since pool start-up would dominate.
+        """
+        cached = {}
+        digests = {}
+        for file_path in python_files:
+            digest, found, analysis = self._lookup_cached_analysis(file_path)
+            if found:
+                cached[file_path] = analysis
+            elif digest is not None:
+                digests[file_path] = digest
+
+        # Hash the remaining files even without a cache, so duplicates share one pool task
+        uncached = [file_path for file_path in python_files if file_path not in cached]
+        if len(uncached) >= parallel.PARALLEL_MIN_FILES:
+            for file_path in uncached:
+                if file_path not in digests:
+                    try:
+                        digests[file_path] = _file_digest(file_path)
+                    except OSError:
+                        pass  # Unreadable; the worker reports the error
+
+        # One representative path per distinct content among the misses
+        misses = []
+        seen_digests = set()
+        for file_path in python_files:
+            if file_path in cached:
+                continue
+            digest = digests.get(file_path)
+            if digest is None or digest not in seen_digests:
+                misses.append(file_path)
+                seen_digests.add(digest)
+
+        done = 0
+        if len(misses) >= parallel.PARALLEL_MIN_FILES:
+            cpus = os.cpu_count() or 1
+            chunksize = max(1, len(misses) // (4 * cpus))
+            cache = self._get_cache()
+            by_digest = {}
             try:
-                with open(ignore_path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            ignore_patterns.append(line)
+                executor = self._get_executor()
+                results = executor.map(_analyze_file_worker, misses, chunksize=chunksize)
+                for file_path in python_files:
+                    digest = digests.get(file_path)
+                    if file_path in cached:
+                        analysis, error = cached[file_path], None
+                    elif digest in by_digest:
+                        analysis, error = by_digest[digest]
+                        if analysis is not None:
+                            analysis = replace(analysis, path=file_path)
+                    else:
+                        analysis, error = next(results)
+                        if digest is not None:
+                            by_digest[digest] = analysis, error
+                            if error is None and cache is not None:
+                                cache.put("file", digest, _analysis_to_json(analysis))
+                    done += 1
+                    yield file_path, analysis, error
+                return
+            except parallel.POOL_ERRORS as e:
+                # Sandboxes without working multiprocessing; finish the rest serially
+                self._shutdown_executor()
+                parallel.report_serial_fallback(e, self.quiet)
+
+        for file_path in python_files[done:]:
+            if file_path in cached:
+                yield file_path, cached[file_path], None
+                continue
+            try:
+                yield file_path, self._analyze_file(file_path), None
             except Exception as e:
-                if not self.quiet:
-                    print(f"Warning: Failed to read .harmonizerignore: {e}")
+                yield file_path, None, str(e)
 
-        import fnmatch
+    def _ignore_matchers(self) -> Tuple[Set[str], Optional[re.Pattern]]:
+        """
+        Exact-name set and fused glob regex for the ignore patterns.
 
-        for root, dirs, files in os.walk(self.codebase_path):
-            # Filter directories in-place
-            # 1. Check exact match
-            dirs[:] = [d for d in dirs if d not in ignore_patterns]
-            # 2. Check glob patterns
-            dirs[:] = [d for d in dirs if not any(fnmatch.fnmatch(d, p) for p in ignore_patterns)]
+        Built on first use and reused by later walks; rebuilt automatically when
+        ``self.config`` is replaced, or explicitly via refresh_ignores().
+        """
+        if self._ignore_cache is None or self._ignore_cache[0] is not self.config:
+            ignore_patterns = list(self.config.exclude_patterns)
 
-            for file in files:
-                if file.endswith(".py"):
+            # Load .harmonizerignore if exists
+            ignore_path = os.path.join(self.codebase_path, ".harmonizerignore")
+            if os.path.exists(ignore_path):
+                try:
+                    with open(ignore_path, "r") as f:
+                        for line in f:
+                            line = line.strip()
+                            if line and not line.startswith("#"):
+                                ignore_patterns.append(line)
+                except Exception as e:
+                    if not self.quiet:
+                        print(f"Warning: Failed to read .harmonizerignore: {e}")
+
+            self._ignore_cache = (
+                self.config,
+                set(ignore_patterns),
+                _compile_ignore_patterns(ignore_patterns),
+            )
+        return self._ignore_cache[1], self._ignore_cache[2]
+
+    def refresh_ignores(self):
+        """Re-read .harmonizerignore and the configured excludes on the next walk"""
+        self._ignore_cache = None
+
+    def _find_python_files(self) -> List[str]:
+        """Recursively find all Python files in codebase, respecting ignore patterns"""
+        python_files = []
+
+        ignore_names, ignore_re = self._ignore_matchers()
+        normcase = os.path.normcase
+
+        def is_ignored(name: str) -> bool:
+            return ignore_re is not None and ignore_re.match(normcase(name)) is not None
+
+        # Depth-first scandir walk in os.walk's top-down order. DirEntry type
+        # checks reuse the d_type from the directory listing, saving a stat per entry.
+        # Each directory carries its relative prefix in native and "/" form, e.g.
+        # "pkg/sub/", extended by one name per level instead of a relpath call
+        sep = os.sep
+        pending = [(self.codebase_path, "", "")]
+        while pending:
+            root, rel_prefix, match_prefix = pending.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue  # Unreadable directory, skipped silently like os.walk
+
+            subdirs = []
+            dir_name = None  # Shared os.path.dirname of every file in this directory
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Filter directories: exact names, then glob patterns
+                    if name not in ignore_names and not is_ignored(name):
+                        subdirs.append(
+                            (entry.path, rel_prefix + name + sep, match_prefix + name + "/")
+                        )
+                elif name.endswith(".py") and not entry.is_dir():
                     # Check file ignore patterns
-                    if any(fnmatch.fnmatch(file, p) for p in ignore_patterns):
+                    if is_ignored(name):
                         continue
 
                     # Check relative path ignore patterns (e.g. "tests/legacy/*.py")
-                    rel_path = os.path.relpath(os.path.join(root, file), self.codebase_path)
-                    # Normalize path separators for matching
-                    rel_path = rel_path.replace(os.sep, "/")
+                    file_path = entry.path
+                    native_rel_path = rel_prefix + name
+                    rel_path = match_prefix + name
 
-                    if any(fnmatch.fnmatch(rel_path, p) for p in ignore_patterns):
+                    if is_ignored(rel_path):
                         continue
 
-                    python_files.append(os.path.join(root, file))
+                    if dir_name is None:
+                        dir_name = os.path.dirname(file_path)
+                    self._rel_paths[file_path] = native_rel_path
+                    self._path_parts[file_path] = (dir_name, name)
+                    python_files.append(file_path)
+
+            # Reversed so subdirectories are visited in listing order
+            pending.extend(reversed(subdirs))
 
         return python_files
 
-    def _analyze_file(self, file_path: str) -> Optional[FileAnalysis]:
-        """Analyze single file and compute semantic coordinates"""
-        results = self.harmonizer.analyze_file(file_path)
+    def _analysis_table(self) -> _AnalysisTable:
+        """Columnar view of file_analyses, rebuilt only when the dict has changed"""
+        if self._table is None or not self._table.mirrors(self.file_analyses):
+            self._table = _AnalysisTable(self.file_analyses)
+        return self._table
+
+    def _debt_table(self) -> _DebtTable:
+        """Columns of architectural_debts, built on first use after the list changes"""
+        cached = self._debt_table_cache
+        if cached is None or not cached.mirrors(self.architectural_debts):
+            cached = self._debt_table_cache = _DebtTable(self.architectural_debts)
+        return cached
+
+    def _split_path(self, file_path: str) -> Tuple[str, str]:
+        """(dirname, basename) of a file, memoized per file"""
+        parts = self._path_parts.get(file_path)
+        if parts is None:
+            parts = self._path_parts[file_path] = os.path.split(file_path)
+        return parts
+
+    def _component_name(self, file_path: str) -> Tuple[str, str]:
+        """(name, lowercased name) of a file's component, as used in docs; memoized per file"""
+        names = self._component_names.get(file_path)
+        if names is None:
+            name = self._split_path(file_path)[1].replace(".py", "")
+            names = self._component_names[file_path] = (name, name.lower())
+        return names
+
+    def _rel_path(self, file_path: str) -> str:
+        """Path relative to the codebase root, memoized per file"""
+        rel_path = self._rel_paths.get(file_path)
+        if rel_path is None:
+            rel_path = self._rel_paths[file_path] = os.path.relpath(file_path, self.codebase_path)
+        return rel_path
+
+    def _get_harmonizer(self) -> PythonCodeHarmonizer:
+        """Return the calling thread's harmonizer, creating it on first use"""
+        harmonizer = getattr(self._tls, "harmonizer", None)
+        if harmonizer is None:
+            harmonizer = PythonCodeHarmonizer(quiet=self.quiet, keep_nodes=False)
+            self._tls.harmonizer = harmonizer
+        return harmonizer
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Process pool reused across analyze_codebase and analyze_git_history"""
+        if self._executor is None:
+            self._executor = parallel.create_pool(parallel.QUIET_WORKER_SETTINGS)
+        return self._executor
+
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def close(self):
+        """Stop worker processes and close the analysis cache; both reopen if used again"""
+        self._shutdown_executor()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def _get_cache(self) -> Optional[AnalysisCache]:
+        """Open the on-disk analysis cache on first use; None when caching is off"""
+        if self._cache is None and self.use_cache:
+            try:
+                self._cache = AnalysisCache(self.codebase_path)
+            except (OSError, sqlite3.Error) as e:
+                self.use_cache = False
+                if not self.quiet:
+                    print(f"Warning: Analysis cache disabled: {e}")
+        return self._cache
 
-        if not results:
-            return None
+    def _commit_cache(self):
+        """Persist cache writes made since the last commit, in one transaction"""
+        if self._cache is not None:
+            self._cache.commit()
 
-        # Collect execution coordinates from all functions
-        all_coords = []
-        all_disharmony = []
+    def _lookup_cached_analysis(
+        self, file_path: str
+    ) -> Tuple[Optional[str], bool, Optional[FileAnalysis]]:
+        """
+        Look up a file's analysis by content hash.
 
-        for func_name, data in results.items():
-            ice_result = data.get("ice_result", {})
-            ice_components = ice_result.get("ice_components", {})
-            execution_result = ice_components.get("execution")
+        Returns:
+            (content digest or None if uncacheable, found, cached analysis)
+        """
+        cache = self._get_cache()
+        if cache is None:
+            return None, False, None
+        try:
+            digest = _file_digest(file_path)
+        except OSError:
+            return None, False, None
 
-            if execution_result:
-                coords = execution_result.coordinates
-                all_coords.append((coords.love, coords.justice, coords.power, coords.wisdom))
+        found, fields = cache.get("file", digest)
+        if not found or fields is None:
+            return digest, found, None
+        try:
+            return digest, True, _analysis_from_json(fields, file_path)
+        except (TypeError, KeyError):
+            return digest, False, None
 
-            disharmony = data.get("score", 0)
-            all_disharmony.append(disharmony)
+    def _analyze_file(self, file_path: str) -> Optional[FileAnalysis]:
+        """Analyze single file and compute semantic coordinates"""
+        digest, found, analysis = self._lookup_cached_analysis(file_path)
+        if found:
+            return analysis
 
-        if not all_coords:
-            return None
-
-        # Average coordinates across all functions
-        avg_l = mean([c[0] for c in all_coords])
-        avg_j = mean([c[1] for c in all_coords])
-        avg_p = mean([c[2] for c in all_coords])
-        avg_w = mean([c[3] for c in all_coords])
-
-        avg_coords = (avg_l, avg_j, avg_p, avg_w)
-
-        # Determine dominant dimension
-        dims = {"Love": avg_l, "Justice": avg_j, "Power": avg_p, "Wisdom": avg_w}
-        dominant = max(dims, key=dims.get)
-
-        # Calculate dimension spread (how balanced)
-        dimension_spread = max(dims.values()) - min(dims.values())
-
-        # Calculate Semantic Density (Power / LOC)
-        # Note: We don't have exact LOC here, but we can estimate from function count * avg function size
-        # Or better, assume 'results' contains LOC info if available.
-        # For now, we'll use a proxy: Power Score / Function Count
-        # Ideally, we'd want raw Power keywords count.
-
-        # Let's look at how we can get raw counts.
-        # The 'results' dict contains 'ice_result' -> 'ice_components' -> 'execution' -> 'coordinates'
-        # It doesn't seem to expose raw keyword counts directly.
-        # However, 'avg_p' is the average Power score (0-1).
-        # Semantic Density = Power Intensity.
-
-        semantic_density = avg_p  # Using avg_p as a proxy for density for now
-
-        return FileAnalysis(
-            path=file_path,
-            coordinates=avg_coords,
-            function_count=len(results),
-            avg_disharmony=mean(all_disharmony) if all_disharmony else 0,
-            max_disharmony=max(all_disharmony) if all_disharmony else 0,
-            min_disharmony=min(all_disharmony) if all_disharmony else 0,
-            dominant_dimension=dominant,
-            dimension_spread=dimension_spread,
-            semantic_density=semantic_density,
-        )
+        analysis = _build_file_analysis(file_path, self._get_harmonizer().analyze_file(file_path))
+        if digest is not None:
+            self._cache.put("file", digest, _analysis_to_json(analysis))
+        return analysis
 
     def _detect_architectural_smells(self):
         """Detect architectural problems"""
         if not self.file_analyses:
             return
 
-        for file_path, analysis in self.file_analyses.items():
-            rel_path = os.path.relpath(file_path, self.codebase_path)
+        # Evaluate every rule for all files at once; only flagged files pay
+        # for building ArchitecturalSmell objects
+        # Bind config thresholds and hot callables once, outside the per-file loop
+        max_disharmony = self.config.max_disharmony
+        disharmony_threshold = max_disharmony * 0.7
+        max_imbalance = self.config.max_imbalance
+        min_density = self.config.min_density
+        add_smell = self.architectural_smells.append
+        rel_path_of = self._rel_path
+
+        table = self._analysis_table()
+        paths, analyses, coords = table.paths, table.analyses, table.coordinates
+        function_counts = table.function_counts
+
+        god_file = function_counts > 30
+        confusion = table.spread < 0.15
+        high_disharmony = table.avg_disharmony > disharmony_threshold
+        mixed_concerns = (function_counts > 15) & (np.count_nonzero(coords > 0.2, axis=1) >= 3)
+        dist_ne_all = np.sqrt(((coords - _NATURAL_EQUILIBRIUM) ** 2).sum(axis=1))
+        imbalance = dist_ne_all > 0.5
+        anemic = (function_counts > 10) & (table.density < min_density)
+        flagged = god_file | confusion | high_disharmony | mixed_concerns | imbalance | anemic
+
+        for i in np.flatnonzero(flagged).tolist():
+            analysis = analyses[i]
+            rel_path = rel_path_of(paths[i])
 
             # Smell 1: God File (too many functions)
-            if analysis.function_count > 30:
-                self.architectural_smells.append(
+            if god_file[i]:
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="God File",
                         file_path=rel_path,
@@ -304,8 +1132,8 @@ class LegacyCodeMapper:
                 )
 
             # Smell 2: Semantic Confusion (no clear purpose)
-            if analysis.dimension_spread < 0.15:
-                self.architectural_smells.append(
+            if confusion[i]:
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="Semantic Confusion",
                         file_path=rel_path,
@@ -317,17 +1145,15 @@ class LegacyCodeMapper:
                 )
 
             # Smell 3: High Disharmony (semantic bugs)
-            if analysis.avg_disharmony > self.config.max_disharmony * 0.7:
-                self.architectural_smells.append(
+            if high_disharmony[i]:
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="High Disharmony",
                         file_path=rel_path,
                         severity=(
-                            "CRITICAL"
-                            if analysis.avg_disharmony > self.config.max_disharmony
-                            else "HIGH"
+                            "CRITICAL" if analysis.avg_disharmony > max_disharmony else "HIGH"
                         ),
-                        description=f"Average disharmony: {analysis.avg_disharmony:.2f} (threshold: {self.config.max_disharmony * 0.7:.2f})",
+                        description=f"Average disharmony: {analysis.avg_disharmony:.2f} (threshold: {disharmony_threshold:.2f})",
                         impact=min(1.0, analysis.avg_disharmony / 1.5),
                         recommendation="Review function names - many don't match implementation",
                     )
@@ -335,9 +1161,8 @@ class LegacyCodeMapper:
 
             # Smell 4: Mixed Concerns (should be multiple files)
             l, j, p, w = analysis.coordinates
-            active_dimensions = sum([1 for coord in [l, j, p, w] if coord > 0.2])
-            if active_dimensions >= 3 and analysis.function_count > 15:
-                self.architectural_smells.append(
+            if mixed_concerns[i]:
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="Mixed Concerns",
                         file_path=rel_path,
@@ -349,13 +1174,13 @@ class LegacyCodeMapper:
                 )
 
             # Smell 5: Unnatural Imbalance (LJPW v4.0)
-            dist_ne = LJPWBaselines.distance_from_natural_equilibrium(l, j, p, w)
-            if dist_ne > 0.5:
-                self.architectural_smells.append(
+            if imbalance[i]:
+                dist_ne = float(dist_ne_all[i])
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="Unnatural Imbalance",
                         file_path=rel_path,
-                        severity=("HIGH" if dist_ne > self.config.max_imbalance else "MEDIUM"),
+                        severity=("HIGH" if dist_ne > max_imbalance else "MEDIUM"),
                         description=f"Deviates significantly from Natural Equilibrium (distance: {dist_ne:.2f})",
                         impact=min(1.0, dist_ne),
                         recommendation="Rebalance dimensions towards NE (L=0.62, J=0.41, P=0.72, W=0.69)",
@@ -364,13 +1189,13 @@ class LegacyCodeMapper:
 
             # Smell 6: Anemic Component (Low Semantic Density)
             # High function count but very low Power (Action)
-            if analysis.semantic_density < self.config.min_density and analysis.function_count > 10:
-                self.architectural_smells.append(
+            if anemic[i]:
+                add_smell(
                     ArchitecturalSmell(
                         smell_type="Anemic Component",
                         file_path=rel_path,
                         severity="HIGH",
-                        description=f"High complexity ({analysis.function_count} funcs) but low action (Power: {analysis.semantic_density:.2f} < {self.config.min_density})",
+                        description=f"High complexity ({analysis.function_count} funcs) but low action (Power: {analysis.semantic_density:.2f} < {min_density})",
                         impact=0.8,
                         recommendation="Component lacks agency. Verify if it's just a data container or if logic leaked elsewhere.",
                     )
@@ -381,15 +1206,14 @@ class LegacyCodeMapper:
         if not self.file_analyses:
             return
 
-        # Sort by potential impact (disharmony * function count)
-        ranked_files = sorted(
-            self.file_analyses.items(),
-            key=lambda x: x[1].avg_disharmony * x[1].function_count,
-            reverse=True,
-        )
+        # Rank by potential impact (disharmony * function count)
+        table = self._analysis_table()
+        ranked = _top_k_stable(table.avg_disharmony * table.function_counts, 10)  # Top 10
 
-        for file_path, analysis in ranked_files[:10]:  # Top 10
-            rel_path = os.path.relpath(file_path, self.codebase_path)
+        add_opportunity = self.refactoring_opportunities.append
+        for i in ranked.tolist():
+            analysis = table.analyses[i]
+            rel_path = self._rel_path(table.paths[i])
 
             if analysis.avg_disharmony < 0.5:
                 continue  # Skip well-harmonized files
@@ -400,36 +1224,39 @@ class LegacyCodeMapper:
             # Estimate complexity reduction
             complexity_reduction = min(80, int((analysis.avg_disharmony - 0.3) * 100))
 
+            # Formatting is deferred: only the top opportunities are ever printed
             suggestions = []
 
             # Specific suggestions based on analysis
             if analysis.function_count > 20:
                 suggestions.append(
-                    f"Split into {analysis.function_count // 15 + 1} smaller modules"
+                    ("Split into {} smaller modules", (analysis.function_count // 15 + 1,))
                 )
 
             if analysis.dimension_spread < 0.2:
-                suggestions.append("Focus file on single semantic dimension")
+                suggestions.append(("Focus file on single semantic dimension", ()))
 
             l, j, p, w = analysis.coordinates
             dominant_val = max(l, j, p, w)
             if dominant_val < 0.4:
-                suggestions.append("Clarify file purpose - currently lacks clear focus")
+                suggestions.append(("Clarify file purpose - currently lacks clear focus", ()))
             else:
                 dim_name = analysis.dominant_dimension
-                suggestions.append(f"Strengthen {dim_name} focus (currently {dominant_val:.0%})")
+                suggestions.append(
+                    ("Strengthen {} focus (currently {:.0%})", (dim_name, dominant_val))
+                )
 
             if analysis.max_disharmony > 1.0:
-                suggestions.append("Fix critical disharmony functions first (score > 1.0)")
+                suggestions.append(("Fix critical disharmony functions first (score > 1.0)", ()))
 
-            self.refactoring_opportunities.append(
+            add_opportunity(
                 RefactoringOpportunity(
                     file_path=rel_path,
                     opportunity_type="Semantic Realignment",
                     complexity_reduction=complexity_reduction,
                     impact_score=min(1.0, impact_score),
                     description=f"High-impact refactoring target: {analysis.function_count} functions, {analysis.avg_disharmony:.2f} avg disharmony",
-                    suggested_actions=suggestions,
+                    action_templates=suggestions,
                 )
             )
 
@@ -439,13 +1266,22 @@ class LegacyCodeMapper:
         outliers = self._find_outliers()
 
         if self.file_analyses:
-            overall_disharmony = mean([f.avg_disharmony for f in self.file_analyses.values()])
+            # fsum-based fmean over the cached column; statistics.mean's exact
+            # Fraction arithmetic is only worth it for the few-value debt scores
+            overall_disharmony = fmean(self._analysis_table().avg_disharmony.tolist())
         else:
             overall_disharmony = 0.0
 
+        # Cluster means for the report, from one grouped pass over the table
+        centroids = self._analysis_table().dimension_centroids() if clusters else None
+        cluster_centroids = {
+            name: tuple(centroids[_DIMENSION_INDEX[name]].tolist()) for name in clusters
+        }
+
         return {
             "total_files": len(self.file_analyses),
             "clusters": clusters,
+            "cluster_centroids": cluster_centroids,
             "outliers": outliers,
             "overall_disharmony": overall_disharmony,
             "architectural_smells": self.architectural_smells,
@@ -454,18 +1290,20 @@ class LegacyCodeMapper:
 
     def _cluster_by_dimension(self) -> Dict[str, List[FileAnalysis]]:
         """Group files by dominant semantic dimension"""
-        clusters = defaultdict(list)
-        for analysis in self.file_analyses.values():
-            clusters[analysis.dominant_dimension].append(analysis)
-        return dict(clusters)
+        table = self._analysis_table()
+        if not table.analyses:
+            return {}
+        # Clusters appear in order of each dimension's first file
+        clusters = {}
+        analyses = table.analyses
+        for code, rows in table.dimension_groups():
+            clusters[_DIMENSION_NAMES[code]] = [analyses[i] for i in rows.tolist()]
+        return clusters
 
     def _find_outliers(self, threshold: float = 0.15) -> List[FileAnalysis]:
         """Find files with no clear dominant dimension"""
-        outliers = []
-        for analysis in self.file_analyses.values():
-            if analysis.dimension_spread < threshold:
-                outliers.append(analysis)
-        return outliers
+        table = self._analysis_table()
+        return [table.analyses[i] for i in np.flatnonzero(table.spread < threshold).tolist()]
 
     def generate_complexity_heatmap(self) -> str:
         """Generate ASCII complexity heatmap"""
@@ -477,35 +1315,39 @@ class LegacyCodeMapper:
         heatmap.append("COMPLEXITY HEATMAP (Darker = Higher Disharmony)")
         heatmap.append("=" * 70)
 
-        # Group by directory
-        by_directory = defaultdict(list)
-        for file_path, analysis in self.file_analyses.items():
-            dir_name = os.path.dirname(file_path)
-            if not dir_name:
-                dir_name = "."
-            by_directory[dir_name].append((os.path.basename(file_path), analysis))
+        # Group table rows by directory, using the split recorded during discovery
+        table = self._analysis_table()
+        rows_by_directory = defaultdict(list)
+        rel_dirs = {}
+        for i, file_path in enumerate(table.paths):
+            dir_name = self._split_path(file_path)[0] or "."
+            if dir_name not in rel_dirs:
+                # The memoized relative file path already holds the relative directory
+                rel_dirs[dir_name] = (
+                    os.path.dirname(self._rel_path(file_path)) if dir_name != "." else "."
+                )
+            rows_by_directory[dir_name].append(i)
 
         # Generate heatmap
-        for dir_name in sorted(by_directory.keys()):
-            files = by_directory[dir_name]
-            avg_disharmony = mean([f[1].avg_disharmony for f in files])
+        for dir_name in sorted(rows_by_directory):
+            rows = rows_by_directory[dir_name]
+            scores = table.avg_disharmony[rows].tolist()
+            avg_disharmony = fmean(scores)
 
             # Visual bar (0-10 blocks)
             bar_length = int(avg_disharmony * 10)
-            bar = "█" * bar_length + "░" * (10 - bar_length)
+            bar = _bar(bar_length, 10)
 
-            rel_dir = os.path.relpath(dir_name, self.codebase_path) if dir_name != "." else "."
-            heatmap.append(f"\n{rel_dir}/")
-            heatmap.append(f"  {bar} ({avg_disharmony:.2f})")
+            heatmap.append(f"\n{rel_dirs[dir_name] or '.'}/")
+            heatmap.append(_HEATMAP_DIR_LINE % (bar, avg_disharmony))
 
             # Show individual files if directory has few files
-            if len(files) <= 5:
-                for filename, analysis in sorted(
-                    files, key=lambda x: x[1].avg_disharmony, reverse=True
-                ):
-                    file_bar_length = int(analysis.avg_disharmony * 10)
-                    file_bar = "█" * file_bar_length + "░" * (10 - file_bar_length)
-                    heatmap.append(f"    {filename:30s} {file_bar} ({analysis.avg_disharmony:.2f})")
+            if len(rows) <= 5:
+                for score, i in sorted(zip(scores, rows), key=itemgetter(0), reverse=True):
+                    filename = self._split_path(table.paths[i])[1]
+                    heatmap.append(
+                        _HEATMAP_FILE_LINE % (filename, _bar(int(score * 10), 10), score)
+                    )
 
         return "\n".join(heatmap)
 
@@ -527,16 +1369,10 @@ class LegacyCodeMapper:
                 print("⚠️  Not a git repository - skipping history analysis")
             return False
 
-        # Get commit history
+        # Get commit history. Every file samples the same newest commits, so stop
+        # reading the log as soon as those are in hand.
         try:
-            result = subprocess.run(
-                ["git", "log", f"-{max_commits}", "--pretty=format:%H|%ai|%an"],
-                cwd=self.codebase_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            commits = [line.split("|") for line in result.stdout.strip().split("\n") if line]
+            commits = list(islice(self._iter_git_log(max_commits), _HISTORY_SAMPLE_COMMITS))
         except subprocess.CalledProcessError:
             if show_progress and not self.quiet:
                 print("⚠️  Failed to get git history")
@@ -545,10 +1381,19 @@ class LegacyCodeMapper:
         if not commits:
             return False
 
-        # Analyze each file's evolution
-        for file_path, current_analysis in self.file_analyses.items():
-            rel_path = os.path.relpath(file_path, self.codebase_path)
-            drift = self._analyze_file_history(rel_path, commits, current_analysis)
+        # Analyze each file's evolution. Historical versions stream out of a single
+        # git process on a reader thread while they are analyzed in parallel.
+        rel_paths = [self._rel_path(file_path) for file_path in self.file_analyses]
+        summaries = self._summarize_history(rel_paths, commits)
+        self._commit_cache()
+
+        for file_idx, rel_path in enumerate(rel_paths):
+            snapshots = []
+            for commit_idx, (commit_hash, commit_date_str, author) in enumerate(commits):
+                summary = summaries.get((file_idx, commit_idx))
+                if summary:
+                    snapshots.append(_make_snapshot(commit_hash, commit_date_str, author, summary))
+            drift = self._drift_from_snapshots(rel_path, snapshots)
             if drift:
                 self.semantic_drifts.append(drift)
 
@@ -557,85 +1402,171 @@ class LegacyCodeMapper:
 
         return True
 
-    def _analyze_file_history(
-        self,
-        rel_file_path: str,
-        commits: List[List[str]],
-        current_analysis: FileAnalysis,
-    ) -> Optional[SemanticDrift]:
-        """Analyze how a single file evolved over time"""
-        snapshots = []
+    def _iter_git_log(self, max_commits: int) -> Iterator[List[str]]:
+        """
+        Stream [hash, date, author] for each commit while git log is still running.
+
+        Closing the generator early terminates git; a failing git raises
+        CalledProcessError once its output is exhausted.
+        """
+        cmd = ["git", "log", f"-{max_commits}", "--pretty=format:%H|%ai|%an"]
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.codebase_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line:
+                    yield line.split("|", 2)
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.wait()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def _summarize_history(
+        self, rel_paths: List[str], commits: List[List[str]]
+    ) -> Dict[Tuple[int, int], Optional[Tuple[Tuple[float, float, float, float], float]]]:
+        """
+        Summarize every (file, commit) version, keyed by (file index, commit index).
+
+        A reader thread pulls blobs from one ``git cat-file --batch`` process into a
+        bounded queue while this thread hashes them, serves cache hits and farms
+        misses out to a process pool, so git I/O overlaps with parsing. Identical
+        blobs are analyzed once. Versions that are missing or fail to analyze are
+        left out.
+        """
+        blob_queue: "queue.Queue" = queue.Queue(maxsize=32)
+        stop_reading = threading.Event()
+        n_commits = min(len(commits), _HISTORY_SAMPLE_COMMITS)
+
+        reader_errors = []
 
-        for commit_hash, commit_date_str, author in commits[:10]:  # Sample 10 commits
-            # Get file content at this commit
+        def read_blobs():
             try:
-                result = subprocess.run(
-                    ["git", "show", f"{commit_hash}:{rel_file_path}"],
-                    cwd=self.codebase_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
+                with _GitBlobReader(self.codebase_path) as blobs:
+                    for file_idx, rel_path in enumerate(rel_paths):
+                        for commit_idx in range(n_commits):
+                            if stop_reading.is_set():
+                                return
+                            content = blobs.read(commits[commit_idx][0], rel_path)
+                            if content is not None:
+                                blob_queue.put(((file_idx, commit_idx), rel_path, content))
+            except (OSError, RuntimeError) as e:
+                # git could not start, died, or replied out of sync: keep what was read
+                reader_errors.append(e)
+            finally:
+                blob_queue.put(None)
+
+        use_pool = len(rel_paths) * n_commits >= parallel.PARALLEL_MIN_FILES
+        if use_pool:
+            # Fork the pool workers before the reader thread and its git process
+            # exist: a worker forked later would inherit git's stdin pipe, so git
+            # would never see end-of-input and closing the reader would hang
+            try:
+                self._get_executor().submit(int)
+            except (*parallel.POOL_ERRORS, RuntimeError):
+                use_pool = False
 
-                if result.returncode != 0:
-                    continue  # File didn't exist at this commit
+        reader = threading.Thread(target=read_blobs, daemon=True)
+        reader.start()
 
-                # Write to temp file and analyze
-                import tempfile
+        cache = self._get_cache()
+        keys_by_digest: Dict[str, List[Tuple[int, int]]] = {}
+        summary_by_digest = {}
+        pending = []  # (digest, source, rel_path) awaiting analysis
+        futures = {}
+        reader_done = False
 
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                    f.write(result.stdout)
-                    temp_path = f.name
+        try:
+            while True:
+                item = blob_queue.get()
+                if item is None:
+                    reader_done = True
+                    break
+                key, rel_path, content = item
+                digest = content_digest(content)
+                if digest in keys_by_digest:
+                    keys_by_digest[digest].append(key)
+                    continue
+                keys_by_digest[digest] = [key]
 
+                found, summary = cache.get("history", digest) if cache else (False, None)
+                if found:
+                    try:
+                        summary_by_digest[digest] = _history_summary_from_json(summary)
+                        continue
+                    except (TypeError, ValueError):
+                        pass  # Malformed entry; analyze the blob again
                 try:
-                    # Analyze this version
-                    results = self.harmonizer.analyze_file(temp_path)
-                    if results:
-                        # Compute average coordinates
-                        all_coords = []
-                        all_disharmony = []
-
-                        for func_name, data in results.items():
-                            ice_result = data.get("ice_result", {})
-                            ice_components = ice_result.get("ice_components", {})
-                            execution_result = ice_components.get("execution")
-
-                            if execution_result:
-                                coords = execution_result.coordinates
-                                all_coords.append(
-                                    (
-                                        coords.love,
-                                        coords.justice,
-                                        coords.power,
-                                        coords.wisdom,
-                                    )
-                                )
-
-                            all_disharmony.append(data.get("score", 0))
-
-                        if all_coords:
-                            avg_l = mean([c[0] for c in all_coords])
-                            avg_j = mean([c[1] for c in all_coords])
-                            avg_p = mean([c[2] for c in all_coords])
-                            avg_w = mean([c[3] for c in all_coords])
-
-                            snapshots.append(
-                                GitCommitSnapshot(
-                                    commit_hash=commit_hash[:8],
-                                    commit_date=datetime.fromisoformat(
-                                        commit_date_str.replace(" ", "T")
-                                    ),
-                                    author=author,
-                                    coordinates=(avg_l, avg_j, avg_p, avg_w),
-                                    disharmony=(mean(all_disharmony) if all_disharmony else 0.0),
-                                )
+                    source = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+                pending.append((digest, source, rel_path))
+
+                # Start the pool once there is enough work to amortize its start-up
+                if use_pool and len(pending) >= parallel.PARALLEL_MIN_FILES:
+                    try:
+                        executor = self._get_executor()
+                        for digest, source, rel_path in pending:
+                            futures[digest] = (
+                                executor.submit(_summarize_source_worker, source, rel_path),
+                                source,
+                                rel_path,
                             )
-                finally:
-                    os.unlink(temp_path)
+                        pending.clear()
+                    except (*parallel.POOL_ERRORS, RuntimeError):
+                        use_pool = False
+        finally:
+            # If this loop failed part-way, the reader may be blocked on the full
+            # queue: stop it and drain until its end-of-stream marker
+            stop_reading.set()
+            while not reader_done:
+                reader_done = blob_queue.get() is None
+            reader.join()
+        if reader_errors and not self.quiet:
+            print(f"Warning: Stopped reading git history early ({reader_errors[0]})")
+
+        results = {}
+        for digest, (future, source, rel_path) in futures.items():
+            try:
+                results[digest] = future.result()
+            except parallel.POOL_ERRORS:
+                use_pool = False
+                pending.append((digest, source, rel_path))
+        if not use_pool:
+            self._shutdown_executor()
+
+        # Small workloads, and anything the pool could not take, run in-process
+        for digest, source, rel_path in pending:
+            try:
+                results[digest] = self._summarize_source(source, rel_path), None
+            except Exception as e:
+                results[digest] = None, str(e)
 
-            except Exception:
-                continue
+        for digest, (summary, error) in results.items():
+            if error is None:
+                summary_by_digest[digest] = summary
+                if cache:
+                    cache.put("history", digest, summary)
 
+        return {
+            key: summary_by_digest[digest]
+            for digest, keys in keys_by_digest.items()
+            if digest in summary_by_digest
+            for key in keys
+        }
+
+    def _drift_from_snapshots(
+        self, rel_file_path: str, snapshots: List[GitCommitSnapshot]
+    ) -> Optional[SemanticDrift]:
+        """Measure drift between the oldest and newest snapshots (newest first)"""
         if len(snapshots) < 2:
             return None
 
@@ -687,10 +1618,10 @@ class LegacyCodeMapper:
         duration = months * 4
         history = simulator.simulate(analysis.coordinates, duration=duration, dt=0.1)
 
-        final_l = history["L"][-1]
-        final_j = history["J"][-1]
-        final_p = history["P"][-1]
-        final_w = history["W"][-1]
+        final_l = float(history["L"][-1])
+        final_j = float(history["J"][-1])
+        final_p = float(history["P"][-1])
+        final_w = float(history["W"][-1])
 
         # Calculate projected distance from NE
         start_dist = LJPWBaselines.distance_from_natural_equilibrium(*analysis.coordinates)
@@ -714,6 +1645,13 @@ class LegacyCodeMapper:
             "risk_level": ("HIGH" if end_dist > 0.8 else "MEDIUM" if end_dist > 0.5 else "LOW"),
         }
 
+    def _summarize_source(
+        self, source: str, rel_file_path: str
+    ) -> Optional[Tuple[Tuple[float, float, float, float], float]]:
+        """Average coordinates and disharmony of a historical version of a file"""
+        results = self._get_harmonizer().analyze_source(source, virtual_path=rel_file_path)
+        return _summarize_history_results(results)
+
     def analyze_architecture_docs(self, docs_path: Optional[str] = None) -> bool:
         """Compare documented architecture with actual implementation"""
         if not docs_path:
@@ -741,8 +1679,7 @@ class LegacyCodeMapper:
 
         # Read documentation
         try:
-            with open(docs_path, "r") as f:
-                doc_content = f.read().lower()
+            doc_content = _read_lowercased_text(docs_path)
         except Exception as e:
             if not self.quiet:
                 print(f"⚠️  Could not read documentation: {e}")
@@ -750,59 +1687,52 @@ class LegacyCodeMapper:
 
         # Extract component mentions and their documented purposes
         # Look for patterns like "X handles Y" or "X is responsible for Y"
-        import re
-
-        for file_path, analysis in self.file_analyses.items():
-            filename = os.path.basename(file_path).replace(".py", "")
+        purposes = _DocPurposeIndex(doc_content)
+        table = self._analysis_table()
+        documented = []  # (component, purpose, documented coords, actual coords, table row)
+        for row, (file_path, analysis) in enumerate(self.file_analyses.items()):
+            filename, filename_lower = self._component_name(file_path)
 
             # Check if this component is documented
-            if filename.lower() not in doc_content:
+            if not purposes.mentions(filename_lower):
                 continue
 
             # Try to extract documented purpose
-            patterns = [
-                rf"{filename}\s+(?:handles|manages|provides|implements|is responsible for)\s+([^.]+)",
-                rf"`{filename}`[:\s]+([^.]+)",
-            ]
-
-            documented_purpose = None
-            for pattern in patterns:
-                match = re.search(pattern, doc_content, re.IGNORECASE)
-                if match:
-                    documented_purpose = match.group(1).strip()
-                    break
+            documented_purpose = purposes.find(filename, filename_lower)
+            if documented_purpose is not None:
+                documented_purpose = documented_purpose.strip()
 
             if not documented_purpose:
                 documented_purpose = "Mentioned but purpose unclear"
 
             # Infer documented coordinates from purpose text
             doc_coords = self._infer_coordinates_from_text(documented_purpose)
-
-            # Compare with actual
-            actual = analysis.coordinates
-
+            documented.append((filename, documented_purpose, doc_coords, analysis.coordinates, row))
+
+        # Compare with actual, for all components with inferable coordinates at once
+        inferred = [i for i, entry in enumerate(documented) if entry[2]]
+        alignments = {}
+        mismatches = {}
+        if inferred:
+            doc_arr = np.array([documented[i][2] for i in inferred], dtype=np.float64)
+            actual_arr = table.coordinates[[documented[i][4] for i in inferred]]
+            diff = doc_arr - actual_arr
+            # Alignment is the inverse of Euclidean distance
+            distances = np.sqrt((diff * diff).sum(axis=1)).tolist()
+            mismatched = np.abs(diff) > 0.3
+            for row, i in enumerate(inferred):
+                alignments[i] = max(0.0, 1.0 - distances[row])
+                mismatches[i] = np.flatnonzero(mismatched[row]).tolist()
+
+        for i, (filename, documented_purpose, doc_coords, actual, _) in enumerate(documented):
             if doc_coords:
-                # Calculate alignment (inverse of distance)
-                distance = sum((doc_coords[i] - actual[i]) ** 2 for i in range(4)) ** 0.5
-                alignment = max(0.0, 1.0 - distance)
-
-                discrepancies = []
-                if abs(doc_coords[0] - actual[0]) > 0.3:
-                    discrepancies.append(
-                        f"Love dimension mismatch: doc={doc_coords[0]:.2f} vs actual={actual[0]:.2f}"
-                    )
-                if abs(doc_coords[1] - actual[1]) > 0.3:
-                    discrepancies.append(
-                        f"Justice dimension mismatch: doc={doc_coords[1]:.2f} vs actual={actual[1]:.2f}"
-                    )
-                if abs(doc_coords[2] - actual[2]) > 0.3:
-                    discrepancies.append(
-                        f"Power dimension mismatch: doc={doc_coords[2]:.2f} vs actual={actual[2]:.2f}"
-                    )
-                if abs(doc_coords[3] - actual[3]) > 0.3:
-                    discrepancies.append(
-                        f"Wisdom dimension mismatch: doc={doc_coords[3]:.2f} vs actual={actual[3]:.2f}"
-                    )
+                alignment = alignments[i]
+                # Only mismatching dimensions reach string formatting
+                discrepancies = [
+                    f"{_DIMENSION_NAMES[dim]} dimension mismatch: "
+                    f"doc={doc_coords[dim]:.2f} vs actual={actual[dim]:.2f}"
+                    for dim in mismatches[i]
+                ]
             else:
                 alignment = 0.5  # Unknown
                 discrepancies = ["Could not infer semantic coordinates from documentation"]
@@ -827,49 +1757,12 @@ class LegacyCodeMapper:
         self, text: str
     ) -> Optional[Tuple[float, float, float, float]]:
         """Infer LJPW coordinates from natural language description"""
-        text_lower = text.lower()
-
-        # Keywords for each dimension
-        love_keywords = [
-            "connect",
-            "integrate",
-            "communicate",
-            "coordinate",
-            "collaborate",
-            "interface",
-        ]
-        justice_keywords = [
-            "validate",
-            "verify",
-            "check",
-            "ensure",
-            "enforce",
-            "correct",
-        ]
-        power_keywords = [
-            "create",
-            "delete",
-            "modify",
-            "update",
-            "execute",
-            "control",
-            "manage",
-        ]
-        wisdom_keywords = [
-            "analyze",
-            "compute",
-            "calculate",
-            "process",
-            "retrieve",
-            "query",
-            "understand",
-        ]
-
-        love_count = sum(1 for kw in love_keywords if kw in text_lower)
-        justice_count = sum(1 for kw in justice_keywords if kw in text_lower)
-        power_count = sum(1 for kw in power_keywords if kw in text_lower)
-        wisdom_count = sum(1 for kw in wisdom_keywords if kw in text_lower)
+        # Each keyword counts once however often it appears
+        counts = [0, 0, 0, 0]
+        for keyword in set(_DOC_KEYWORD_RE.findall(text.lower())):
+            counts[_DOC_KEYWORD_DIMENSION[keyword]] += 1
 
+        love_count, justice_count, power_count, wisdom_count = counts
         total = love_count + justice_count + power_count + wisdom_count
         if total == 0:
             return None
@@ -887,113 +1780,105 @@ class LegacyCodeMapper:
         if not self.quiet:
             print(f"\n💰 Estimating architectural debt (rate: ${hourly_rate}/hr)...")
 
-        for file_path, analysis in self.file_analyses.items():
-            rel_path = os.path.relpath(file_path, self.codebase_path)
-
-            # Calculate debt score (0-1)
-            debt_factors = []
-
-            # Factor 1: Disharmony
-            if analysis.avg_disharmony > 0.5:
-                debt_factors.append(analysis.avg_disharmony)
-
-            # Factor 2: Complexity (function count)
-            if analysis.function_count > 20:
-                debt_factors.append(min(1.0, analysis.function_count / 50))
-
-            # Factor 3: Semantic confusion
-            if analysis.dimension_spread < 0.2:
-                debt_factors.append(0.6)
-
-            if not debt_factors:
-                continue
-
-            debt_score = mean(debt_factors)
-
-            # Estimate hours based on debt factors
-            base_hours = 0
-            debt_type = []
-
-            if analysis.avg_disharmony > 0.7:
-                base_hours += analysis.function_count * 0.5  # 30 min per function to fix
-                debt_type.append("High Disharmony")
-
-            if analysis.function_count > 30:
-                base_hours += analysis.function_count * 0.3  # Refactoring time
-                debt_type.append("God File")
-
-            if analysis.dimension_spread < 0.2:
-                base_hours += 4  # Clarification and restructuring
-                debt_type.append("Semantic Confusion")
-
-            if base_hours == 0:
-                continue
-
-            # Priority based on impact
-            if debt_score > 0.8:
-                priority = "CRITICAL"
-            elif debt_score > 0.6:
-                priority = "HIGH"
-            elif debt_score > 0.4:
-                priority = "MEDIUM"
-            else:
-                priority = "LOW"
+        table = self._analysis_table()
+        disharmony = table.avg_disharmony
+        function_count = table.function_counts
+        spread = table.spread
+
+        # Calculate debt score (0-1) as the mean of the factors that apply:
+        # disharmony, complexity (function count) and semantic confusion
+        has_disharmony = disharmony > 0.5
+        has_complexity = function_count > 20
+        is_confused = spread < 0.2
+        n_factors = has_disharmony.astype(np.int64) + has_complexity + is_confused
+        factor_sum = (
+            np.where(has_disharmony, disharmony, 0.0)
+            + np.where(has_complexity, np.minimum(1.0, function_count / 50), 0.0)
+            + np.where(is_confused, 0.6, 0.0)
+        )
 
+        # Estimate hours based on debt factors
+        high_disharmony = disharmony > 0.7
+        god_file = function_count > 30
+        base_hours = (
+            np.where(high_disharmony, function_count * 0.5, 0.0)  # 30 min per function to fix
+            + np.where(god_file, function_count * 0.3, 0.0)  # Refactoring time
+            + np.where(is_confused, 4.0, 0.0)  # Clarification and restructuring
+        )
+        type_code = high_disharmony * 4 + god_file * 2 + is_confused
+
+        rows = np.flatnonzero((n_factors > 0) & (base_hours != 0))
+        scores = factor_sum[rows] / n_factors[rows]
+        # Halving is exact, so one or two factors already give statistics.mean's
+        # correctly rounded result; the rare three-factor rows use it directly
+        for i in np.flatnonzero(n_factors[rows] == 3).tolist():
+            analysis = table.analyses[rows[i]]
+            scores[i] = mean([analysis.avg_disharmony, min(1.0, analysis.function_count / 50), 0.6])
+        # Priority based on impact
+        priorities = np.searchsorted(_DEBT_PRIORITY_THRESHOLDS, scores, side="left")
+
+        for row, debt_score, hours, type_idx, priority_idx in zip(
+            rows.tolist(),
+            scores.tolist(),
+            base_hours[rows].tolist(),
+            type_code[rows].tolist(),
+            priorities.tolist(),
+        ):
+            analysis = table.analyses[row]
             self.architectural_debts.append(
                 ArchitecturalDebt(
-                    file_path=rel_path,
+                    file_path=self._rel_path(table.paths[row]),
                     debt_score=debt_score,
-                    estimated_hours=base_hours,
-                    estimated_cost_usd=base_hours * hourly_rate,
-                    debt_type=" + ".join(debt_type),
-                    priority=priority,
+                    estimated_hours=hours,
+                    estimated_cost_usd=hours * hourly_rate,
+                    debt_type=_DEBT_TYPES[type_idx],
+                    priority=_DEBT_PRIORITIES[priority_idx],
                     description=f"{analysis.function_count} functions, {analysis.avg_disharmony:.2f} avg disharmony",
                 )
             )
 
         if not self.quiet:
-            total_hours = sum(d.estimated_hours for d in self.architectural_debts)
-            total_cost = sum(d.estimated_cost_usd for d in self.architectural_debts)
+            total_hours, total_cost = self._debt_table().totals()
             print(f"✅ Total debt: {total_hours:.1f} hours (${total_cost:,.0f})")
 
     def generate_3d_visualization_data(self) -> Dict:
-        """Generate data for 3D visualization of codebase in LJPW space"""
-        data = {
-            "files": [],
-            "clusters": {},
-            "dimensions": ["Love", "Justice", "Power", "Wisdom"],
-        }
+        """
+        Generate data for 3D visualization of codebase in LJPW space.
+
+        The result is memoized until file_analyses changes; treat it as read-only.
+        """
+        table = self._analysis_table()
+        if self._viz_data is not None and self._viz_data[0] is table:
+            return self._viz_data[1]
 
-        for file_path, analysis in self.file_analyses.items():
+        files = []
+        members = ([], [], [], [])  # file entries per dominance code
+        for file_path, analysis, dim in zip(table.paths, table.analyses, table.dominant.tolist()):
             l, j, p, w = analysis.coordinates
-            rel_path = os.path.relpath(file_path, self.codebase_path)
 
             file_data = {
-                "path": rel_path,
+                "path": self._rel_path(file_path),
                 "coordinates": {"L": l, "J": j, "P": p, "W": w},
                 "dominant": analysis.dominant_dimension,
                 "disharmony": analysis.avg_disharmony,
                 "function_count": analysis.function_count,
-                "color": self._get_dimension_color(analysis.dominant_dimension),
+                "color": _DIMENSION_COLOR_CODES[dim],
             }
-            data["files"].append(file_data)
-
-            # Add to cluster
-            if analysis.dominant_dimension not in data["clusters"]:
-                data["clusters"][analysis.dominant_dimension] = []
-            data["clusters"][analysis.dominant_dimension].append(file_data)
+            files.append(file_data)
+            members[dim].append(file_data)
 
+        data = {
+            "files": files,
+            # Only dimensions that have files, in order of their first file
+            "clusters": {_DIMENSION_NAMES[dim]: members[dim] for dim in table.dimension_order()},
+            "dimensions": ["Love", "Justice", "Power", "Wisdom"],
+        }
+        self._viz_data = (table, data)
         return data
 
     def _get_dimension_color(self, dimension: str) -> str:
         """Get color code for dimension"""
-        colors = {
-            "Love": "#FFD700",  # Gold
-            "Justice": "#4169E1",  # Royal Blue
-            "Power": "#DC143C",  # Crimson
-            "Wisdom": "#32CD32",  # Lime Green
-        }
-        return colors.get(dimension, "#808080")
+        return _DIMENSION_COLORS.get(dimension, "#808080")
 
     def generate_semantic_map_ascii(self) -> str:
         """Generate advanced ASCII semantic map showing codebase structure"""
@@ -1011,37 +1896,37 @@ class LegacyCodeMapper:
 
         # Create grid
         grid_size = 20
-        grid = [[" " for _ in range(grid_size)] for _ in range(grid_size)]
-        file_map = {}
-
-        for file_path, analysis in self.file_analyses.items():
-            l, j, p, w = analysis.coordinates
-
-            # Project to 2D: X = (L + J) / 2, Y = (P + W) / 2
-            x_val = (l + j) / 2.0
-            y_val = (p + w) / 2.0
-
-            # Map to grid coordinates
-            x = int(x_val * (grid_size - 1))
-            y = int(y_val * (grid_size - 1))
-
-            # Ensure within bounds
-            x = max(0, min(grid_size - 1, x))
-            y = max(0, min(grid_size - 1, y))
-
-            # Symbol based on dominant dimension
-            symbol = {"Love": "♥", "Justice": "⚖", "Power": "⚡", "Wisdom": "◆"}.get(
-                analysis.dominant_dimension, "●"
-            )
-
-            if grid[grid_size - 1 - y][x] == " ":
-                grid[grid_size - 1 - y][x] = symbol
-                file_map[(y, x)] = os.path.basename(file_path)
+        # Row-major cells in one flat list; cell = row * grid_size + column
+        grid = [" "] * (grid_size * grid_size)
+
+        # Project every file to 2D at once: X = (L + J) / 2, Y = (P + W) / 2.
+        # float64 keeps the truncated grid cells identical to scalar arithmetic.
+        table = self._analysis_table()
+        coords = table.coordinates
+        x_val = (coords[:, 0] + coords[:, 1]) / 2.0
+        y_val = (coords[:, 2] + coords[:, 3]) / 2.0
+
+        # Map to grid coordinates, within bounds
+        xs = np.clip((x_val * (grid_size - 1)).astype(np.int64), 0, grid_size - 1)
+        ys = np.clip((y_val * (grid_size - 1)).astype(np.int64), 0, grid_size - 1)
+
+        # The first file in each cell sets its symbol; later files mark it as shared
+        cells = (grid_size - 1 - ys) * grid_size + xs
+        occupied, first, counts = np.unique(cells, return_index=True, return_counts=True)
+        dominant = table.dominant.tolist()
+        for cell, file_idx, count in zip(occupied.tolist(), first.tolist(), counts.tolist()):
+            if count > 1:
+                symbol = "▪"  # Multiple files
             else:
-                grid[grid_size - 1 - y][x] = "▪"  # Multiple files
+                # Symbol based on dominant dimension
+                symbol = _DIMENSION_SYMBOLS[dominant[file_idx]]
+            grid[cell] = symbol
 
         # Print grid
-        for i, row in enumerate(grid):
+        for i in range(grid_size):
+            start = i * grid_size
+            end = start + grid_size
+            row = grid[start:end]
             y_label = f"{1.0 - (i / grid_size):.1f}"
             if i % 5 == 0:
                 output.append(f"  {y_label:>4} ┤ {''.join(row)}")
@@ -1070,7 +1955,7 @@ class LegacyCodeMapper:
         output.append("=" * 90)
 
         # Sort by drift amount
-        sorted_drifts = sorted(self.semantic_drifts, key=lambda x: x.total_drift, reverse=True)[:10]
+        sorted_drifts = heapq.nlargest(10, self.semantic_drifts, key=attrgetter("total_drift"))
 
         for drift in sorted_drifts:
             output.append(f"\n{drift.file_path}")
@@ -1078,7 +1963,7 @@ class LegacyCodeMapper:
             # Create drift bar
             drift_normalized = min(1.0, drift.total_drift / 2.0)  # Cap at 2.0 for visualization
             bar_length = int(drift_normalized * 40)
-            bar = "█" * bar_length + "░" * (40 - bar_length)
+            bar = _bar(bar_length, 40)
 
             stability_icon = (
                 "✓"
@@ -1113,39 +1998,50 @@ class LegacyCodeMapper:
         output.append("ARCHITECTURAL DEBT BREAKDOWN")
         output.append("=" * 90)
 
-        total_hours = sum(d.estimated_hours for d in self.architectural_debts)
-        total_cost = sum(d.estimated_cost_usd for d in self.architectural_debts)
+        debts = self.architectural_debts
+        table = self._debt_table()
+        hours, cost = table.hours, table.cost
+        total_hours, total_cost = table.totals()
 
         output.append(f"\nTotal Debt: {total_hours:.1f} hours | ${total_cost:,.0f}")
 
-        # Debt by type
-        by_type = defaultdict(lambda: {"hours": 0, "cost": 0, "count": 0})
-        for debt in self.architectural_debts:
-            by_type[debt.debt_type]["hours"] += debt.estimated_hours
-            by_type[debt.debt_type]["cost"] += debt.estimated_cost_usd
-            by_type[debt.debt_type]["count"] += 1
+        # Debt by type: one grouped reduction per column. bincount accumulates in
+        # input order; groups are listed in first-seen order so cost ties sort stably.
+        types, first, inverse = np.unique(
+            [d.debt_type for d in debts], return_index=True, return_inverse=True
+        )
+        inverse = inverse.ravel()
+        type_hours = np.bincount(inverse, weights=hours).tolist()
+        type_cost = np.bincount(inverse, weights=cost).tolist()
+        type_count = np.bincount(inverse).tolist()
+        by_type = [
+            (types[g].item(), type_hours[g], type_cost[g], type_count[g])
+            for g in np.argsort(first, kind="stable").tolist()
+        ]
 
         output.append("\nBy Debt Type:")
-        for debt_type, stats in sorted(by_type.items(), key=lambda x: x[1]["cost"], reverse=True):
-            percentage = (stats["cost"] / total_cost * 100) if total_cost > 0 else 0
+        for debt_type, type_h, type_c, count in sorted(by_type, key=lambda x: x[2], reverse=True):
+            percentage = (type_c / total_cost * 100) if total_cost > 0 else 0
             bar_length = int(percentage / 100 * 40)
-            bar = "█" * bar_length + "░" * (40 - bar_length)
+            bar = _bar(bar_length, 40)
 
             output.append(f"\n  {debt_type}")
             output.append(f"    {bar} {percentage:.1f}%")
-            output.append(
-                f"    {stats['count']} files | {stats['hours']:.1f}hrs | ${stats['cost']:,.0f}"
-            )
+            output.append(f"    {count} files | {type_h:.1f}hrs | ${type_c:,.0f}")
 
         # Top debt contributors
         output.append("\n\nTop 10 Debt Contributors:")
-        sorted_debts = sorted(
-            self.architectural_debts, key=lambda x: x.estimated_cost_usd, reverse=True
-        )[:10]
+        sorted_debts = heapq.nlargest(
+            10, self.architectural_debts, key=attrgetter("estimated_cost_usd")
+        )
 
         for i, debt in enumerate(sorted_debts, 1):
             cost_bar_length = int((debt.estimated_cost_usd / total_cost) * 50)
-            cost_bar = "▓" * cost_bar_length
+            cost_bar = (
+                _COST_BAR[:cost_bar_length]
+                if 0 <= cost_bar_length <= _BAR_WIDTH
+                else "▓" * cost_bar_length
+            )
 
             output.append(f"\n  {i}. {debt.file_path}")
             output.append(f"     {cost_bar} ${debt.estimated_cost_usd:,.0f}")
@@ -1196,41 +2092,29 @@ class LegacyCodeMapper:
 </html>"""
 
         # Generate clusters HTML
-        clusters_html = ""
+        clusters_parts = []
         for dimension in ["Love", "Justice", "Power", "Wisdom"]:
             if dimension in viz_data["clusters"]:
                 files = viz_data["clusters"][dimension]
-                clusters_html += (
+                clusters_parts.append(
                     f"<div class='cluster'><h3>{dimension} Cluster ({len(files)} files)</h3>"
                 )
 
+                dim_class = dimension.lower()
                 for file_data in files[:5]:  # Top 5
-                    clusters_html += f"""
-                    <div class='file-card {dimension.lower()}'>
-                        <strong>{file_data['path']}</strong><br>
-                        <span class='coords'>L:{file_data['coordinates']['L']:.2f} J:{file_data['coordinates']['J']:.2f} P:{file_data['coordinates']['P']:.2f} W:{file_data['coordinates']['W']:.2f}</span><br>
-                        <span class='disharmony'>Disharmony: {file_data['disharmony']:.2f}</span> | Functions: {file_data['function_count']}
-                    </div>
-                    """
+                    clusters_parts.append(_html_file_card(_HTML_CLUSTER_CARD, dim_class, file_data))
 
                 if len(files) > 5:
-                    clusters_html += f"<p>... and {len(files) - 5} more files</p>"
+                    clusters_parts.append(f"<p>... and {len(files) - 5} more files</p>")
 
-                clusters_html += "</div>"
+                clusters_parts.append("</div>")
+        clusters_html = "".join(clusters_parts)
 
         # Generate files HTML
-        files_html = ""
-        for file_data in sorted(viz_data["files"], key=lambda x: x["disharmony"], reverse=True)[
-            :20
-        ]:
-            dim_class = file_data["dominant"].lower()
-            files_html += f"""
-            <div class='file-card {dim_class}'>
-                <strong>{file_data['path']}</strong><br>
-                <span class='coords'>L:{file_data['coordinates']['L']:.2f} J:{file_data['coordinates']['J']:.2f} P:{file_data['coordinates']['P']:.2f} W:{file_data['coordinates']['W']:.2f}</span><br>
-                <span class='disharmony'>Disharmony: {file_data['disharmony']:.2f}</span> | Functions: {file_data['function_count']} | Dominant: {file_data['dominant']}
-            </div>
-            """
+        files_html = "".join(
+            _html_file_card(_HTML_FILE_CARD, file_data["dominant"].lower(), file_data)
+            for file_data in heapq.nlargest(20, viz_data["files"], key=itemgetter("disharmony"))
+        )
 
         # Fill template
         html_content = html_template.format(
@@ -1243,10 +2127,10 @@ class LegacyCodeMapper:
             files_html=files_html,
         )
 
-        # Write file
+        # Write file: encode once and write the bytes directly, skipping the text layer
         output_file = os.path.join(self.codebase_path, output_path)
-        with open(output_file, "w") as f:
-            f.write(html_content)
+        with open(output_file, "wb") as f:
+            f.write(html_content.encode("utf-8"))
 
         if not self.quiet:
             print(f"✅ Exported interactive visualization to {output_file}")
@@ -1255,53 +2139,58 @@ class LegacyCodeMapper:
 
     def print_report(self, report: Dict, show_heatmap: bool = True, show_smells: bool = True):
         """Print comprehensive human-readable report"""
-        print("\n")
-        print("=" * 70)
-        print("SEMANTIC CODEBASE MAP - COMPREHENSIVE ANALYSIS")
-        print("=" * 70)
+        # One write for the whole report rather than a locked, flushed print per line
+        sys.stdout.write(self.format_report(report, show_heatmap, show_smells))
+
+    def format_report(
+        self, report: Dict, show_heatmap: bool = True, show_smells: bool = True
+    ) -> str:
+        """Render the comprehensive human-readable report printed by print_report"""
+        lines = []
+        out = lines.append
+
+        out("\n")
+        out("=" * 70)
+        out("SEMANTIC CODEBASE MAP - COMPREHENSIVE ANALYSIS")
+        out("=" * 70)
 
         # Clusters
         clusters = report["clusters"]
-        for dimension in ["Love", "Justice", "Power", "Wisdom"]:
+        centroids = report.get("cluster_centroids", {})
+        for dimension, icon in zip(_DIMENSION_NAMES, _DIMENSION_ICONS):
             if dimension not in clusters or not clusters[dimension]:
                 continue
 
             files = clusters[dimension]
-            avg_l = mean([f.coordinates[0] for f in files])
-            avg_j = mean([f.coordinates[1] for f in files])
-            avg_p = mean([f.coordinates[2] for f in files])
-            avg_w = mean([f.coordinates[3] for f in files])
-
-            icon = {"Love": "💛", "Justice": "⚖️", "Power": "⚡", "Wisdom": "📚"}[dimension]
-
-            print(f"\n{icon} {dimension.upper()} CLUSTER ({len(files)} files)")
-            print(f"   Avg Coordinates: L={avg_l:.2f}, J={avg_j:.2f}, P={avg_p:.2f}, W={avg_w:.2f}")
-            print("   Files:")
-
-            sorted_files = sorted(files, key=lambda f: f.avg_disharmony, reverse=True)
-            for file in sorted_files[:5]:
-                rel_path = os.path.relpath(file.path, self.codebase_path)
-                print(
-                    f"     - {rel_path:40s} "
-                    f"({file.function_count:2d} funcs, disharmony: {file.avg_disharmony:.2f})"
-                )
+            if dimension in centroids:
+                avg_l, avg_j, avg_p, avg_w = centroids[dimension]
+            else:
+                coords = np.array([f.coordinates for f in files], dtype=np.float64)
+                avg_l, avg_j, avg_p, avg_w = coords.mean(axis=0).tolist()
+
+            out(f"\n{icon} {dimension.upper()} CLUSTER ({len(files)} files)")
+            out(f"   Avg Coordinates: L={avg_l:.2f}, J={avg_j:.2f}, P={avg_p:.2f}, W={avg_w:.2f}")
+            out("   Files:")
+
+            for file in heapq.nlargest(5, files, key=attrgetter("avg_disharmony")):
+                rel_path = self._rel_path(file.path)
+                out(_CLUSTER_FILE_LINE % (rel_path, file.function_count, file.avg_disharmony))
 
             if len(files) > 5:
-                print(f"     ... and {len(files) - 5} more")
+                out(f"     ... and {len(files) - 5} more")
 
         # Outliers
         outliers = report["outliers"]
         if outliers:
-            print(f"\n⚠️  OUTLIERS - Semantically Unclear ({len(outliers)} files)")
+            out(f"\n⚠️  OUTLIERS - Semantically Unclear ({len(outliers)} files)")
             for file in outliers[:3]:
-                rel_path = os.path.relpath(file.path, self.codebase_path)
-                l, j, p, w = file.coordinates
-                print(f"     - {rel_path:40s} L={l:.2f} J={j:.2f} P={p:.2f} W={w:.2f}")
+                rel_path = self._rel_path(file.path)
+                out(_OUTLIER_LINE % (rel_path, *file.coordinates))
 
         # Overall metrics
-        print("\n📊 OVERALL METRICS")
-        print(f"   Total files analyzed: {report['total_files']}")
-        print(f"   Average disharmony: {report['overall_disharmony']:.2f}")
+        out("\n📊 OVERALL METRICS")
+        out(f"   Total files analyzed: {report['total_files']}")
+        out(f"   Average disharmony: {report['overall_disharmony']:.2f}")
 
         avg_dis = report["overall_disharmony"]
         if avg_dis < 0.3:
@@ -1313,12 +2202,12 @@ class LegacyCodeMapper:
         else:
             health = "CONCERNING 🚨"
 
-        print(f"   Codebase health: {health}")
+        out(f"   Codebase health: {health}")
 
         # Architectural smells
         if show_smells and self.architectural_smells:
-            print(f"\n🚨 ARCHITECTURAL SMELLS ({len(self.architectural_smells)} detected)")
-            print("=" * 70)
+            out(f"\n🚨 ARCHITECTURAL SMELLS ({len(self.architectural_smells)} detected)")
+            out("=" * 70)
 
             # Group by severity
             by_severity = defaultdict(list)
@@ -1330,126 +2219,126 @@ class LegacyCodeMapper:
                 if not smells:
                     continue
 
-                print(f"\n{severity} ({len(smells)} issues):")
+                out(f"\n{severity} ({len(smells)} issues):")
                 for smell in smells[:3]:  # Top 3 per severity
-                    print(f"  • {smell.smell_type}: {smell.file_path}")
-                    print(f"    {smell.description}")
-                    print(f"    → {smell.recommendation}")
+                    out(
+                        _SMELL_LINES
+                        % (
+                            smell.smell_type,
+                            smell.file_path,
+                            smell.description,
+                            smell.recommendation,
+                        )
+                    )
 
                 if len(smells) > 3:
-                    print(f"  ... and {len(smells) - 3} more {severity} issues")
+                    out(f"  ... and {len(smells) - 3} more {severity} issues")
 
         # Refactoring opportunities
         if self.refactoring_opportunities:
-            print("\n💡 REFACTORING OPPORTUNITIES (Top 5)")
-            print("=" * 70)
+            out("\n💡 REFACTORING OPPORTUNITIES (Top 5)")
+            out("=" * 70)
 
-            top_opportunities = sorted(
-                self.refactoring_opportunities,
-                key=lambda x: x.impact_score,
-                reverse=True,
-            )[:5]
+            top_opportunities = heapq.nlargest(
+                5, self.refactoring_opportunities, key=attrgetter("impact_score")
+            )
 
             for i, opp in enumerate(top_opportunities, 1):
-                print(f"\n{i}. {opp.file_path}")
-                print(
+                out(f"\n{i}. {opp.file_path}")
+                out(
                     f"   Impact: {opp.impact_score:.0%} | Complexity reduction: {opp.complexity_reduction}%"
                 )
-                print(f"   {opp.description}")
+                out(f"   {opp.description}")
                 if opp.suggested_actions:
-                    print("   Actions:")
+                    out("   Actions:")
                     for action in opp.suggested_actions:
-                        print(f"     → {action}")
+                        out(f"     → {action}")
 
         # Git History & Semantic Drift
         if self.semantic_drifts:
-            print(f"\n🕒 SEMANTIC DRIFT ANALYSIS ({len(self.semantic_drifts)} files)")
-            print("=" * 70)
+            out(f"\n🕒 SEMANTIC DRIFT ANALYSIS ({len(self.semantic_drifts)} files)")
+            out("=" * 70)
 
             # Show top 5 most volatile files
-            volatile_files = sorted(
-                self.semantic_drifts, key=lambda x: x.total_drift, reverse=True
-            )[:5]
+            volatile_files = heapq.nlargest(5, self.semantic_drifts, key=attrgetter("total_drift"))
 
             for drift in volatile_files:
-                print(f"\n{drift.file_path}")
-                print(
+                out(f"\n{drift.file_path}")
+                out(
                     f"   Time span: {drift.time_span_days} days ({drift.first_commit}..{drift.last_commit})"
                 )
-                print(
+                out(
                     f"   Total drift: {drift.total_drift:.3f} | Stability: {drift.stability_score:.0%}"
                 )
-                print(
+                out(
                     f"   Dimension changes: L{drift.dimension_drifts['L']:+.2f} J{drift.dimension_drifts['J']:+.2f} P{drift.dimension_drifts['P']:+.2f} W{drift.dimension_drifts['W']:+.2f}"
                 )
 
                 if drift.stability_score < 0.3:
-                    print("   ⚠️  HIGH VOLATILITY - Semantics changed significantly")
+                    out("   ⚠️  HIGH VOLATILITY - Semantics changed significantly")
                 elif drift.stability_score < 0.7:
-                    print("   ⚠️  Moderate volatility - Consider stabilizing")
+                    out("   ⚠️  Moderate volatility - Consider stabilizing")
 
         # Architecture Documentation Alignment
         if self.architecture_docs:
-            print(f"\n📖 ARCHITECTURE DOCS VS REALITY ({len(self.architecture_docs)} components)")
-            print("=" * 70)
+            out(f"\n📖 ARCHITECTURE DOCS VS REALITY ({len(self.architecture_docs)} components)")
+            out("=" * 70)
 
             # Show misalignments
             misaligned = [doc for doc in self.architecture_docs if doc.alignment_score < 0.7]
 
             if misaligned:
-                print(f"\n⚠️  {len(misaligned)} components have docs/reality mismatch:")
+                out(f"\n⚠️  {len(misaligned)} components have docs/reality mismatch:")
                 for doc in misaligned[:5]:
-                    print(f"\n  {doc.component_name} (alignment: {doc.alignment_score:.0%})")
-                    print(f"    Documented: {doc.documented_purpose}")
+                    out(f"\n  {doc.component_name} (alignment: {doc.alignment_score:.0%})")
+                    out(f"    Documented: {doc.documented_purpose}")
                     if doc.discrepancies:
                         for disc in doc.discrepancies[:2]:
-                            print(f"    ⚠️  {disc}")
+                            out(f"    ⚠️  {disc}")
             else:
-                print("✅ All documented components align with implementation")
+                out("✅ All documented components align with implementation")
 
         # Architectural Debt
         if self.architectural_debts:
-            print("\n💰 ARCHITECTURAL DEBT ESTIMATION")
-            print("=" * 70)
+            out("\n💰 ARCHITECTURAL DEBT ESTIMATION")
+            out("=" * 70)
 
-            total_hours = sum(d.estimated_hours for d in self.architectural_debts)
-            total_cost = sum(d.estimated_cost_usd for d in self.architectural_debts)
+            table = self._debt_table()
+            total_hours, total_cost = table.totals()
 
-            print(f"\nTotal Estimated Debt: {total_hours:.1f} hours (${total_cost:,.0f})")
+            out(f"\nTotal Estimated Debt: {total_hours:.1f} hours (${total_cost:,.0f})")
 
-            # Group by priority
-            by_priority = defaultdict(list)
-            for debt in self.architectural_debts:
-                by_priority[debt.priority].append(debt)
-
-            for priority in ["CRITICAL", "HIGH", "MEDIUM", "LOW"]:
-                debts = by_priority.get(priority, [])
-                if not debts:
+            # Group by priority, most severe first
+            for code in reversed(range(len(_DEBT_PRIORITIES))):
+                rows = np.flatnonzero(table.priority == code)
+                if not len(rows):
                     continue
+                priority = _DEBT_PRIORITIES[code]
+                debts = [table.debts[i] for i in rows.tolist()]
+                priority_hours, priority_cost = table.totals(rows)
 
-                priority_hours = sum(d.estimated_hours for d in debts)
-                priority_cost = sum(d.estimated_cost_usd for d in debts)
-
-                print(
+                out(
                     f"\n{priority} ({len(debts)} files) - {priority_hours:.1f}hrs (${priority_cost:,.0f}):"
                 )
 
-                for debt in sorted(debts, key=lambda x: x.estimated_cost_usd, reverse=True)[:3]:
-                    print(f"  • {debt.file_path}")
-                    print(f"    Type: {debt.debt_type}")
-                    print(
+                for debt in heapq.nlargest(3, debts, key=attrgetter("estimated_cost_usd")):
+                    out(f"  • {debt.file_path}")
+                    out(f"    Type: {debt.debt_type}")
+                    out(
                         f"    Cost: {debt.estimated_hours:.1f}hrs (${debt.estimated_cost_usd:,.0f})"
                     )
-                    print(f"    {debt.description}")
+                    out(f"    {debt.description}")
 
                 if len(debts) > 3:
-                    print(f"  ... and {len(debts) - 3} more {priority} priority items")
+                    out(f"  ... and {len(debts) - 3} more {priority} priority items")
 
         # Heatmap
         if show_heatmap:
-            print(self.generate_complexity_heatmap())
+            out(self.generate_complexity_heatmap())
+
+        out("\n" + "=" * 70)
 
-        print("\n" + "=" * 70)
+        return "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
@@ -1503,6 +2392,11 @@ if __name__ == "__main__":
         "--full", action="store_true", help="Enable all analysis features (default)"
     )
     parser.add_argument("--quiet", action="store_true", help="Minimal output")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse unchanged files' results from the per-user cache (~/.cache/harmonizer)",
+    )
 
     args = parser.parse_args()
 
@@ -1515,12 +2409,13 @@ if __name__ == "__main__":
         enable_git = enable_docs = enable_debt = True
 
     # Create mapper and run base analysis
-    mapper = LegacyCodeMapper(args.path, quiet=args.quiet)
+    mapper = LegacyCodeMapper(args.path, quiet=args.quiet, use_cache=args.cache)
     report = mapper.analyze_codebase(show_progress=not args.quiet)
 
     # Advanced analyses
     if enable_git:
         mapper.analyze_git_history(max_commits=args.git_commits, show_progress=not args.quiet)
+    mapper.close()
 
     if enable_docs:
         mapper.analyze_architecture_docs(docs_path=args.docs_path)
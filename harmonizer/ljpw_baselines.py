@@ -10,13 +10,38 @@ Includes both static analysis and a validated, non-linear dynamic simulator.
 Based on: docs/LJPW Mathematical Baselines Reference V4.md
 """
 
+import bisect
 import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+# Try to import numba for JIT-compiled numeric kernels
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _jit(func):
+    """Compile a scalar kernel with numba when available, else keep the Python function"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+@_jit
+def _real_pow(base, exponent):
+    """
+    base ** exponent as a float, NaN where Python would return a complex number.
+
+    Compiled kernels and NumPy already give NaN for a negative base with a
+    fractional exponent; this keeps the pure-Python fallback in line with them.
+    """
+    if base < 0.0 and exponent != math.floor(exponent):
+        return math.nan
+    return base**exponent
+
 
 @dataclass
 class NumericalEquivalents:
@@ -41,15 +66,321 @@ class ReferencePoints:
     )
 
 
+_NE_L, _NE_J, _NE_P, _NE_W = ReferencePoints.NATURAL_EQUILIBRIUM
+_NE_ARRAY = np.array(ReferencePoints.NATURAL_EQUILIBRIUM)
+_ANCHOR_ARRAY = np.array(ReferencePoints.ANCHOR_POINT)
+# Scale-invariant Natural Equilibrium proportions, relative to Justice
+_NE_RATIOS = {"L/J": _NE_L / _NE_J, "P/J": _NE_P / _NE_J, "W/J": _NE_W / _NE_J}
+_NE_RATIO_ARRAY = np.array(list(_NE_RATIOS.values()))
+
+# Interpretation bands: a value gets the label after the last threshold it reaches
+_NE_DISTANCE_THRESHOLDS = (0.2, 0.5, 0.8)
+_NE_DISTANCE_LABELS = (
+    "Near-optimal balance",
+    "Good but improvable",
+    "Moderate imbalance",
+    "Significant dysfunction",
+)
+_COMPOSITE_THRESHOLDS = (0.5, 0.7, 0.9, 1.1, 1.3)
+_COMPOSITE_LABELS = (
+    "Critical - multiple dimensions failing",
+    "Struggling - functional but inefficient",
+    "Competent - solid baseline performance",
+    "Strong - above-average effectiveness",
+    "Excellent - high-performing, growth active",
+    "Elite - exceptional, Love multiplier engaged",
+)
+
+# Love's coupling onto Justice, Power and Wisdom (COUPLING_MATRIX LJ, LP, LW)
+_KAPPA_LJ, _KAPPA_LP, _KAPPA_LW = 1.4, 1.3, 1.5
+# Love amplification per (L, J, P, W) column; Love itself is not amplified
+_LOVE_AMPLIFICATION = np.array([0.0, _KAPPA_LJ, _KAPPA_LP, _KAPPA_LW])
+
+
+@_jit
+def _effective_jpw(L, J, P, W):
+    """Justice, Power and Wisdom amplified by Love through the coupling constants"""
+    return J * (1 + _KAPPA_LJ * L), P * (1 + _KAPPA_LP * L), W * (1 + _KAPPA_LW * L)
+
+
+@_jit
+def _ne_distance(L, J, P, W):
+    """Euclidean distance from Natural Equilibrium"""
+    return math.sqrt((_NE_L - L) ** 2 + (_NE_J - J) ** 2 + (_NE_P - P) ** 2 + (_NE_W - W) ** 2)
+
+
+@_jit
+def _anchor_distance(L, J, P, W):
+    """Euclidean distance from the Anchor Point (1, 1, 1, 1)"""
+    return math.sqrt((1 - L) ** 2 + (1 - J) ** 2 + (1 - P) ** 2 + (1 - W) ** 2)
+
+
+@_jit
+def _ljpw_metrics(L, J, P, W):
+    """
+    Harmonic mean, geometric mean, coupling-aware sum, harmony index and composite
+    score in one pass, with the same operations as the individual LJPWBaselines methods.
+
+    The intermediates full_diagnostic also reports (distance from Anchor and the
+    effective J, P, W) follow, so nothing is computed twice.
+    """
+    if L <= 0 or J <= 0 or P <= 0 or W <= 0:
+        harmonic = 0.0
+    else:
+        harmonic = 4.0 / (1 / L + 1 / J + 1 / P + 1 / W)
+    geometric = _real_pow(L * J * P * W, 0.25)
+    J_eff, P_eff, W_eff = _effective_jpw(L, J, P, W)
+    growth = 0.35 * L + 0.25 * J_eff + 0.20 * P_eff + 0.20 * W_eff
+    d_anchor = _anchor_distance(L, J, P, W)
+    harmony = 1.0 / (1.0 + d_anchor)
+    composite = 0.35 * growth + 0.25 * geometric + 0.25 * harmonic + 0.15 * harmony
+    return harmonic, geometric, growth, harmony, composite, d_anchor, J_eff, P_eff, W_eff
+
+
+@_jit
+def _ljpw_metrics_rows(coords):
+    """_ljpw_metrics for every row of an (N, 4) array, as an (N, 9) array"""
+    out = np.empty((coords.shape[0], 9))
+    for i in range(coords.shape[0]):
+        metrics = _ljpw_metrics(coords[i, 0], coords[i, 1], coords[i, 2], coords[i, 3])
+        for k in range(9):
+            out[i, k] = metrics[k]
+    return out
+
+
+def _ljpw_metrics_batch(coords):
+    """
+    Array form of _ljpw_metrics over an (N, 4) float64 array.
+
+    With numba, the fused scalar kernel runs over the rows in a single compiled
+    pass, with no temporaries; otherwise each metric is one NumPy pass.
+
+    Returns the same nine columns, each an array of N values.
+    """
+    if njit is not None:
+        return tuple(_ljpw_metrics_rows(np.ascontiguousarray(coords)).T)
+
+    L = coords[:, 0]
+    _, J_eff, P_eff, W_eff = LJPWBaselines.effective_dimensions_batch(coords).T
+
+    harmonic = LJPWBaselines.harmonic_mean_batch(coords)
+    geometric = LJPWBaselines.geometric_mean_batch(coords)
+    growth = 0.35 * L + 0.25 * J_eff + 0.20 * P_eff + 0.20 * W_eff
+    d_anchor = np.linalg.norm(coords - _ANCHOR_ARRAY, axis=1)
+    harmony = 1.0 / (1.0 + d_anchor)
+    composite = 0.35 * growth + 0.25 * geometric + 0.25 * harmonic + 0.15 * harmony
+    return harmonic, geometric, growth, harmony, composite, d_anchor, J_eff, P_eff, W_eff
+
+
+# A codebase has few distinct coordinate profiles (functions sharing a keyword mix
+# score identically), so the scalar metrics are memoized on the exact inputs.
+# Keys are not rounded: cached results are the ones the kernel would return.
+_cached_ljpw_metrics = lru_cache(maxsize=8192)(_ljpw_metrics)
+
+
+@_jit
+def _v4_derivatives(L, J, P, W, c):
+    """
+    LJPW v4.0 derivatives for a scalar state.
+
+    ``c`` holds the calibrated coefficients in DynamicLJPWv4._KERNEL_PARAMS order,
+    followed by the run-constant Hill threshold K_JP ** n_JP.
+    """
+    (
+        a_LJ,
+        a_LW,
+        a_JL,
+        a_JW,
+        a_PL,
+        a_PJ,
+        a_WL,
+        a_WJ,
+        a_WP,
+        b_L,
+        b_J,
+        b_P,
+        b_W,
+        K_JL,
+        gamma_JP,
+        n_JP,
+        K_JP_n,
+    ) = c
+
+    dL_dt = a_LJ * J + a_LW * W - b_L * L
+
+    L_effect_on_J = a_JL * (L / (K_JL + L))
+    P_n = _real_pow(P, n_JP)
+    P_effect_on_J = gamma_JP * (P_n / (K_JP_n + P_n)) * max(0.0, 1.0 - W)
+    dJ_dt = L_effect_on_J + a_JW * W - P_effect_on_J - b_J * J
+
+    dP_dt = a_PL * L + a_PJ * J - b_P * P
+    dW_dt = a_WL * L + a_WJ * J + a_WP * P - b_W * W
+    return dL_dt, dJ_dt, dP_dt, dW_dt
+
+
+@_jit
+def _v4_rk4_step(L, J, P, W, dt, c):
+    """One clipped RK4 step of the v4.0 model, in the same operation order as the array form"""
+    h = 0.5 * dt
+    k1L, k1J, k1P, k1W = _v4_derivatives(L, J, P, W, c)
+    k2L, k2J, k2P, k2W = _v4_derivatives(L + h * k1L, J + h * k1J, P + h * k1P, W + h * k1W, c)
+    k3L, k3J, k3P, k3W = _v4_derivatives(L + h * k2L, J + h * k2J, P + h * k2P, W + h * k2W, c)
+    k4L, k4J, k4P, k4W = _v4_derivatives(L + dt * k3L, J + dt * k3J, P + dt * k3P, W + dt * k3W, c)
+    s = dt / 6.0
+    L = L + s * (k1L + 2 * k2L + 2 * k3L + k4L)
+    J = J + s * (k1J + 2 * k2J + 2 * k3J + k4J)
+    P = P + s * (k1P + 2 * k2P + 2 * k3P + k4P)
+    W = W + s * (k1W + 2 * k2W + 2 * k3W + k4W)
+    return (
+        min(max(L, 0.0), 1.5),
+        min(max(J, 0.0), 1.5),
+        min(max(P, 0.0), 1.5),
+        min(max(W, 0.0), 1.5),
+    )
+
+
+@_jit
+def _v4_trajectory(L, J, P, W, steps, dt, c):
+    """
+    Run ``steps`` RK4 steps from (L, J, P, W).
+
+    Returns:
+        Array of shape (steps + 1, 4), the initial state followed by each step's state
+    """
+    out = np.empty((steps + 1, 4))
+    out[0, 0], out[0, 1], out[0, 2], out[0, 3] = L, J, P, W
+    for i in range(1, steps + 1):
+        L, J, P, W = _v4_rk4_step(L, J, P, W, dt, c)
+        out[i, 0], out[i, 1], out[i, 2], out[i, 3] = L, J, P, W
+    return out
+
+
+@_jit
+def _v4_rhs(y, c):
+    """
+    _v4_derivatives on a state array, held within the [0, 1.5] clamp.
+
+    A dimension sitting on a bound does not move further past it, matching the
+    per-step clamping of the fixed-step kernel.
+    """
+    y = np.minimum(np.maximum(y, 0.0), 1.5)
+    dy = np.array(_v4_derivatives(y[0], y[1], y[2], y[3], c))
+    return np.where(((y >= 1.5) & (dy > 0.0)) | ((y <= 0.0) & (dy < 0.0)), 0.0, dy)
+
+
+@_jit
+def _v4_trajectory_adaptive(L, J, P, W, steps, dt, c, rtol, atol):
+    """
+    Integrate the v4.0 model with adaptive Dormand-Prince RK4(5) steps.
+
+    Steps grow as the system settles towards equilibrium, so far fewer derivative
+    evaluations are needed than at a fixed ``dt``. Each accepted step is clamped
+    to [0, 1.5] like the fixed-step kernel; the output grid is filled by cubic
+    Hermite interpolation between accepted steps.
+
+    Returns:
+        Array of shape (steps + 1, 4), the state at t = 0, dt, ..., steps * dt
+    """
+    out = np.empty((steps + 1, 4))
+    y = np.array((L, J, P, W))
+    out[0] = y
+    t_end = steps * dt
+    t = 0.0
+    h = dt
+    k1 = _v4_rhs(y, c)
+    i = 1
+    while i <= steps:
+        last = h >= t_end - t
+        if last:
+            h = t_end - t
+        k2 = _v4_rhs(y + h * (k1 / 5.0), c)
+        k3 = _v4_rhs(y + h * (3.0 / 40.0 * k1 + 9.0 / 40.0 * k2), c)
+        k4 = _v4_rhs(y + h * (44.0 / 45.0 * k1 - 56.0 / 15.0 * k2 + 32.0 / 9.0 * k3), c)
+        k5 = _v4_rhs(
+            y
+            + h
+            * (
+                19372.0 / 6561.0 * k1
+                - 25360.0 / 2187.0 * k2
+                + 64448.0 / 6561.0 * k3
+                - 212.0 / 729.0 * k4
+            ),
+            c,
+        )
+        k6 = _v4_rhs(
+            y
+            + h
+            * (
+                9017.0 / 3168.0 * k1
+                - 355.0 / 33.0 * k2
+                + 46732.0 / 5247.0 * k3
+                + 49.0 / 176.0 * k4
+                - 5103.0 / 18656.0 * k5
+            ),
+            c,
+        )
+        y_new = y + h * (
+            35.0 / 384.0 * k1
+            + 500.0 / 1113.0 * k3
+            + 125.0 / 192.0 * k4
+            - 2187.0 / 6784.0 * k5
+            + 11.0 / 84.0 * k6
+        )
+        k7 = _v4_rhs(y_new, c)
+
+        # Difference between the embedded 5th- and 4th-order solutions
+        err_vec = h * (
+            71.0 / 57600.0 * k1
+            - 71.0 / 16695.0 * k3
+            + 71.0 / 1920.0 * k4
+            - 17253.0 / 339200.0 * k5
+            + 22.0 / 525.0 * k6
+            - 1.0 / 40.0 * k7
+        )
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err = math.sqrt(np.mean((err_vec / scale) ** 2))
+
+        if err <= 1.0:
+            t_new = t_end if last else t + h
+            clamped = np.minimum(np.maximum(y_new, 0.0), 1.5)
+            if np.any(clamped != y_new):
+                y_new = clamped
+                k7 = _v4_rhs(y_new, c)
+            # Fill every output point inside this step at once
+            j = i
+            while j <= steps and (last or j * dt <= t_new):
+                j += 1
+            if j > i:
+                s = np.minimum((np.arange(i, j) * dt - t) / h, 1.0)
+                s2 = s * s
+                s3 = s2 * s
+                rows = (
+                    np.outer(2.0 * s3 - 3.0 * s2 + 1.0, y)
+                    + np.outer((s3 - 2.0 * s2 + s) * h, k1)
+                    + np.outer(3.0 * s2 - 2.0 * s3, y_new)
+                    + np.outer((s3 - s2) * h, k7)
+                )
+                out[i:j] = np.minimum(np.maximum(rows, 0.0), 1.5)
+                i = j
+            t = t_new
+            y = y_new
+            k1 = k7
+
+        # Standard step-size controller for a 5th-order method
+        factor = 10.0 if err == 0.0 else min(10.0, max(0.2, 0.9 * err**-0.2))
+        h *= factor
+    return out
+
+
 class LJPWBaselines:
     """LJPW mathematical baselines and calculations (Static Analysis)"""
 
     # Coupling matrix - Love amplifies other dimensions
     COUPLING_MATRIX = {
         "LL": 1.0,
-        "LJ": 1.4,
-        "LP": 1.3,
-        "LW": 1.5,
+        "LJ": _KAPPA_LJ,
+        "LP": _KAPPA_LP,
+        "LW": _KAPPA_LW,
         "JL": 0.9,
         "JJ": 1.0,
         "JP": 0.7,
@@ -63,6 +394,9 @@ class LJPWBaselines:
         "WP": 1.0,
         "WW": 1.0,
     }
+    # The same coefficients as a dense array; row = giver, column = receiver, in
+    # L, J, P, W order (the dict is laid out row-major)
+    COUPLING_ARRAY = np.array(list(COUPLING_MATRIX.values())).reshape(4, 4)
 
     @staticmethod
     def effective_dimensions(L: float, J: float, P: float, W: float) -> Dict[str, float]:
@@ -80,13 +414,31 @@ class LJPWBaselines:
         Returns:
             Dict with effective_L, effective_J, effective_P, effective_W
         """
+        # Kept a dict for callers that index by key; bulk callers should use
+        # effective_dimensions_batch, and the metric kernels inline these products
+        J_eff, P_eff, W_eff = _effective_jpw(L, J, P, W)
         return {
             "effective_L": L,  # Love is the source, not amplified
-            "effective_J": J * (1 + 1.4 * L),  # Justice amplified by Love
-            "effective_P": P * (1 + 1.3 * L),  # Power amplified by Love
-            "effective_W": W * (1 + 1.5 * L),  # Wisdom amplified by Love (strongest)
+            "effective_J": J_eff,  # Justice amplified by Love
+            "effective_P": P_eff,  # Power amplified by Love
+            "effective_W": W_eff,  # Wisdom amplified by Love (strongest)
         }
 
+    @staticmethod
+    def effective_dimensions_batch(coords: np.ndarray) -> np.ndarray:
+        """
+        Vectorized effective_dimensions for many systems at once.
+
+        Args:
+            coords: Array of shape (N, 4) holding L, J, P, W per row
+
+        Returns:
+            Array of shape (N, 4) whose columns are effective_L, effective_J,
+            effective_P and effective_W, as keyed in effective_dimensions
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return coords * (1 + _LOVE_AMPLIFICATION * coords[:, :1])
+
     @staticmethod
     def harmonic_mean(L: float, J: float, P: float, W: float) -> float:
         """
@@ -102,6 +454,15 @@ class LJPWBaselines:
             return 0.0
         return 4.0 / (1 / L + 1 / J + 1 / P + 1 / W)
 
+    @staticmethod
+    def harmonic_mean_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized harmonic_mean over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        # 0.0 wherever any dimension is non-positive, as in the scalar form
+        positive = (coords > 0).all(axis=1)
+        with np.errstate(divide="ignore"):
+            return np.where(positive, 4.0 / (1.0 / coords).sum(axis=1), 0.0)
+
     @staticmethod
     def geometric_mean(L: float, J: float, P: float, W: float) -> float:
         """
@@ -113,10 +474,20 @@ class LJPWBaselines:
         Returns:
             Geometric mean (0.0 to 1.0)
         """
-        return (L * J * P * W) ** 0.25
+        # Kept as ** 0.25 rather than sqrt(sqrt(x)): no faster in CPython or NumPy,
+        # the double rounding changes the last bit, and sqrt rejects negative products
+        return _real_pow(L * J * P * W, 0.25)
+
+    @staticmethod
+    def geometric_mean_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized geometric_mean over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return coords.prod(axis=1) ** 0.25
 
     @staticmethod
-    def coupling_aware_sum(L: float, J: float, P: float, W: float) -> float:
+    def coupling_aware_sum(
+        L: float, J: float, P: float, W: float, eff: Optional[Dict[str, float]] = None
+    ) -> float:
         """
         Coupling-aware weighted sum - growth potential.
 
@@ -125,14 +496,26 @@ class LJPWBaselines:
 
         Use for: Growth potential, scalability, future performance.
 
+        Args:
+            L, J, P, W: Dimension values
+            eff: effective_dimensions(L, J, P, W), if the caller already has it
+
         Returns:
             Weighted sum (can exceed 1.0)
         """
-        J_eff = J * (1 + 1.4 * L)
-        P_eff = P * (1 + 1.3 * L)
-        W_eff = W * (1 + 1.5 * L)
+        if eff is None:
+            J_eff, P_eff, W_eff = _effective_jpw(L, J, P, W)
+        else:
+            J_eff, P_eff, W_eff = eff["effective_J"], eff["effective_P"], eff["effective_W"]
         return 0.35 * L + 0.25 * J_eff + 0.20 * P_eff + 0.20 * W_eff
 
+    @staticmethod
+    def coupling_aware_sum_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized coupling_aware_sum over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        _, J_eff, P_eff, W_eff = LJPWBaselines.effective_dimensions_batch(coords).T
+        return 0.35 * coords[:, 0] + 0.25 * J_eff + 0.20 * P_eff + 0.20 * W_eff
+
     @staticmethod
     def harmony_index(L: float, J: float, P: float, W: float) -> float:
         """
@@ -144,8 +527,21 @@ class LJPWBaselines:
         Returns:
             Harmony index (0.0 to 1.0, asymptotic to 1.0)
         """
-        d_anchor = math.sqrt((1 - L) ** 2 + (1 - J) ** 2 + (1 - P) ** 2 + (1 - W) ** 2)
-        return 1.0 / (1.0 + d_anchor)
+        return 1.0 / (1.0 + _anchor_distance(L, J, P, W))
+
+    @staticmethod
+    def harmony_index_batch(coords: np.ndarray) -> np.ndarray:
+        """
+        Vectorized harmony_index for many systems at once.
+
+        Args:
+            coords: Array of shape (N, 4) holding L, J, P, W per row
+
+        Returns:
+            Array of N harmony indices
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return 1.0 / (1.0 + LJPWBaselines.distance_from_anchor_batch(coords))
 
     @staticmethod
     def composite_score(L: float, J: float, P: float, W: float) -> float:
@@ -161,13 +557,26 @@ class LJPWBaselines:
         Returns:
             Composite score (typically 0.5 to 1.3)
         """
-        baselines = LJPWBaselines
-        growth = baselines.coupling_aware_sum(L, J, P, W)
-        effectiveness = baselines.geometric_mean(L, J, P, W)
-        robustness = baselines.harmonic_mean(L, J, P, W)
-        harmony = baselines.harmony_index(L, J, P, W)
+        return _cached_ljpw_metrics(L, J, P, W)[4]
+
+    @staticmethod
+    def composite_score_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized composite_score over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return _ljpw_metrics_batch(coords)[4]
+
+    @staticmethod
+    def core_metrics(
+        L: float, J: float, P: float, W: float
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        All headline metrics from a single fused calculation.
 
-        return 0.35 * growth + 0.25 * effectiveness + 0.25 * robustness + 0.15 * harmony
+        Returns:
+            (harmonic_mean, geometric_mean, coupling_aware_sum, harmony_index,
+            composite_score), identical to calling each method separately
+        """
+        return _cached_ljpw_metrics(L, J, P, W)[:5]
 
     @staticmethod
     def distance_from_anchor(L: float, J: float, P: float, W: float) -> float:
@@ -180,7 +589,7 @@ class LJPWBaselines:
         Returns:
             Distance (0.0 to ~2.0)
         """
-        return math.sqrt((1 - L) ** 2 + (1 - J) ** 2 + (1 - P) ** 2 + (1 - W) ** 2)
+        return _anchor_distance(L, J, P, W)
 
     @staticmethod
     def distance_from_natural_equilibrium(L: float, J: float, P: float, W: float) -> float:
@@ -193,8 +602,19 @@ class LJPWBaselines:
         Returns:
             Distance (0.0 to ~2.0)
         """
-        NE = ReferencePoints.NATURAL_EQUILIBRIUM
-        return math.sqrt((NE[0] - L) ** 2 + (NE[1] - J) ** 2 + (NE[2] - P) ** 2 + (NE[3] - W) ** 2)
+        return _ne_distance(L, J, P, W)
+
+    @staticmethod
+    def distance_from_anchor_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized distance_from_anchor over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return np.linalg.norm(coords - _ANCHOR_ARRAY, axis=1)
+
+    @staticmethod
+    def distance_from_natural_equilibrium_batch(coords: np.ndarray) -> np.ndarray:
+        """Vectorized distance_from_natural_equilibrium over an (N, 4) array of L, J, P, W rows"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return np.linalg.norm(coords - _NE_ARRAY, axis=1)
 
     @staticmethod
     def full_diagnostic(L: float, J: float, P: float, W: float) -> Dict:
@@ -209,22 +629,98 @@ class LJPWBaselines:
         Returns:
             Dict with coordinates, effective dimensions, distances, and all metrics
         """
-        baselines = LJPWBaselines
-        eff = baselines.effective_dimensions(L, J, P, W)
+        # One kernel call yields every metric plus the shared intermediates
+        (
+            harmonic,
+            geometric,
+            growth,
+            harmony,
+            composite,
+            d_anchor,
+            J_eff,
+            P_eff,
+            W_eff,
+        ) = _cached_ljpw_metrics(L, J, P, W)
 
         return {
             "coordinates": {"L": L, "J": J, "P": P, "W": W},
-            "effective_dimensions": eff,
+            "effective_dimensions": {
+                "effective_L": L,
+                "effective_J": J_eff,
+                "effective_P": P_eff,
+                "effective_W": W_eff,
+            },
             "distances": {
-                "from_anchor": baselines.distance_from_anchor(L, J, P, W),
-                "from_natural_equilibrium": baselines.distance_from_natural_equilibrium(L, J, P, W),
+                "from_anchor": d_anchor,
+                "from_natural_equilibrium": _ne_distance(L, J, P, W),
             },
             "metrics": {
-                "harmonic_mean": baselines.harmonic_mean(L, J, P, W),
-                "geometric_mean": baselines.geometric_mean(L, J, P, W),
-                "coupling_aware_sum": baselines.coupling_aware_sum(L, J, P, W),
-                "harmony_index": baselines.harmony_index(L, J, P, W),
-                "composite_score": baselines.composite_score(L, J, P, W),
+                "harmonic_mean": harmonic,
+                "geometric_mean": geometric,
+                "coupling_aware_sum": growth,
+                "harmony_index": harmony,
+                "composite_score": composite,
+            },
+        }
+
+    @staticmethod
+    def core_metrics_batch(
+        coords: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized core_metrics for many systems at once.
+
+        Args:
+            coords: Array of shape (N, 4) holding L, J, P, W per row
+
+        Returns:
+            (harmonic_mean, geometric_mean, coupling_aware_sum, harmony_index,
+            composite_score), each an array of N values
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        return _ljpw_metrics_batch(coords)[:5]
+
+    @staticmethod
+    def full_diagnostic_batch(coords: np.ndarray) -> Dict:
+        """
+        Vectorized full_diagnostic for many systems at once.
+
+        Args:
+            coords: Array of shape (N, 4) holding L, J, P, W per row
+
+        Returns:
+            Dict shaped like full_diagnostic, with an array of N values per metric
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        L, J, P, W = coords.T
+        (
+            harmonic,
+            geometric,
+            growth,
+            harmony,
+            composite,
+            d_anchor,
+            J_eff,
+            P_eff,
+            W_eff,
+        ) = _ljpw_metrics_batch(coords)
+        d_ne = LJPWBaselines.distance_from_natural_equilibrium_batch(coords)
+
+        return {
+            "coordinates": {"L": L, "J": J, "P": P, "W": W},
+            "effective_dimensions": {
+                "effective_L": L,
+                "effective_J": J_eff,
+                "effective_P": P_eff,
+                "effective_W": W_eff,
+            },
+            "distances": {"from_anchor": d_anchor, "from_natural_equilibrium": d_ne},
+            "metrics": {
+                "harmonic_mean": harmonic,
+                "geometric_mean": geometric,
+                "coupling_aware_sum": growth,
+                "harmony_index": harmony,
+                "composite_score": composite,
             },
         }
 
@@ -239,14 +735,13 @@ class LJPWBaselines:
         Returns:
             Human-readable interpretation
         """
-        if distance < 0.2:
-            return "Near-optimal balance"
-        elif distance < 0.5:
-            return "Good but improvable"
-        elif distance < 0.8:
-            return "Moderate imbalance"
-        else:
-            return "Significant dysfunction"
+        return _NE_DISTANCE_LABELS[bisect.bisect_right(_NE_DISTANCE_THRESHOLDS, distance)]
+
+    @staticmethod
+    def interpret_distance_from_ne_batch(distances: np.ndarray) -> List[str]:
+        """Vectorized interpret_distance_from_ne over an array of distances"""
+        bands = np.searchsorted(_NE_DISTANCE_THRESHOLDS, distances, side="right")
+        return [_NE_DISTANCE_LABELS[band] for band in np.ravel(bands).tolist()]
 
     @staticmethod
     def interpret_composite_score(score: float) -> str:
@@ -259,18 +754,13 @@ class LJPWBaselines:
         Returns:
             Human-readable interpretation
         """
-        if score < 0.5:
-            return "Critical - multiple dimensions failing"
-        elif score < 0.7:
-            return "Struggling - functional but inefficient"
-        elif score < 0.9:
-            return "Competent - solid baseline performance"
-        elif score < 1.1:
-            return "Strong - above-average effectiveness"
-        elif score < 1.3:
-            return "Excellent - high-performing, growth active"
-        else:
-            return "Elite - exceptional, Love multiplier engaged"
+        return _COMPOSITE_LABELS[bisect.bisect_right(_COMPOSITE_THRESHOLDS, score)]
+
+    @staticmethod
+    def interpret_composite_score_batch(scores: np.ndarray) -> List[str]:
+        """Vectorized interpret_composite_score over an array of scores"""
+        bands = np.searchsorted(_COMPOSITE_THRESHOLDS, scores, side="right")
+        return [_COMPOSITE_LABELS[band] for band in np.ravel(bands).tolist()]
 
     @staticmethod
     def validate_coupling_structure() -> Dict[str, bool]:
@@ -286,23 +776,21 @@ class LJPWBaselines:
         Returns:
             Dict with validation results for each pattern
         """
-        cm = LJPWBaselines.COUPLING_MATRIX
+        cm = LJPWBaselines.COUPLING_ARRAY
+        L, J, P, W = range(4)  # Row and column indices
 
         # Check Love amplifies
-        love_amplifies = cm["LJ"] > 1.0 and cm["LP"] > 1.0 and cm["LW"] > 1.0
+        love_amplifies = bool((cm[L, [J, P, W]] > 1.0).all())
 
         # Check Power constrains
-        power_constrains = cm["PL"] < 1.0 and cm["PJ"] < 1.0 and cm["PW"] < 1.0
+        power_constrains = bool((cm[P, [L, J, W]] < 1.0).all())
 
         # Check Justice supports Wisdom more than Power
-        justice_wisdom = cm["JW"] > cm["JP"]
+        justice_wisdom = bool(cm[J, W] > cm[J, P])
 
         # Check asymmetry (giving ≠ receiving)
-        asymmetry = (
-            abs(cm["LJ"] - cm["JL"]) > 0.1
-            and abs(cm["LP"] - cm["PL"]) > 0.1
-            and abs(cm["PJ"] - cm["JP"]) > 0.1
-        )
+        givers, receivers = [L, L, P], [J, P, J]
+        asymmetry = bool((np.abs(cm[givers, receivers] - cm[receivers, givers]) > 0.1).all())
 
         return {
             "love_amplifies": love_amplifies,
@@ -331,8 +819,6 @@ class LJPWBaselines:
         Returns:
             Dict with proportion analysis
         """
-        NE = ReferencePoints.NATURAL_EQUILIBRIUM
-
         # Calculate current ratios (scale-invariant)
         if J <= 0:
             return {"proportions_healthy": False, "error": "Justice dimension cannot be zero"}
@@ -343,12 +829,9 @@ class LJPWBaselines:
             "W/J": W / J,
         }
 
-        # Expected ratios from Natural Equilibrium
-        expected_ratios = {
-            "L/J": NE[0] / NE[1],  # 1.492
-            "P/J": NE[2] / NE[1],  # 1.734
-            "W/J": NE[3] / NE[1],  # 1.673
-        }
+        # Expected ratios from Natural Equilibrium: L/J 1.492, P/J 1.734, W/J 1.673.
+        # Copied, since the dict is handed back to the caller
+        expected_ratios = dict(_NE_RATIOS)
 
         # Check deviations
         deviations = {}
@@ -376,12 +859,60 @@ class LJPWBaselines:
             ),
         }
 
+    @staticmethod
+    def check_proportions_batch(coords: np.ndarray, tolerance: float = 0.3) -> Dict:
+        """
+        Vectorized check_proportions for many systems at once.
+
+        Args:
+            coords: Array of shape (N, 4) holding L, J, P, W per row
+            tolerance: Allowed deviation from ideal ratios (default 0.3 = 30%)
+
+        Returns:
+            Dict with "proportions_healthy" (N booleans) and "current_ratios",
+            "deviations", "checks" arrays of shape (N, 3), whose columns follow
+            the L/J, P/J, W/J keys of check_proportions. Rows with J <= 0 are
+            never healthy.
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        J = coords[:, 1:2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = coords[:, [0, 2, 3]] / J
+        deviations = np.abs(ratios - _NE_RATIO_ARRAY) / _NE_RATIO_ARRAY
+        checks = deviations < tolerance
+        return {
+            "proportions_healthy": checks.all(axis=1) & (J[:, 0] > 0),
+            "current_ratios": ratios,
+            "deviations": deviations,
+            "checks": checks,
+        }
+
 
 class DynamicLJPWv4:
     """
     LJPW v4.0: Empirically-validated, non-linear dynamic simulator.
     """
 
+    # Coefficient order expected by the _v4_derivatives kernel (see _kernel_coeffs)
+    _KERNEL_PARAMS = (
+        "alpha_LJ",
+        "alpha_LW",
+        "alpha_JL",
+        "alpha_JW",
+        "alpha_PL",
+        "alpha_PJ",
+        "alpha_WL",
+        "alpha_WJ",
+        "alpha_WP",
+        "beta_L",
+        "beta_J",
+        "beta_P",
+        "beta_W",
+        "K_JL",
+        "gamma_JP",
+        "n_JP",
+    )
+
     def __init__(self, complexity_score: float = 1.0):
         """
         Initialize the LJPW v4.0 Dynamic Model.
@@ -448,42 +979,28 @@ class DynamicLJPWv4:
         # Complexity factor for decay (Linear scaling - entropy scales with size)
         decay_multiplier = 1.0 + 0.1 * (self.complexity - 1.0)
 
-        calibrated = params.copy()
-
-        # Scale Alphas (Growth)
-        for key in calibrated:
+        # Scale Alphas (Growth) and Betas (Decay) in one pass; other keys are unchanged
+        calibrated = {}
+        for key, value in params.items():
             if key.startswith("alpha"):
-                calibrated[key] *= growth_multiplier
-
-        # Scale Betas (Decay)
-        for key in calibrated:
-            if key.startswith("beta"):
-                calibrated[key] *= decay_multiplier
+                value *= growth_multiplier
+            elif key.startswith("beta"):
+                value *= decay_multiplier
+            calibrated[key] = value
 
         return calibrated
 
-    def _derivatives(self, state):
-        """Calculates the derivatives with non-linear dynamics."""
-        L, J, P, W = state
+    def _kernel_coeffs(self) -> Tuple[float, ...]:
+        """The calibrated coefficients as the flat tuple the scalar kernels take"""
         p = self.params
+        coeffs = tuple(float(p[key]) for key in self._KERNEL_PARAMS)
+        # K_JP ** n_JP is constant for a run, so the kernels take it precomputed
+        return coeffs + (float(p["K_JP"]) ** float(p["n_JP"]),)
 
-        # Love equation (remains linear)
-        dL_dt = p["alpha_LJ"] * J + p["alpha_LW"] * W - p["beta_L"] * L
-
-        # Justice equation (with saturation and threshold effects)
-        L_effect_on_J = p["alpha_JL"] * (L / (p["K_JL"] + L))  # Saturation
-        P_effect_on_J = (
-            p["gamma_JP"]
-            * (P ** p["n_JP"] / (p["K_JP"] ** p["n_JP"] + P ** p["n_JP"]))
-            * max(0, 1 - W)
-        )  # Threshold
-        dJ_dt = L_effect_on_J + p["alpha_JW"] * W - P_effect_on_J - p["beta_J"] * J
-
-        # Power and Wisdom equations (can be similarly enhanced in future versions)
-        dP_dt = p["alpha_PL"] * L + p["alpha_PJ"] * J - p["beta_P"] * P
-        dW_dt = p["alpha_WL"] * L + p["alpha_WJ"] * J + p["alpha_WP"] * P - p["beta_W"] * W
-
-        return np.array([dL_dt, dJ_dt, dP_dt, dW_dt])
+    def _derivatives(self, state):
+        """Calculates the derivatives with non-linear dynamics."""
+        L, J, P, W = (float(x) for x in state)
+        return np.array(_v4_derivatives(L, J, P, W, self._kernel_coeffs()))
 
     def _rk4_step(self, state, dt):
         """Performs a single 4th-order Runge-Kutta integration step."""
@@ -498,33 +1015,60 @@ class DynamicLJPWv4:
         initial_state: Tuple[float, float, float, float],
         duration: float,
         dt: float = 0.01,
+        method: str = "rk4_fixed",
+        rtol: float = 1e-4,
+        atol: float = 1e-6,
     ) -> Dict:
-        """Runs the simulation using the more accurate RK4 method."""
-        steps = int(duration / dt)
-        state = np.array(initial_state, dtype=float)
-
-        history = {
-            "t": [0],
-            "L": [state[0]],
-            "J": [state[1]],
-            "P": [state[2]],
-            "W": [state[3]],
-        }
+        """
+        Runs the simulation using the more accurate RK4 method.
 
-        for i in range(steps):
-            state = self._rk4_step(state, dt)
-            state = np.clip(state, 0, 1.5)
+        Args:
+            initial_state: Starting (L, J, P, W) coordinates
+            duration: Simulated time span
+            dt: Spacing of the returned history (and the step size for "rk4_fixed")
+            method: "rk4_fixed" for classic fixed-step RK4 (exact legacy results),
+                    or "rk45" for adaptive Dormand-Prince steps, much cheaper for
+                    long runs that settle at equilibrium
+            rtol: Relative error tolerance per step ("rk45" only)
+            atol: Absolute error tolerance per step ("rk45" only)
 
-            history["t"].append((i + 1) * dt)
-            history["L"].append(state[0])
-            history["J"].append(state[1])
-            history["P"].append(state[2])
-            history["W"].append(state[3])
+        Returns:
+            Dict of numpy arrays: sample times "t" and the "L", "J", "P", "W" trajectories
+        """
+        steps = int(duration / dt)
+        L, J, P, W = (float(x) for x in initial_state)
+        coeffs = self._kernel_coeffs()
+
+        # The whole trajectory runs in one kernel call, numba-compiled when installed
+        if method == "rk4_fixed":
+            trajectory = _v4_trajectory(L, J, P, W, max(steps, 0), dt, coeffs)
+        elif method == "rk45":
+            trajectory = _v4_trajectory_adaptive(
+                L, J, P, W, max(steps, 0), dt, coeffs, float(rtol), float(atol)
+            )
+        else:
+            raise ValueError(f"Unknown integration method: {method!r}")
+        # One contiguous array per dimension, ready for plotting or further math
+        L_hist, J_hist, P_hist, W_hist = np.ascontiguousarray(trajectory.T)
 
-        return history
+        return {
+            "t": np.arange(len(trajectory)) * dt,
+            "L": L_hist,
+            "J": J_hist,
+            "P": P_hist,
+            "W": W_hist,
+        }
 
     def plot_simulation(self, history: Dict):
         """Plots the results of a simulation."""
+        # Imported here: pyplot dominates import time and only plotting needs it
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError as exc:
+            raise ImportError(
+                "plot_simulation requires matplotlib (pip install matplotlib)"
+            ) from exc
+
         plt.style.use("seaborn-v0_8-whitegrid")
         fig, ax = plt.subplots(figsize=(12, 7))
         ax.plot(history["t"], history["L"], label="Love (L)", color="crimson", lw=2)
@@ -557,6 +1101,27 @@ def get_reference_points() -> ReferencePoints:
     return ReferencePoints()
 
 
+def warm_jit_cache() -> bool:
+    """
+    Compile the numba kernels for float arguments ahead of first use.
+
+    Compiled kernels are cached on disk, so running this once (for example right
+    after installing the ``jit`` extra) spares later processes the compile delay
+    on their first analysis or simulation.
+
+    Returns:
+        True if numba is installed and the kernels were compiled
+    """
+    if njit is None:
+        return False
+    LJPWBaselines.full_diagnostic(0.5, 0.5, 0.5, 0.5)
+    LJPWBaselines.full_diagnostic_batch(np.full((1, 4), 0.5))
+    simulator = DynamicLJPWv4()
+    for method in ("rk4_fixed", "rk45"):
+        simulator.simulate((0.5, 0.5, 0.5, 0.5), duration=0.1, dt=0.1, method=method)
+    return True
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Example: Analyze a code function's semantic profile
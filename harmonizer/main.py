@@ -30,17 +30,28 @@ if project_root not in sys.path:
 
 import argparse  # noqa: E402
 import ast  # noqa: E402
+import contextlib  # noqa: E402
 import fnmatch  # noqa: E402
+import io  # noqa: E402
 import json  # noqa: E402
-from typing import Dict, List, Optional, Tuple  # noqa: E402
+import math  # noqa: E402
+from collections import deque  # noqa: E402
+from typing import Dict, Iterator, List, Optional, Tuple  # noqa: E402
 
 from harmonizer import divine_invitation_engine_V2 as dive  # noqa: E402
-from harmonizer.ast_semantic_parser import AST_Semantic_Parser  # noqa: E402
+from harmonizer import parallel  # noqa: E402
+from harmonizer.ast_semantic_parser import AST_Semantic_Parser, parse_source  # noqa: E402
 from harmonizer.refactorer import Refactorer  # noqa: E402
 from harmonizer.semantic_map import SemanticMapGenerator  # noqa: E402
 from harmonizer.semantic_naming import SemanticNamingEngine  # noqa: E402
 from harmonizer.config import ConfigLoader  # noqa: E402
 
+# Optional fast JSON serializer; equivalent to the json fallback for the rounded report values
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- CONFIGURATION LOADING ---
 
 
@@ -143,10 +154,74 @@ def save_text_report(blocks: List[str], destination: str) -> None:
         handle.write(payload)
 
 
+def _null_non_finite(value):
+    """Replace NaN and infinities with None, as orjson writes them"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_null_non_finite(item) for item in value]
+    return value
+
+
+def dump_json(payload: Dict) -> bytes:
+    """
+    Serialize a JSON payload as 2-space-indented UTF-8, using orjson when installed.
+
+    Both paths write NaN and infinities as null. Float spelling can differ
+    (orjson writes 1e-05 as 0.00001), but the parsed values are the same.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Types orjson rejects (e.g. non-string keys); let json decide
+    try:
+        text = json.dumps(payload, indent=2, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        text = json.dumps(_null_non_finite(payload), indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def write_json(payload: Dict) -> None:
+    """Write a JSON payload and trailing newline to stdout in a single write."""
+    data = dump_json(payload) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    # Earlier text output must reach the byte stream first
+    sys.stdout.flush()
+    buffer.write(data)
+
+
 def save_json_report(payload: Dict, destination: str) -> None:
     """Persist JSON payload to disk."""
-    with open(destination, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    with open(destination, "wb") as handle:
+        handle.write(dump_json(payload))
+
+
+# Statement-list fields, in the order ast.iter_child_nodes visits them
+_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _function_defs(tree: ast.AST) -> List[ast.AST]:
+    """
+    All function definitions in a module, in ast.walk (breadth-first) order.
+
+    Definitions are statements, and expressions never contain statements, so
+    only statement blocks are traversed instead of every node in the tree.
+    """
+    functions = []
+    pending = deque([tree])
+    while pending:
+        node = pending.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append(node)
+        for field in _BLOCK_FIELDS:
+            pending.extend(getattr(node, field, ()))
+    return functions
 
 
 # --- THE HARMONIZER APPLICATION ---
@@ -172,6 +247,7 @@ class PythonCodeHarmonizer:
         config: Dict = None,
         suggest_names: bool = False,
         top_suggestions: int = 3,
+        keep_nodes: bool = True,
     ):
         self.config = config if config else {}
         self.engine = dive.DivineInvitationSemanticEngine(config=self.config)
@@ -183,6 +259,8 @@ class PythonCodeHarmonizer:
         self.show_semantic_maps = show_semantic_maps
         self.suggest_names = suggest_names
         self.top_suggestions = top_suggestions
+        # AST subtrees are only needed for refactoring suggestions
+        self.keep_nodes = keep_nodes
         self._communicate_startup()
 
     def _communicate_startup(self):
@@ -200,6 +278,14 @@ class PythonCodeHarmonizer:
         content = self._load_and_validate_file(file_path)
         if content is None:
             return {}
+        return self._analyze_content(content, file_path)
+
+    def analyze_source(self, source: str, virtual_path: str = "<history>") -> Dict[str, Dict]:
+        """Analyze in-memory source, such as a file's contents at an earlier commit."""
+        self._communicate_analysis_start(virtual_path)
+        return self._analyze_content(source, virtual_path)
+
+    def _analyze_content(self, content: str, file_path: str) -> Dict[str, Dict]:
         tree = self._parse_code_to_ast(content, file_path)
         if tree is None:
             return {}
@@ -233,7 +319,7 @@ class PythonCodeHarmonizer:
 
     def _parse_code_to_ast(self, content: str, file_path: str) -> ast.AST:
         try:
-            return ast.parse(content)
+            return parse_source(content)
         except SyntaxError as e:
             if not self.quiet:
                 print(f"⚠️  Syntax error on line {e.lineno}")
@@ -242,31 +328,31 @@ class PythonCodeHarmonizer:
 
     def _analyze_all_functions(self, tree: ast.AST) -> Dict[str, Dict]:
         harmony_report = {}
-        function_nodes = (ast.FunctionDef, ast.AsyncFunctionDef)
-        for node in ast.walk(tree):
-            if isinstance(node, function_nodes):
-                function_name = node.name
-                docstring = ast.get_docstring(node)
-                intent_concepts = self.parser.get_intent_concepts(function_name, docstring)
-                execution_map, execution_concepts = self.parser.get_execution_map(node.body)
-                ice_result = self.engine.perform_ice_analysis(
-                    intent_words=intent_concepts,
-                    context_words=["python", "function", function_name],
-                    execution_words=execution_concepts,
-                )
-                # Use baseline-enhanced disharmony if available, else fall back to traditional
-                disharmony_score = ice_result["ice_metrics"].get(
-                    "baseline_disharmony",
-                    ice_result["ice_metrics"]["intent_execution_disharmony"],
-                )
-                semantic_map = self.map_generator.generate_map(ice_result, function_name)
-                harmony_report[function_name] = {
-                    "score": disharmony_score,
-                    "ice_result": ice_result,
-                    "semantic_map": semantic_map,
-                    "execution_map": execution_map,
-                    "function_node": node,
-                }
+        for node in _function_defs(tree):
+            function_name = node.name
+            docstring = ast.get_docstring(node)
+            intent_concepts = self.parser.get_intent_concepts(function_name, docstring)
+            execution_map, execution_concepts = self.parser.get_execution_map(node.body)
+            ice_result = self.engine.perform_ice_analysis(
+                intent_words=intent_concepts,
+                context_words=["python", "function", function_name],
+                execution_words=execution_concepts,
+            )
+            # Use baseline-enhanced disharmony if available, else fall back to traditional
+            disharmony_score = ice_result["ice_metrics"].get(
+                "baseline_disharmony",
+                ice_result["ice_metrics"]["intent_execution_disharmony"],
+            )
+            semantic_map = self.map_generator.generate_map(ice_result, function_name)
+            entry = {
+                "score": disharmony_score,
+                "ice_result": ice_result,
+                "semantic_map": semantic_map,
+            }
+            if self.keep_nodes:
+                entry["execution_map"] = execution_map
+                entry["function_node"] = node
+            harmony_report[function_name] = entry
         return harmony_report
 
     def get_severity(self, score: float) -> str:
@@ -296,11 +382,36 @@ class PythonCodeHarmonizer:
             return 0
 
     def format_report(self, harmony_report: Dict[str, Dict], suggest_refactor: bool = False) -> str:
+        return "\n".join(self.iter_report_lines(harmony_report, suggest_refactor))
+
+    def write_report(self, harmony_report: Dict[str, Dict], suggest_refactor: bool = False):
+        """Stream the text report to stdout without building the whole string first"""
+        lines = self.iter_report_lines(harmony_report, suggest_refactor)
+        sys.stdout.writelines(f"{line}\n" for line in lines)
+
+    def iter_report_lines(
+        self, harmony_report: Dict[str, Dict], suggest_refactor: bool = False
+    ) -> Iterator[str]:
+        """
+        Iterate over the lines of the text report rendered by format_report.
+
+        Raises:
+            ValueError: if suggest_refactor is requested but this harmonizer
+                was built with keep_nodes=False, so reports lack the AST nodes
+                the refactorer needs.
+        """
+        if suggest_refactor and not self.keep_nodes:
+            raise ValueError("suggest_refactor requires a harmonizer built with keep_nodes=True")
+        return self._report_lines(harmony_report, suggest_refactor)
+
+    def _report_lines(
+        self, harmony_report: Dict[str, Dict], suggest_refactor: bool
+    ) -> Iterator[str]:
         if not harmony_report:
-            return "No functions found to analyze."
-        lines = []
-        lines.append("FUNCTION NAME                | HARMONY SCORE")
-        lines.append("-----------------------------|--------------------------------")
+            yield "No functions found to analyze."
+            return
+        yield "FUNCTION NAME                | HARMONY SCORE"
+        yield "-----------------------------|--------------------------------"
         sorted_report = sorted(
             harmony_report.items(), key=lambda item: item[1]["score"], reverse=True
         )
@@ -328,17 +439,16 @@ class PythonCodeHarmonizer:
                 status = f"🚨 Needs attention ({score:.2f})"
                 attention_count += 1
 
-            lines.append(f"{func_name:<28} | {status}")
+            yield f"{func_name:<28} | {status}"
             if score > self.disharmony_threshold:
                 if self.show_semantic_maps:
-                    lines.append(self.map_generator.format_text_map(data["semantic_map"], score))
+                    yield self.map_generator.format_text_map(data["semantic_map"], score)
                 if self.suggest_names:
-                    lines.append(self._generate_naming_suggestions(func_name, data))
+                    yield self._generate_naming_suggestions(func_name, data)
                 if suggest_refactor:
                     refactorer = Refactorer(data["function_node"], data["execution_map"])
-                    suggestion = refactorer.suggest_dimensional_split()
-                    lines.append(suggestion)
-        lines.append("=" * 70)
+                    yield refactorer.suggest_dimensional_split()
+        yield "=" * 70
 
         # Add encouraging summary
         summary_parts = []
@@ -352,20 +462,18 @@ class PythonCodeHarmonizer:
         if attention_count > 0:
             summary_parts.append(f"🚨 {attention_count} need attention")
 
-        lines.append(f"Summary: {', '.join(summary_parts)}")
+        yield f"Summary: {', '.join(summary_parts)}"
 
         # Encouraging message based on results
         if attention_count == 0 and review_count == 0:
-            lines.append("🎉 Beautiful! Your code is semantically harmonious!")
+            yield "🎉 Beautiful! Your code is semantically harmonious!"
         elif attention_count == 0:
-            lines.append("💫 Great work! Just a few minor items to review.")
+            yield "💫 Great work! Just a few minor items to review."
         else:
-            lines.append("💡 Found some opportunities to improve semantic harmony.")
+            yield "💡 Found some opportunities to improve semantic harmony."
 
         if review_count > 0 or attention_count > 0:
-            lines.append("   Run with --suggest-names for naming suggestions.")
-
-        return "\n".join(lines)
+            yield "   Run with --suggest-names for naming suggestions."
 
     def _generate_naming_suggestions(self, func_name: str, data: Dict) -> str:
         """Generate naming suggestions based on execution semantics"""
@@ -464,8 +572,7 @@ class PythonCodeHarmonizer:
         return output
 
     def print_json_report(self, all_reports: Dict[str, Dict[str, Dict]]):
-        payload = self.build_json_payload(all_reports)
-        print(json.dumps(payload, indent=2))
+        write_json(self.build_json_payload(all_reports))
 
     def _get_highest_severity_name(self, severity_counts: Dict[str, int]) -> str:
         for severity in ["critical", "high", "medium", "low", "excellent"]:
@@ -546,6 +653,55 @@ def validate_cli_arguments(args: argparse.Namespace, config: Dict) -> List[str]:
     return valid_files
 
 
+def _analyze_file_worker(file_path: str) -> Tuple[Dict, str]:
+    """
+    Process-pool entry point for analyzing a single file.
+
+    Progress messages are captured so the parent can print them in file order.
+
+    Returns:
+        (harmony report, captured output)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        report = parallel.worker_harmonizer().analyze_file(file_path)
+    return report, buffer.getvalue()
+
+
+def _iter_file_reports(harmonizer: PythonCodeHarmonizer, file_paths: List[str]):
+    """
+    Yield (file_path, report) in file_paths order, fanning out to worker processes
+    once there are enough files to amortize the pool.
+    """
+    done = 0
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    if len(file_paths) >= parallel.PARALLEL_MIN_FILES and workers > 1:
+        # Workers build harmonizers configured like the parent's
+        settings = {
+            "disharmony_threshold": harmonizer.disharmony_threshold,
+            "quiet": harmonizer.quiet,
+            "show_semantic_maps": harmonizer.show_semantic_maps,
+            "config": harmonizer.config,
+            "suggest_names": harmonizer.suggest_names,
+            "top_suggestions": harmonizer.top_suggestions,
+            "keep_nodes": harmonizer.keep_nodes,
+        }
+        try:
+            with parallel.create_pool(settings, max_workers=workers) as executor:
+                results = executor.map(_analyze_file_worker, file_paths)
+                for file_path, (report, output) in zip(file_paths, results):
+                    sys.stdout.write(output)
+                    done += 1
+                    yield file_path, report
+            return
+        except parallel.POOL_ERRORS as e:
+            # Sandboxes without working multiprocessing; finish the rest serially
+            parallel.report_serial_fallback(e, harmonizer.quiet)
+
+    for file_path in file_paths[done:]:
+        yield file_path, harmonizer.analyze_file(file_path)
+
+
 def execute_analysis(
     harmonizer: PythonCodeHarmonizer,
     file_paths: List[str],
@@ -556,16 +712,17 @@ def execute_analysis(
     all_reports = {}
     highest_exit_code = 0
     text_blocks: List[str] = []
-    for file_path in file_paths:
-        report = harmonizer.analyze_file(file_path)
+    for file_path, report in _iter_file_reports(harmonizer, file_paths):
         all_reports[file_path] = report
         exit_code = harmonizer.get_highest_severity_code(report)
         highest_exit_code = max(highest_exit_code, exit_code)
         if output_format == "text":
-            formatted = harmonizer.format_report(report, suggest_refactor=suggest_refactor)
-            harmonizer.output_report(formatted)
             if capture_text:
+                formatted = harmonizer.format_report(report, suggest_refactor=suggest_refactor)
+                harmonizer.output_report(formatted)
                 text_blocks.append(f"# {file_path}\n{formatted}")
+            else:
+                harmonizer.write_report(report, suggest_refactor=suggest_refactor)
     return all_reports, highest_exit_code, text_blocks
 
 
@@ -591,6 +748,7 @@ def run_cli():
         config=config,
         suggest_names=args.suggest_names,
         top_suggestions=args.top_suggestions,
+        keep_nodes=args.suggest_refactor,
     )
 
     capture_text = bool(args.save_text)
@@ -608,7 +766,7 @@ def run_cli():
         json_payload = harmonizer.build_json_payload(all_reports)
 
     if args.format == "json":
-        print(json.dumps(json_payload, indent=2))
+        write_json(json_payload)
 
     if args.save_text:
         save_text_report(text_blocks, args.save_text)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-Pool Helpers
+
+Shared by the CLI and the legacy mapper to fan file analysis out to worker
+processes. Each worker holds one PythonCodeHarmonizer, built by the pool
+initializer, which the per-task entry points fetch with worker_harmonizer().
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+# Below this many files, process-pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Raised where processes cannot be started (sandboxes) or a worker died
+POOL_ERRORS = (OSError, BrokenProcessPool)
+
+# Settings for harmonizers whose results only feed summaries
+QUIET_WORKER_SETTINGS = {"quiet": True, "keep_nodes": False}
+
+# Per-process harmonizer, built by init_worker
+_WORKER_HARMONIZER = None
+
+
+def init_worker(settings: Dict):
+    """Process-pool initializer: build this worker's harmonizer from constructor settings"""
+    global _WORKER_HARMONIZER
+    # Imported here: harmonizer.main imports this module
+    from harmonizer.main import PythonCodeHarmonizer
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WORKER_HARMONIZER = PythonCodeHarmonizer(**settings)
+
+
+def worker_harmonizer():
+    """The harmonizer init_worker built for the current worker process"""
+    return _WORKER_HARMONIZER
+
+
+def create_pool(settings: Dict, max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Start a pool whose workers each build a harmonizer from settings"""
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        initializer=init_worker,
+        initargs=(settings,),
+    )
+
+
+def report_serial_fallback(error: BaseException, quiet: bool):
+    """Tell the user the pool failed and the remaining files run in-process"""
+    if not quiet:
+        print(f"Warning: Parallel analysis unavailable ({error}); running serially")
@@ -90,14 +90,12 @@ class ResonanceEngine:
     # Coupling matrix (asymmetric)
     # Row = source dimension, Column = target influence
     # L=Cohesion, J=Structure, P=Complexity, W=Abstraction
-    COUPLING_MATRIX = np.array(
-        [
-            [1.0, 1.4, 1.3, 1.5],  # Cohesion amplifies all, especially Abstraction
-            [0.9, 1.0, 0.7, 1.2],  # Structure moderates
-            [0.6, 0.8, 1.0, 0.5],  # Complexity absorbs (lowest out-coupling)
-            [1.3, 1.1, 1.0, 1.0],  # Abstraction integrates
-        ]
-    )
+    # - Cohesion amplifies all, especially Abstraction
+    # - Structure moderates
+    # - Complexity absorbs (lowest out-coupling)
+    # - Abstraction integrates
+    # A copy of the baseline coefficients, so edits here cannot leak into them
+    COUPLING_MATRIX = LJPWBaselines.COUPLING_ARRAY.copy()
 
     # Natural Equilibrium constants
     NATURAL_EQUILIBRIUM = np.array([0.618034, 0.414214, 0.718282, 0.693147])
@@ -112,6 +110,26 @@ class ResonanceEngine:
         "n_JP": 4.1,  # Hill coefficient (steepness of erosion)
     }
 
+    # Order in which _derivatives unpacks its coefficients (see _dynamics_coeffs)
+    _DYNAMICS_PARAMS = (
+        "alpha_LJ",
+        "alpha_LW",
+        "alpha_JL",
+        "alpha_JW",
+        "alpha_PL",
+        "alpha_PJ",
+        "alpha_WL",
+        "alpha_WJ",
+        "alpha_WP",
+        "beta_L",
+        "beta_J",
+        "beta_P",
+        "beta_W",
+        "K_JL",
+        "gamma_JP",
+        "n_JP",
+    )
+
     def __init__(self, params: Optional[Dict] = None):
         """
         Initialize the Resonance Engine.
@@ -232,7 +250,8 @@ class ResonanceEngine:
         n = params["n_JP"]
 
         # Hill function for Power threshold effect
-        P_threshold = (P**n) / (K**n + P**n)
+        P_n = P**n
+        P_threshold = P_n / (K**n + P_n)
 
         # Wisdom protection factor (0 when W=1, 1 when W=0)
         wisdom_gap = max(0, 1 - W)
@@ -301,14 +320,49 @@ class ResonanceEngine:
         kappa_LW = 1.0 + 0.5 * H
         return kappa_LJ, kappa_LP, kappa_LW
 
-    def _derivatives(self, state: np.ndarray, bounded: bool = True) -> np.ndarray:
+    def _dynamics_coeffs(self) -> Tuple[float, ...]:
+        """
+        Snapshot of the dynamics coefficients, in _DYNAMICS_PARAMS order.
+
+        The constant Hill threshold K_JP ** n_JP is appended precomputed.
+        """
+        p = self.params
+        return tuple(p[key] for key in self._DYNAMICS_PARAMS) + (p["K_JP"] ** p["n_JP"],)
+
+    def _derivatives(
+        self, state: np.ndarray, bounded: bool = True, coeffs: Optional[Tuple[float, ...]] = None
+    ) -> np.ndarray:
         """
         Calculate derivatives with state-dependent coupling (v5.1 dynamics).
 
         Implements the "Law of Karma" - meaning amplifies reality.
+
+        ``coeffs`` is a _dynamics_coeffs() snapshot; integrators pass one in so the
+        params dict is not consulted on every evaluation.
         """
-        L, J, P, W = state
-        p = self.params
+        # Python floats: scalar math on numpy float64 elements is several times slower
+        L, J, P, W = state.tolist()
+        (
+            a_LJ,
+            a_LW,
+            a_JL,
+            a_JW,
+            a_PL,
+            a_PJ,
+            a_WL,
+            a_WJ,
+            a_WP,
+            b_L,
+            b_J,
+            b_P,
+            b_W,
+            K_JL,
+            gamma_JP,
+            n_JP,
+            K_JP_n,
+        ) = (
+            self._dynamics_coeffs() if coeffs is None else coeffs
+        )
 
         # Calculate Harmony (connection to Source)
         H = LJPWBaselines.harmony_index(L, J, P, W)
@@ -317,33 +371,36 @@ class ResonanceEngine:
         kappa_LJ, kappa_LP, kappa_LW = self._calculate_kappa(H)
 
         # Cohesion equation (amplifies other dimensions)
-        dL_dt = p["alpha_LJ"] * J * kappa_LJ + p["alpha_LW"] * W * kappa_LW - p["beta_L"] * L
+        dL_dt = a_LJ * J * kappa_LJ + a_LW * W * kappa_LW - b_L * L
 
         # Structure equation (with Complexity erosion when Abstraction is low)
-        L_effect = p["alpha_JL"] * (L / (p["K_JL"] + L))  # Saturation
-        P_erosion = (
-            p["gamma_JP"]
-            * (P ** p["n_JP"] / (p["K_JP"] ** p["n_JP"] + P ** p["n_JP"]))
-            * max(0, 1 - W)
-        )
-        dJ_dt = L_effect + p["alpha_JW"] * W - P_erosion - p["beta_J"] * J
+        L_effect = a_JL * (L / (K_JL + L))  # Saturation
+        P_n = P**n_JP
+        P_erosion = gamma_JP * (P_n / (K_JP_n + P_n)) * max(0, 1 - W)
+        dJ_dt = L_effect + a_JW * W - P_erosion - b_J * J
 
         # Complexity equation (tends to accumulate)
-        dP_dt = p["alpha_PL"] * L * kappa_LP + p["alpha_PJ"] * J - p["beta_P"] * P
+        dP_dt = a_PL * L * kappa_LP + a_PJ * J - b_P * P
 
         # Abstraction equation (synthesizes understanding from all dimensions)
-        dW_dt = (
-            p["alpha_WL"] * L * kappa_LW + p["alpha_WJ"] * J + p["alpha_WP"] * P - p["beta_W"] * W
-        )
+        dW_dt = a_WL * L * kappa_LW + a_WJ * J + a_WP * P - b_W * W
 
         return np.array([dL_dt, dJ_dt, dP_dt, dW_dt])
 
-    def _rk4_step(self, state: np.ndarray, dt: float, bounded: bool = True) -> np.ndarray:
+    def _rk4_step(
+        self,
+        state: np.ndarray,
+        dt: float,
+        bounded: bool = True,
+        coeffs: Optional[Tuple[float, ...]] = None,
+    ) -> np.ndarray:
         """4th-order Runge-Kutta integration step."""
-        k1 = self._derivatives(state, bounded)
-        k2 = self._derivatives(state + 0.5 * dt * k1, bounded)
-        k3 = self._derivatives(state + 0.5 * dt * k2, bounded)
-        k4 = self._derivatives(state + dt * k3, bounded)
+        if coeffs is None:
+            coeffs = self._dynamics_coeffs()
+        k1 = self._derivatives(state, bounded, coeffs)
+        k2 = self._derivatives(state + 0.5 * dt * k1, bounded, coeffs)
+        k3 = self._derivatives(state + 0.5 * dt * k2, bounded, coeffs)
+        k4 = self._derivatives(state + dt * k3, bounded, coeffs)
         new_state = state + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
 
         if bounded:
@@ -404,14 +461,21 @@ class ResonanceEngine:
         peak_harmony = history["harmony"][0]
         peak_cycle = 0
 
+        # Bind per-cycle callables once, outside the integration loop
+        rk4_step = self._rk4_step
+        coeffs = self._dynamics_coeffs()
+        harmony_index = LJPWBaselines.harmony_index
+        calculate_voltage = self.calculate_voltage
+        get_dominant_dimension = self._get_dominant_dimension
+
         for cycle in range(cycles):
             # RK4 integration step
-            state = self._rk4_step(state, dt, bounded)
+            state = rk4_step(state, dt, bounded, coeffs)
 
             # Calculate metrics
-            H = LJPWBaselines.harmony_index(*state)
-            V = self.calculate_voltage(*state)
-            dominant = self._get_dominant_dimension(state)
+            H = harmony_index(*state)
+            V = calculate_voltage(*state)
+            dominant = get_dominant_dimension(state)
 
             # Track peak harmony
             if H > peak_harmony:
@@ -573,6 +637,7 @@ class ResonanceEngine:
         if len(path) < 2:
             return journey
 
+        harmony_index = LJPWBaselines.harmony_index
         for i in range(1, len(path)):
             prev = np.array(path[i - 1])
             curr = np.array(path[i])
@@ -582,7 +647,7 @@ class ResonanceEngine:
             journey.distance_traveled += step_distance
 
             # Harmony at current position
-            H = LJPWBaselines.harmony_index(*curr)
+            H = harmony_index(*curr)
 
             # Struggle integral (time weighted by distance from harmony)
             journey.struggle_integral += (1 - H) * step_duration
@@ -724,12 +789,13 @@ class ResonanceEngine:
         """
         L, J, P, W = coords
 
-        # Static analysis
+        # Static analysis; harmony is derived from the anchor distance computed once
+        d_anchor = LJPWBaselines.distance_from_anchor(L, J, P, W)
         static = {
             "coordinates": {"L": L, "J": J, "P": P, "W": W},
             "voltage": self.calculate_voltage(L, J, P, W),
-            "harmony_index": LJPWBaselines.harmony_index(L, J, P, W),
-            "distance_from_anchor": LJPWBaselines.distance_from_anchor(L, J, P, W),
+            "harmony_index": 1.0 / (1.0 + d_anchor),
+            "distance_from_anchor": d_anchor,
             "distance_from_ne": LJPWBaselines.distance_from_natural_equilibrium(L, J, P, W),
         }
 
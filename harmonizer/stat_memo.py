@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stat-Keyed Memoization
+
+In-process memoization of per-path work (file digests, config lookups) keyed
+on the path's stat signature, so repeated runs in one process skip unchanged
+files and directories.
+"""
+
+import functools
+import os
+import time
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Paths modified this recently may change again within the same mtime tick
+RACY_MTIME_NS = 2_000_000_000
+
+
+def memoize_on_stat(maxsize: int) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """
+    Memoize a function of one path on the path's (mtime, size) signature.
+
+    Paths without an mtime, modified in the last couple of seconds, or that
+    cannot be stat'ed always call through: a second write within the same
+    timestamp tick would otherwise go unnoticed. The wrapper exposes the
+    underlying lru_cache's cache_info() and cache_clear().
+    """
+
+    def decorator(func: Callable[[str], T]) -> Callable[[str], T]:
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(path: str, mtime_ns: int, size: int) -> T:
+            return func(path)
+
+        @functools.wraps(func)
+        def wrapper(path: str) -> T:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return func(path)
+            if st.st_mtime_ns and time.time_ns() - st.st_mtime_ns > RACY_MTIME_NS:
+                return cached(path, st.st_mtime_ns, st.st_size)
+            return func(path)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
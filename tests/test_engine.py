@@ -104,6 +104,23 @@ def test_semantic_analyzer_cluster(engine):
     assert result.harmonic_cohesion > 0.5
 
 
+def test_semantic_analyzer_cluster_is_cached(engine):
+    """Repeated concept lists are served from the cache with identical metrics."""
+    analyzer = engine.semantic_analyzer
+    concepts = ["power", "love", "justice"]
+    first = analyzer.analyze_concept_cluster(concepts)
+    hits = analyzer._cluster_cache.cache_info().hits
+    second = analyzer.analyze_concept_cluster(list(concepts))
+    assert analyzer._cluster_cache.cache_info().hits == hits + 1
+    assert second == first == analyzer._analyze_uncached_cluster(concepts)
+
+    # Callers get independent copies, so changing one leaves later results intact
+    assert second is not first and second.distances is not first.distances
+    second.distances.append(99.0)
+    second.semantic_clarity = -1.0
+    assert analyzer.analyze_concept_cluster(concepts) == first
+
+
 def test_ice_analysis_highly_coherent(engine):
     """
     Tests ICE analysis for a coherent case where all concepts are in the same
@@ -1,13 +1,20 @@
 # tests/test_harmonizer.py
 
 import argparse
+import ast
+import json
 import os
 import tempfile
 
 import pytest
 
+import harmonizer.main as harmonizer_main
+from harmonizer import parallel
 from harmonizer.main import (
     PythonCodeHarmonizer,
+    _function_defs,
+    dump_json,
+    execute_analysis,
     load_configuration,
     validate_cli_arguments,
 )
@@ -84,6 +91,138 @@ def test_harmonizer_on_syntax_error(harmonizer, temp_python_file):
     assert report == {}
 
 
+def test_analyze_source_matches_analyze_file(harmonizer, temp_python_file):
+    """Tests that in-memory source is scored exactly like the same file on disk."""
+    from_source = harmonizer.analyze_source(TEST_CODE_CONTENT, virtual_path="history.py")
+    from_file = harmonizer.analyze_file(temp_python_file)
+    assert from_source.keys() == from_file.keys()
+    for name in from_file:
+        assert from_source[name]["score"] == from_file[name]["score"]
+    assert harmonizer.analyze_source("def invalid_syntax:") == {}
+
+
+NESTED_DEFINITIONS_CODE = """
+async def outer():
+    def inner():
+        class Local:
+            def method(self):
+                pass
+    handler = lambda: None
+try:
+    def in_try():
+        pass
+except ValueError:
+    def in_handler():
+        pass
+else:
+    def in_else():
+        pass
+finally:
+    def in_finally():
+        pass
+for item in items:
+    def in_loop():
+        pass
+else:
+    def after_loop():
+        pass
+with context:
+    if flag:
+        def in_if():
+            pass
+    else:
+        def in_orelse():
+            pass
+"""
+
+
+def test_write_report_streams_format_report(harmonizer, temp_python_file, capsys):
+    report = harmonizer.analyze_file(temp_python_file)
+    capsys.readouterr()
+    for data in (report, {}):
+        harmonizer.write_report(data, suggest_refactor=True)
+        assert capsys.readouterr().out == harmonizer.format_report(data, True) + "\n"
+
+
+def test_reports_drop_ast_nodes_unless_kept(temp_python_file):
+    lean = PythonCodeHarmonizer(quiet=True, keep_nodes=False)
+    report = lean.analyze_file(temp_python_file)
+    full = PythonCodeHarmonizer(quiet=True).analyze_file(temp_python_file)
+
+    assert set(report) == set(full)
+    for name, data in report.items():
+        assert "function_node" not in data and "execution_map" not in data
+        assert isinstance(full[name]["function_node"], ast.FunctionDef)
+        assert data["score"] == full[name]["score"]
+    assert lean.build_json_payload({"f": report}) == lean.build_json_payload({"f": full})
+    # Refactoring suggestions need the nodes, so lean harmonizers refuse them
+    with pytest.raises(ValueError, match="keep_nodes"):
+        lean.format_report(report, suggest_refactor=True)
+    with pytest.raises(ValueError, match="keep_nodes"):
+        lean.write_report(report, suggest_refactor=True)
+
+
+def test_function_defs_matches_ast_walk_order():
+    """The statement-only traversal finds the same functions, in the same order, as ast.walk."""
+    tree = ast.parse(NESTED_DEFINITIONS_CODE)
+    function_nodes = (ast.FunctionDef, ast.AsyncFunctionDef)
+    expected = [node for node in ast.walk(tree) if isinstance(node, function_nodes)]
+    assert _function_defs(tree) == expected
+    assert len(expected) == 11
+
+
+def test_parallel_analysis_matches_serial(tmp_path, monkeypatch, capsys):
+    """Reports, exit codes and printed output are unchanged when files fan out to workers."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"module_{i}.py"
+        path.write_text(TEST_CODE_CONTENT)
+        paths.append(str(path))
+
+    def run():
+        result = execute_analysis(
+            PythonCodeHarmonizer(), paths, "text", suggest_refactor=False, capture_text=True
+        )
+        return result, capsys.readouterr().out
+
+    (serial_reports, serial_code, serial_blocks), serial_out = run()
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(harmonizer_main.os, "cpu_count", lambda: 2)
+    (reports, code, blocks), out = run()
+
+    assert list(reports) == paths
+    assert code == serial_code
+    assert blocks == serial_blocks
+    assert out == serial_out
+    for path in paths:
+        assert {name: data["score"] for name, data in reports[path].items()} == {
+            name: data["score"] for name, data in serial_reports[path].items()
+        }
+
+
+def test_json_output_matches_with_and_without_orjson(
+    harmonizer, temp_python_file, monkeypatch, capsys
+):
+    payload = harmonizer.build_json_payload({"a → b.py": harmonizer.analyze_file(temp_python_file)})
+    capsys.readouterr()
+    fast = dump_json(payload)
+    monkeypatch.setattr(harmonizer_main, "orjson", None)
+    assert dump_json(payload) == fast
+    assert json.loads(fast) == payload
+
+    harmonizer_main.write_json(payload)
+    assert capsys.readouterr().out == fast.decode("utf-8") + "\n"
+
+
+def test_json_output_writes_non_finite_values_as_null(monkeypatch):
+    payload = {"score": float("nan"), "bounds": [float("inf"), -float("inf"), 0.5]}
+    expected = {"score": None, "bounds": [None, None, 0.5]}
+    if harmonizer_main.orjson is not None:
+        assert json.loads(dump_json(payload)) == expected
+    monkeypatch.setattr(harmonizer_main, "orjson", None)
+    assert json.loads(dump_json(payload)) == expected
+
+
 # --- Tests for Configuration Features ---
 
 CONFIG_CONTENT = """
@@ -148,3 +287,27 @@ def test_custom_vocabulary_with_config(temp_config_file):
     # new, more precise level of analysis.
     assert report["deprecate_old_api"]["score"] > harmonizer_with_config.disharmony_threshold
     os.unlink(filepath)
+
+
+def test_config_lookup_is_memoized_on_directory_mtime(tmp_path):
+    from harmonizer.config import ConfigLoader, _config_file_in
+
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text("[tool.harmonizer]\n")
+    for directory in (tmp_path, tmp_path / "pkg", nested):
+        os.utime(directory, (1_000_000_000, 1_000_000_000))
+
+    expected = (str(tmp_path / "pyproject.toml"), "toml")
+    assert ConfigLoader._locate_config_path(str(nested), search_parents=True) == expected
+    hits = _config_file_in.cache_info().hits
+    assert ConfigLoader._locate_config_path(str(nested), search_parents=True) == expected
+    assert _config_file_in.cache_info().hits == hits + 3
+
+    # A config file added closer to the start directory changes that level's mtime
+    (nested / "harmonizer.yml").write_text("exclude: []\n")
+    os.utime(nested, (1_000_000_001, 1_000_000_001))
+    assert ConfigLoader._locate_config_path(str(nested), search_parents=True) == (
+        str(nested / "harmonizer.yml"),
+        "yaml",
+    )
@@ -1,6 +1,24 @@
+import json
 import os
+import shutil
+import sqlite3
+import subprocess
+import threading
+from dataclasses import replace
 
-from harmonizer.legacy_mapper import LegacyCodeMapper
+import pytest
+
+from harmonizer import legacy_mapper, parallel
+from harmonizer.analysis_cache import cache_dir_for
+from harmonizer.legacy_mapper import (
+    FileAnalysis,
+    LegacyCodeMapper,
+    RefactoringOpportunity,
+    _GitBlobReader,
+    _file_digest,
+    _summarize_coordinates,
+)
+from harmonizer.ljpw_baselines import LJPWBaselines
 
 
 def test_legacy_mapper():
@@ -81,5 +99,418 @@ def execute_power_move():
         os.remove("test_imbalance.py")
 
 
+@pytest.fixture
+def user_cache(tmp_path, monkeypatch):
+    """Point the per-user analysis cache at a scratch directory"""
+    cache_home = tmp_path / "cache_home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+def test_analysis_cache_reuses_unchanged_files(tmp_path, user_cache):
+    source = "def calculate_total(items):\n    return sum(items)\n"
+    (tmp_path / "a.py").write_text(source)
+    (tmp_path / "b.py").write_text(source)
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True)
+    first = mapper._analyze_file(str(tmp_path / "a.py"))
+    assert first is not None
+    # The cache lives in the user's cache directory, never in the analyzed tree
+    assert os.path.dirname(mapper._cache.path) == cache_dir_for(str(tmp_path))
+    assert cache_dir_for(str(tmp_path)).startswith(str(user_cache))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.py", "b.py", "cache_home"]
+
+    # Identical content at another path is served from the cache without re-parsing
+    def fail(path):
+        raise AssertionError("cache miss for unchanged content")
+
+    mapper.harmonizer.analyze_file = fail
+    second = mapper._analyze_file(str(tmp_path / "b.py"))
+    assert second.path == str(tmp_path / "b.py")
+    assert second == replace(first, path=second.path)
+    mapper.close()
+
+
+def test_analysis_cache_persists_after_analyze_codebase(tmp_path, user_cache):
+    (tmp_path / "a.py").write_text("def calculate_total(items):\n    return sum(items)\n")
+    first = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True)
+    first.analyze_codebase(show_progress=False)
+    first.close()
+
+    # A fresh mapper (as in a new process) sees the results committed by the first run
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True)
+
+    def fail(path):
+        raise AssertionError("cache miss after a committed run")
+
+    mapper.harmonizer.analyze_file = fail
+    path = str(tmp_path / "a.py")
+    assert mapper._analyze_file(path) == first.file_analyses[path]
+    mapper.close()
+
+
+def test_analysis_cache_stores_json_not_pickles(tmp_path, user_cache):
+    (tmp_path / "a.py").write_text("def calculate_total(items):\n    return sum(items)\n")
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True)
+    mapper.analyze_codebase(show_progress=False)
+    mapper.close()
+
+    with sqlite3.connect(os.path.join(cache_dir_for(str(tmp_path)), "analyses.sqlite3")) as conn:
+        (payload,) = conn.execute("SELECT payload FROM analyses WHERE kind = 'file'").fetchone()
+    fields = json.loads(payload)
+    assert fields["function_count"] == 1
+    assert "path" not in fields
+
+
+def test_analysis_cache_refuses_files_of_other_users(tmp_path, user_cache, monkeypatch):
+    (tmp_path / "a.py").write_text("def calculate_total(items):\n    return sum(items)\n")
+    LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True).close()
+
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(user_cache).st_uid + 1, raising=False)
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=True)
+    assert mapper._analyze_file(str(tmp_path / "a.py")) is not None
+    assert mapper._cache is None
+    assert mapper.use_cache is False
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_parallel_analysis_shares_results_for_identical_content(tmp_path, user_cache, use_cache):
+    source = "def calculate_total(items):\n    return sum(items)\n"
+    for i in range(10):
+        (tmp_path / f"copy_{i}.py").write_text(source)
+    for i in range(9):
+        (tmp_path / f"other_{i}.py").write_text(
+            f"def delete_items_{i}(items):\n    items.clear()\n"
+        )
+    # No functions, so no analysis; the cache records that too
+    (tmp_path / "constants.py").write_text("LIMIT = 10\n")
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=use_cache)
+    executor = mapper._get_executor()
+    sent = []
+
+    class SpyExecutor:
+        def map(self, fn, paths, **kwargs):
+            sent.extend(paths)
+            return executor.map(fn, paths, **kwargs)
+
+    mapper._get_executor = SpyExecutor
+    mapper.analyze_codebase(show_progress=False)
+    mapper.close()
+
+    # One path per distinct content: a single copy, the nine others and constants.py
+    assert len(sent) == 11
+    assert sum("copy_" in path for path in sent) == 1
+    copies = [a for p, a in mapper.file_analyses.items() if "copy_" in p]
+    assert len(copies) == 10
+    assert all(os.path.basename(a.path).startswith("copy_") for a in copies)
+    assert len({a.path for a in copies}) == 10
+    assert len({a.coordinates for a in copies}) == 1
+    assert str(tmp_path / "constants.py") not in mapper.file_analyses
+
+
+def test_file_digest_is_memoized_on_stat_signature(tmp_path):
+    path = tmp_path / "a.py"
+    path.write_text("def calculate_total(items):\n    return sum(items)\n")
+    fresh_digest = _file_digest(str(path))
+
+    # Recently written files are re-read every time
+    hits = _file_digest.cache_info().hits
+    assert _file_digest(str(path)) == fresh_digest
+    assert _file_digest.cache_info().hits == hits
+
+    # Older files are served from the memo until their stat signature changes
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    assert _file_digest(str(path)) == fresh_digest
+    assert _file_digest(str(path)) == fresh_digest
+    assert _file_digest.cache_info().hits == hits + 1
+
+    path.write_text("def calculate_total(items):\n    return len(items)\n")
+    os.utime(path, (1_000_000_001, 1_000_000_001))
+    assert _file_digest(str(path)) != fresh_digest
+
+
+def test_analysis_cache_is_opt_in(tmp_path, user_cache):
+    (tmp_path / "a.py").write_text("def calculate_total(items):\n    return sum(items)\n")
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True)
+    mapper.analyze_codebase(show_progress=False)
+    assert mapper._cache is None
+    mapper.close()
+    assert not user_cache.exists()
+
+
+def test_find_python_files_respects_ignore_patterns(tmp_path):
+    for rel in ("app.py", "test_app.py", "venv/lib.py", "pkg/core.py", "pkg/legacy/old.py"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x = 1\n")
+    (tmp_path / ".harmonizerignore").write_text("# comment\ntest_*\npkg/legacy/*.py\n")
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True)
+    found = sorted(os.path.relpath(p, tmp_path) for p in mapper._find_python_files())
+    assert found == ["app.py", os.path.join("pkg", "core.py")]
+
+
+def test_ignore_patterns_are_cached_until_refreshed(tmp_path):
+    (tmp_path / "app.py").write_text("x = 1\n")
+    (tmp_path / "gen.py").write_text("x = 1\n")
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True)
+    assert len(mapper._find_python_files()) == 2
+
+    (tmp_path / ".harmonizerignore").write_text("gen.py\n")
+    assert len(mapper._find_python_files()) == 2
+
+    mapper.refresh_ignores()
+    assert [os.path.basename(p) for p in mapper._find_python_files()] == ["app.py"]
+
+
+def test_architecture_docs_extract_documented_purposes(tmp_path):
+    (tmp_path / "loader.py").write_text("def load_items(path):\n    return open(path).read()\n")
+    (tmp_path / "checks.py").write_text("def validate_items(items):\n    return all(items)\n")
+    (tmp_path / "extra.py").write_text("def run():\n    pass\n")
+    (tmp_path / "README.md").write_text(
+        "# Overview\nThe `checks`: validate and verify input. "
+        "Loader handles retrieve and query of files. Extra is mentioned too.\n"
+    )
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    mapper.analyze_codebase(show_progress=False)
+    assert mapper.analyze_architecture_docs()
+
+    purposes = {doc.component_name: doc.documented_purpose for doc in mapper.architecture_docs}
+    assert purposes == {
+        "checks": "validate and verify input",
+        "loader": "retrieve and query of files",
+        "extra": "Mentioned but purpose unclear",
+    }
+
+    for doc in mapper.architecture_docs:
+        if doc.documented_coordinates is None:
+            assert doc.alignment_score == 0.5
+            continue
+        pairs = list(zip(doc.documented_coordinates, doc.actual_coordinates))
+        distance = sum((d - a) ** 2 for d, a in pairs) ** 0.5
+        assert doc.alignment_score == pytest.approx(max(0.0, 1.0 - distance))
+        assert len(doc.discrepancies) == sum(abs(d - a) > 0.3 for d, a in pairs)
+        assert all("dimension mismatch: doc=" in text for text in doc.discrepancies)
+
+
+def test_report_cluster_centroids_match_member_means(tmp_path):
+    (tmp_path / "calc.py").write_text("def calculate_total(items):\n    return sum(items)\n")
+    (tmp_path / "run.py").write_text("def execute_build():\n    deploy()\n")
+    (tmp_path / "check.py").write_text("def validate_input(x):\n    assert x\n")
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    mapper.analyze_codebase(show_progress=False)
+    report = mapper._generate_comprehensive_report()
+
+    assert set(report["cluster_centroids"]) == set(report["clusters"])
+    for dimension, files in report["clusters"].items():
+        expected = [sum(f.coordinates[i] for f in files) / len(files) for i in range(4)]
+        assert report["cluster_centroids"][dimension] == pytest.approx(expected)
+
+
+def test_file_averages_are_exact_at_thresholds():
+    # Naive float summation gives 0.20000000000000004 here, which is > 0.2
+    rows = [(0.1, 0.3, 0.5, 0.1), (0.2, 0.3, 0.5, 0.2), (0.3, 0.3, 0.5, 0.3)]
+    flat = [value for row in rows for value in row]
+    avg_coords, avg_dis, highest, lowest, spread, dominant = _summarize_coordinates(
+        flat, [0.1, 0.2, 0.3]
+    )
+    assert avg_coords == (0.2, 0.3, 0.5, 0.2)
+    assert avg_dis == 0.2
+    assert (highest, lowest) == (0.3, 0.1)
+    assert spread == 0.5 - 0.2
+    assert dominant == "Power"
+
+
+def test_smells_use_full_precision_coordinates(tmp_path):
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    # 0.20000001 is above 0.2 in float64 but rounds onto 0.2 in float32
+    coords = (0.20000001, 0.21, 0.21, 0.1)
+    mapper.file_analyses[str(tmp_path / "mixed.py")] = FileAnalysis(
+        path=str(tmp_path / "mixed.py"),
+        coordinates=coords,
+        function_count=20,
+        avg_disharmony=0.1,
+        dominant_dimension="Justice",
+        dimension_spread=0.5,
+        semantic_density=0.5,
+    )
+    mapper._detect_architectural_smells()
+
+    smells = {smell.smell_type: smell for smell in mapper.architectural_smells}
+    assert "Mixed Concerns" in smells
+    expected = LJPWBaselines.distance_from_natural_equilibrium(*coords)
+    assert smells["Unnatural Imbalance"].impact == min(1.0, expected)
+    mapper.close()
+
+
+def test_refactoring_opportunity_suggested_actions_is_a_field():
+    explicit = RefactoringOpportunity("a.py", "Semantic Realignment", 0.5, 0.8, "d", ["Split"])
+    assert explicit.suggested_actions == ["Split"]
+    explicit.suggested_actions = ["Merge"]
+    assert explicit.suggested_actions == ["Merge"]
+
+    templated = RefactoringOpportunity(
+        "a.py",
+        "Semantic Realignment",
+        0.5,
+        0.8,
+        "d",
+        action_templates=[("Split into {} smaller modules", (3,))],
+    )
+    assert templated.suggested_actions == ["Split into 3 smaller modules"]
+
+
+def _commit_versions(repo, versions):
+    """Commit each {file name: source} mapping in turn to a fresh git repository"""
+
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    for i, files in enumerate(versions):
+        for name, source in files.items():
+            (repo / name).write_text(source)
+        git("add", ".")
+        git("commit", "-q", "-m", f"version {i}")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_history_pipeline_summarizes_each_version(tmp_path):
+    bodies = ["return sum(items)", "print(items)\n    return len(items)", "del items"]
+    _commit_versions(
+        tmp_path,
+        [
+            {name: f"def calculate_total(items):\n    {body}\n" for name in ("a.py", "b.py")}
+            for body in bodies
+        ],
+    )
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    mapper.analyze_codebase(show_progress=False)
+    commits = list(mapper._iter_git_log(10))
+    rel_paths = [mapper._rel_path(path) for path in mapper.file_analyses]
+    assert sorted(rel_paths) == ["a.py", "b.py"]
+
+    # Newest commit first
+    expected = [
+        ((0.0, 0.0, 0.0, 0.0), 0.998633877894687),
+        ((0.5, 0.0, 0.0, 0.5), 0.7582145253792985),
+        ((0.0, 0.0, 0.0, 1.0), 0.3500384757729337),
+    ]
+    summaries = mapper._summarize_history(rel_paths, commits)
+    assert set(summaries) == {(f, c) for f in range(2) for c in range(3)}
+    for (_, commit_idx), (coords, disharmony) in summaries.items():
+        assert coords == expected[commit_idx][0]
+        assert disharmony == pytest.approx(expected[commit_idx][1])
+
+    mapper.analyze_git_history(max_commits=10, show_progress=False)
+    assert sorted(drift.file_path for drift in mapper.semantic_drifts) == ["a.py", "b.py"]
+    for drift in mapper.semantic_drifts:
+        assert drift.first_commit == commits[-1][0][:8]
+        assert drift.last_commit == commits[0][0][:8]
+        assert drift.total_drift == 1.0
+        assert drift.dimension_drifts == {"L": 0.0, "J": 0.0, "P": 0.0, "W": -1.0}
+        assert drift.stability_score == 0.0
+    mapper.close()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_history_pipeline_process_pool_matches_serial(tmp_path, monkeypatch):
+    verbs = ["calculate", "validate", "execute", "connect", "delete", "query", "verify"]
+    _commit_versions(
+        tmp_path,
+        [
+            {
+                f"m{i}.py": f"def {verb}_items(items):\n    return {verb}(items, {version})\n"
+                for i, verb in enumerate(verbs)
+            }
+            for version in range(2)
+        ],
+    )
+
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    mapper.analyze_codebase(show_progress=False)
+    commits = list(mapper._iter_git_log(10))
+    rel_paths = [mapper._rel_path(path) for path in mapper.file_analyses]
+
+    # 14 distinct blobs: enough to go through the process pool
+    assert len(rel_paths) * len(commits) >= parallel.PARALLEL_MIN_FILES
+    pooled = mapper._summarize_history(rel_paths, commits)
+    assert mapper._executor is not None
+
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_FILES", 10**6)
+    serial = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    assert serial._summarize_history(rel_paths, commits) == pooled
+    assert serial._executor is None
+    assert len(pooled) == 14
+    mapper.close()
+    serial.close()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_history_pipeline_stops_reader_when_analysis_fails(tmp_path, monkeypatch):
+    # More versions than the blob queue holds, so the reader would block on it
+    _commit_versions(
+        tmp_path,
+        [{f"m{i}.py": f"X = {version}\n" for i in range(20)} for version in range(2)],
+    )
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True, use_cache=False)
+    commits = list(mapper._iter_git_log(10))
+    rel_paths = [f"m{i}.py" for i in range(20)]
+
+    def fail(content):
+        raise RuntimeError("digest failed")
+
+    monkeypatch.setattr(legacy_mapper, "content_digest", fail)
+    with pytest.raises(RuntimeError, match="digest failed"):
+        mapper._summarize_history(rel_paths, commits)
+    assert not any(t.name.endswith("(read_blobs)") for t in threading.enumerate())
+    mapper.close()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_git_blob_reader_handles_paths_with_spaces(tmp_path):
+    _commit_versions(
+        tmp_path,
+        [
+            {"a.py": "X = 0\n"},
+            {"my file.py": "X = 1\n", "my other file.py": "X = 2\n"},
+        ],
+    )
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=True)
+    new, old = [commit[0] for commit in mapper._iter_git_log(10)]
+
+    with _GitBlobReader(str(tmp_path)) as blobs:
+        # "<commit>:my file.py missing" splits into three words, like a blob header
+        assert blobs.read(old, "my file.py") is None
+        assert blobs.read(old, "my other file.py") is None
+        assert blobs.read(new, "my file.py") == b"X = 1\n"
+        assert blobs.read(new, "my other file.py") == b"X = 2\n"
+    mapper.close()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_history_pipeline_warns_when_git_fails(tmp_path, monkeypatch, capsys):
+    _commit_versions(tmp_path, [{"a.py": "X = 0\n"}])
+    mapper = LegacyCodeMapper(str(tmp_path), quiet=False)
+    commits = list(mapper._iter_git_log(10))
+
+    def fail(self, commit_hash, rel_path):
+        raise RuntimeError("git cat-file exited unexpectedly")
+
+    monkeypatch.setattr(_GitBlobReader, "read", fail)
+    assert mapper._summarize_history(["a.py"], commits) == {}
+    assert "Stopped reading git history early" in capsys.readouterr().out
+    mapper.close()
+
+
 if __name__ == "__main__":
     test_legacy_mapper()
@@ -6,14 +6,20 @@ Tests for LJPW Mathematical Baselines
 Validates the mathematical baseline calculations and interpretations.
 """
 
+import sys
+
+import numpy as np
 import pytest
 
 from harmonizer.ljpw_baselines import (
+    DynamicLJPWv4,
     LJPWBaselines,
     NumericalEquivalents,
     ReferencePoints,
     get_numerical_equivalents,
     get_reference_points,
+    njit,
+    warm_jit_cache,
 )
 
 
@@ -104,6 +110,18 @@ class TestEffectiveDimensions:
         assert eff["effective_P"] == 0.5 * (1 + 1.3 * 1.0)  # 1.15 (130%)
         assert eff["effective_W"] == 0.5 * (1 + 1.5 * 1.0)  # 1.25 (150%)
 
+    def test_effective_dimensions_batch_matches_scalar(self):
+        """Batch effective dimensions equal the scalar ones exactly"""
+        coords = np.array([[0.0, 0.5, 0.5, 0.5], [0.5, 0.5, 0.5, 0.5], [0.9, 0.1, 0.3, 0.2]])
+        batch = LJPWBaselines.effective_dimensions_batch(coords)
+
+        assert batch.shape == (3, 4)
+        for row, (L, J, P, W) in zip(batch.tolist(), coords.tolist()):
+            eff = LJPWBaselines.effective_dimensions(L, J, P, W)
+            assert row == [
+                eff[k] for k in ("effective_L", "effective_J", "effective_P", "effective_W")
+            ]
+
 
 class TestHarmonicMean:
     """Test harmonic mean (robustness metric)"""
@@ -165,6 +183,14 @@ class TestCouplingAwareSum:
         # Limited by low Love despite high others
         assert result < 1.0
 
+    def test_coupling_sum_reuses_effective_dimensions(self):
+        """A precomputed effective_dimensions dict gives the same sum"""
+        L, J, P, W = 0.6, 0.4, 0.7, 0.7
+        eff = LJPWBaselines.effective_dimensions(L, J, P, W)
+        assert LJPWBaselines.coupling_aware_sum(
+            L, J, P, W, eff=eff
+        ) == LJPWBaselines.coupling_aware_sum(L, J, P, W)
+
 
 class TestHarmonyIndex:
     """Test harmony index (balance metric)"""
@@ -182,6 +208,12 @@ class TestHarmonyIndex:
         result = LJPWBaselines.harmony_index(L, J, P, W)
         assert result < 0.5  # Far from ideal
 
+    def test_harmony_index_batch_matches_scalar(self):
+        """Batch harmony agrees with harmony_index row by row"""
+        coords = np.array([[1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 0.0], [0.6, 0.4, 0.7, 0.7]])
+        expected = [LJPWBaselines.harmony_index(*row) for row in coords.tolist()]
+        assert LJPWBaselines.harmony_index_batch(coords).tolist() == pytest.approx(expected)
+
 
 class TestCompositeScore:
     """Test composite score (overall performance)"""
@@ -205,6 +237,11 @@ class TestCompositeScore:
         result = LJPWBaselines.composite_score(L, J, P, W)
         assert result > 1.0  # High performance
 
+    def test_composite_score_is_nan_for_negative_product(self):
+        """Negative inputs give NaN, not complex numbers, with or without numba"""
+        assert np.isnan(LJPWBaselines.geometric_mean(0.5, 0.5, -0.05, 0.5))
+        assert np.isnan(LJPWBaselines.composite_score(0.5, 0.5, -0.05, 0.5))
+
 
 class TestDistances:
     """Test distance metrics"""
@@ -227,6 +264,40 @@ class TestDistances:
         distance = LJPWBaselines.distance_from_natural_equilibrium(ne[0], ne[1], ne[2], ne[3])
         assert abs(distance) < 0.0001
 
+    def test_distance_batches_match_scalar(self):
+        """Batch distances agree with the scalar distance functions"""
+        coords = np.array([[1.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 0.0], [0.6, 0.4, 0.7, 0.7]])
+        rows = coords.tolist()
+        assert LJPWBaselines.distance_from_anchor_batch(coords).tolist() == pytest.approx(
+            [LJPWBaselines.distance_from_anchor(*row) for row in rows]
+        )
+        assert LJPWBaselines.distance_from_natural_equilibrium_batch(
+            coords
+        ).tolist() == pytest.approx(
+            [LJPWBaselines.distance_from_natural_equilibrium(*row) for row in rows]
+        )
+
+
+class TestProportions:
+    """Test the scale-invariant proportion check"""
+
+    def test_natural_equilibrium_is_healthy_at_any_scale(self):
+        NE = ReferencePoints.NATURAL_EQUILIBRIUM
+        for scale in (0.1, 1.0, 50.0):
+            result = LJPWBaselines.check_proportions(*(scale * x for x in NE))
+            assert result["proportions_healthy"] is True
+
+    def test_check_proportions_batch_matches_scalar(self):
+        coords = [[0.618, 0.414, 0.718, 0.693], [0.9, 0.2, 0.3, 0.1], [6.2, 4.1, 7.2, 6.9]]
+        batch = LJPWBaselines.check_proportions_batch(coords + [[0.5, 0.0, 0.5, 0.5]])
+        for i, row in enumerate(coords):
+            scalar = LJPWBaselines.check_proportions(*row)
+            assert batch["proportions_healthy"][i] == scalar["proportions_healthy"]
+            assert batch["current_ratios"][i].tolist() == list(scalar["current_ratios"].values())
+            assert batch["deviations"][i].tolist() == list(scalar["deviations"].values())
+            assert batch["checks"][i].tolist() == list(scalar["checks"].values())
+        assert not batch["proportions_healthy"][-1]
+
 
 class TestFullDiagnostic:
     """Test full diagnostic function"""
@@ -259,6 +330,46 @@ class TestFullDiagnostic:
         assert "harmony_index" in diagnostic["metrics"]
         assert "composite_score" in diagnostic["metrics"]
 
+    def test_full_diagnostic_batch_matches_scalar(self):
+        """Batch diagnostics agree with full_diagnostic row by row"""
+        coords = np.array(
+            [
+                [0.618, 0.414, 0.718, 0.693],
+                [1.0, 1.0, 1.0, 1.0],
+                [0.0, 0.5, 0.5, 0.5],
+                [0.9, 0.1, 0.3, 0.2],
+            ]
+        )
+        batch = LJPWBaselines.full_diagnostic_batch(coords)
+
+        for row, (L, J, P, W) in enumerate(coords.tolist()):
+            scalar = LJPWBaselines.full_diagnostic(L, J, P, W)
+            for section in ("effective_dimensions", "distances", "metrics"):
+                for key, value in scalar[section].items():
+                    assert batch[section][key][row] == pytest.approx(value)
+
+    def test_core_metrics_batch_matches_scalar(self):
+        """Batch core metrics agree with core_metrics row by row"""
+        coords = np.array(
+            [[0.618, 0.414, 0.718, 0.693], [0.0, 0.5, 0.5, 0.5], [1.0, 0.2, 0.9, 0.4]]
+        )
+        batch = LJPWBaselines.core_metrics_batch(coords)
+
+        assert len(batch) == 5
+        for row, (L, J, P, W) in enumerate(coords.tolist()):
+            scalar = LJPWBaselines.core_metrics(L, J, P, W)
+            assert [metric[row] for metric in batch] == pytest.approx(list(scalar))
+
+    def test_single_metric_batches_match_scalar(self):
+        """Each metric's batch form matches the scalar method row by row"""
+        coords = np.array(
+            [[0.618, 0.414, 0.718, 0.693], [0.0, 0.5, 0.5, 0.5], [1.0, 0.2, 0.9, 0.4]]
+        )
+        for name in ("harmonic_mean", "geometric_mean", "coupling_aware_sum", "composite_score"):
+            batch = getattr(LJPWBaselines, name + "_batch")(coords)
+            scalar = getattr(LJPWBaselines, name)
+            assert batch.tolist() == pytest.approx([scalar(*row) for row in coords.tolist()])
+
 
 class TestInterpretations:
     """Test interpretation functions"""
@@ -280,6 +391,21 @@ class TestInterpretations:
         )
         assert "elite" in LJPWBaselines.interpret_composite_score(1.4).lower()
 
+    def test_interpretation_band_boundaries(self):
+        """Thresholds belong to the band above them; batch forms agree"""
+        assert "good" in LJPWBaselines.interpret_distance_from_ne(0.2).lower()
+        assert "dysfunction" in LJPWBaselines.interpret_distance_from_ne(0.8).lower()
+        assert "competent" in LJPWBaselines.interpret_composite_score(0.7).lower()
+        assert "elite" in LJPWBaselines.interpret_composite_score(1.3).lower()
+
+        values = np.array([0.0, 0.2, 0.45, 0.5, 0.7, 0.8, 0.95, 1.1, 1.3, 2.0])
+        assert LJPWBaselines.interpret_distance_from_ne_batch(values) == [
+            LJPWBaselines.interpret_distance_from_ne(v) for v in values.tolist()
+        ]
+        assert LJPWBaselines.interpret_composite_score_batch(values) == [
+            LJPWBaselines.interpret_composite_score(v) for v in values.tolist()
+        ]
+
 
 class TestLoveMultiplierEffect:
     """Test Love's amplification effect"""
@@ -314,5 +440,58 @@ class TestLoveMultiplierEffect:
         assert wisdom_boost > power_boost
 
 
+class TestDynamicSimulation:
+    """Test the v4.0 dynamic simulator"""
+
+    @pytest.mark.parametrize("complexity", [0.5, 1.0, 3.0])
+    def test_simulate_matches_array_rk4(self, complexity):
+        """The scalar simulation kernel reproduces the array-based RK4 step exactly"""
+        sim = DynamicLJPWv4(complexity_score=complexity)
+        history = sim.simulate((0.2, 0.3, 0.9, 0.2), duration=5, dt=0.05)
+
+        state = np.array((0.2, 0.3, 0.9, 0.2))
+        for i in range(1, len(history["t"])):
+            state = np.clip(sim._rk4_step(state, 0.05), 0, 1.5)
+            assert [history[k][i] for k in "LJPW"] == state.tolist()
+
+    @pytest.mark.parametrize("complexity", [1.0, 3.0])
+    def test_adaptive_simulation_tracks_fixed_step(self, complexity):
+        """The adaptive integrator returns the same grid, close to a fine fixed-step run"""
+        sim = DynamicLJPWv4(complexity_score=complexity)
+        reference = sim.simulate((0.5, 0.5, 0.5, 0.5), duration=50, dt=0.001)
+        history = sim.simulate((0.5, 0.5, 0.5, 0.5), duration=50, dt=0.05, method="rk45")
+
+        fixed = sim.simulate((0.5, 0.5, 0.5, 0.5), duration=50, dt=0.05)
+        assert history["t"].tolist() == fixed["t"].tolist()
+        for k in "LJPW":
+            assert history[k] == pytest.approx(reference[k][::50], abs=0.02)
+            assert all(0.0 <= v <= 1.5 for v in history[k])
+
+    def test_plot_simulation_reports_missing_matplotlib(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "matplotlib.pyplot", None)
+        history = DynamicLJPWv4().simulate((0.5, 0.5, 0.5, 0.5), duration=1, dt=0.1)
+        with pytest.raises(ImportError, match="requires matplotlib"):
+            DynamicLJPWv4().plot_simulation(history)
+
+    def test_simulate_rejects_unknown_method(self):
+        with pytest.raises(ValueError):
+            DynamicLJPWv4().simulate((0.5, 0.5, 0.5, 0.5), duration=1, method="euler")
+
+    def test_warm_jit_cache_reports_numba_availability(self):
+        assert warm_jit_cache() is (njit is not None)
+
+    def test_simulate_negative_power_gives_nan(self):
+        """A negative Power state propagates NaN instead of raising on a complex value"""
+        history = DynamicLJPWv4().simulate((0.5, 0.5, -0.05, 0.5), duration=1.0, dt=0.1)
+        assert history["P"][0] == -0.05
+        assert all(np.isnan(history[k][1:]).all() for k in "LJPW")
+
+    def test_simulate_history_length(self):
+        """History holds the initial state plus one entry per step"""
+        history = DynamicLJPWv4().simulate((0.5, 0.5, 0.5, 0.5), duration=1, dt=0.1)
+        assert all(len(history[k]) == 11 for k in "tLJPW")
+        assert all(isinstance(history[k], np.ndarray) for k in "tLJPW")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
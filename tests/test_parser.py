@@ -4,7 +4,7 @@ import ast
 
 import pytest
 
-from harmonizer.ast_semantic_parser import AST_Semantic_Parser
+from harmonizer.ast_semantic_parser import AST_Semantic_Parser, parse_source
 from harmonizer.divine_invitation_engine_V2 import DivineInvitationSemanticEngine
 
 
@@ -107,3 +107,30 @@ except ZeroDivisionError:
     body = ast.parse(code).body
     _, concepts = parser.get_execution_map(body)
     assert set(concepts) == expected_concepts
+
+
+# --- Test Shared Parsing ---
+
+
+def test_parse_source_reuses_trees_for_identical_source():
+    """
+    Tests that repeated parses of the same text share one tree, as when a file
+    is read for both the dependency graph and function analysis.
+    """
+    source = "import os\n\ndef get_cwd():\n    return os.getcwd()\n"
+    tree = parse_source(source)
+    assert parse_source(source) is tree
+    assert ast.dump(tree) == ast.dump(ast.parse(source))
+    assert parse_source(source + "\n") is not tree
+    with pytest.raises(SyntaxError):
+        parse_source("def broken(:\n")
+
+
+def test_word_concepts_are_memoized(parser):
+    """Memoized word lookups agree with the uncached prefix and vocabulary search."""
+    assert isinstance(parser.known_vocabulary, frozenset)
+    words = ["Get", "validated", "wisdom", "is", "issue", "xyzzy", "Printer"]
+    first = [parser._map_word_to_concept(word) for word in words]
+    assert first == [parser._lookup_concept(word) for word in words]
+    assert [parser._map_word_to_concept(word) for word in words] == first
+    assert set(words) <= set(parser._concept_cache)
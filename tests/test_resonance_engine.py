@@ -204,6 +204,19 @@ class TestResonanceCycling:
         # Peak should be higher than initial
         assert peak["harmony"] >= result["history"]["harmony"][0]
 
+    def test_resonance_uses_custom_params(self):
+        """Coefficients come from the engine's params, read when a run starts"""
+        engine = ResonanceEngine()
+        baseline = engine.resonate((0.5, 0.5, 0.5, 0.5), cycles=20, track_journey=False)
+
+        engine.params["beta_L"] = 0.5
+        faster_decay = engine.resonate((0.5, 0.5, 0.5, 0.5), cycles=20, track_journey=False)
+        assert faster_decay["final_state"]["L"] < baseline["final_state"]["L"]
+
+        custom = ResonanceEngine(params=dict(engine.params))
+        again = custom.resonate((0.5, 0.5, 0.5, 0.5), cycles=20, track_journey=False)
+        assert again["final_state"] == faster_decay["final_state"]
+
 
 class TestEarnedDepth:
     """Test Earned Depth (journey metrics)"""